@@ -6,6 +6,19 @@ This package provides OFDM simulation capabilities including:
 - OFDM symbol generation
 - AWGN channel simulation
 - BER calculation
+- Multipath fading channel with pilot-aided estimation and equalization
+- MIMO spatial multiplexing with batched ZF/MMSE detection
+- LDPC coding with a batched layered min-sum decoder
+- Timing/CFO synchronization with CP- and preamble-based estimation
+- Fixed-point receiver model with block-floating-point FFT
+- PAPR/CCDF analysis and power amplifier models
+- Multi-user OFDMA downlink with batched per-UE processing
+- Shared-memory transport for multi-process sweeps
+- File-based work queue for multi-node sweeps
+- Asyncio simulation service with request coalescing
+- Robot Framework keyword library for in-process test suites
+- Density plots (streaming constellation histograms, decimated traces)
+- Link-to-system BLER tables with EESM/MIESM effective SINR mapping
 """
 
 __version__ = "0.1.0"
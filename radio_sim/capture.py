@@ -0,0 +1,211 @@
+"""
+IQ capture export and replay.
+
+Captures are stored SigMF-style: raw little-endian complex64 samples in
+``<base>.sigmf-data`` plus a JSON metadata sidecar in ``<base>.sigmf-meta``.
+Writers append in chunks and readers memory-map the data file, so captures
+much larger than RAM can be produced and replayed through the receiver.
+"""
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from radio_sim.ofdm import OFDMSimulator
+
+SIGMF_VERSION = "1.0.0"
+SIGMF_DATATYPE = "cf32_le"
+SAMPLE_DTYPE = np.dtype("<c8")
+DATA_SUFFIX = ".sigmf-data"
+META_SUFFIX = ".sigmf-meta"
+
+
+def capture_paths(base_path: str) -> Tuple[str, str]:
+    """Return (data_path, meta_path) for a capture base path."""
+    return base_path + DATA_SUFFIX, base_path + META_SUFFIX
+
+
+class CaptureWriter:
+    """
+    Chunked writer for a complex64 IQ capture.
+
+    Samples are appended with write(); the metadata sidecar, including the
+    final sample count, is written on close(). Use as a context manager.
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        sample_rate: Optional[float] = None,
+        description: str = "",
+        **extra_metadata: Any,
+    ) -> None:
+        """
+        Open a capture for writing.
+
+        Args:
+            base_path: Capture path without SigMF suffix
+            sample_rate: Sample rate in Hz, if known
+            description: Free-text description
+            **extra_metadata: Additional ``radio_sim:`` global fields
+        """
+        self.base_path = base_path
+        self.data_path, self.meta_path = capture_paths(base_path)
+        self.n_samples = 0
+
+        self.metadata: Dict[str, Any] = {
+            "global": {
+                "core:datatype": SIGMF_DATATYPE,
+                "core:version": SIGMF_VERSION,
+                "core:description": description,
+            },
+            "captures": [{"core:sample_start": 0}],
+            "annotations": [],
+        }
+        if sample_rate is not None:
+            self.metadata["global"]["core:sample_rate"] = sample_rate
+        for key, value in extra_metadata.items():
+            self.metadata["global"][f"radio_sim:{key}"] = value
+
+        self._file = open(self.data_path, "wb")
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append a chunk of complex samples."""
+        chunk = np.ascontiguousarray(np.ravel(samples), dtype=SAMPLE_DTYPE)
+        self._file.write(chunk.tobytes())
+        self.n_samples += chunk.size
+
+    def close(self) -> None:
+        """Flush data and write the metadata sidecar."""
+        if self._file.closed:
+            return
+        self._file.close()
+        self.metadata["global"]["radio_sim:n_samples"] = self.n_samples
+        with open(self.meta_path, "w") as f:
+            json.dump(self.metadata, f, indent=2)
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_capture(base_path: str, samples: np.ndarray, **metadata: Any) -> str:
+    """
+    Write an in-memory IQ stream as a capture.
+
+    Args:
+        base_path: Capture path without SigMF suffix
+        samples: Complex samples
+        **metadata: Forwarded to CaptureWriter
+
+    Returns:
+        Path to the data file
+    """
+    with CaptureWriter(base_path, **metadata) as writer:
+        writer.write(samples)
+    return writer.data_path
+
+
+def open_capture(base_path: str) -> Tuple[np.ndarray, dict]:
+    """
+    Memory-map a capture without loading it into RAM.
+
+    Args:
+        base_path: Capture path without SigMF suffix
+
+    Returns:
+        Tuple of (read-only complex64 memmap, or an empty array for an
+        empty capture, and the metadata dict)
+
+    Raises:
+        ValueError: If the capture datatype is not complex64
+    """
+    data_path, meta_path = capture_paths(base_path)
+    with open(meta_path) as f:
+        metadata = json.load(f)
+
+    datatype = metadata["global"].get("core:datatype")
+    if datatype != SIGMF_DATATYPE:
+        raise ValueError(f"Unsupported capture datatype: {datatype}")
+
+    if os.path.getsize(data_path) == 0:
+        return np.zeros(0, dtype=SAMPLE_DTYPE), metadata
+    return np.memmap(data_path, dtype=SAMPLE_DTYPE, mode="r"), metadata
+
+
+def replay_capture(
+    simulator: "OFDMSimulator", base_path: str, chunk_symbols: int = 4096
+) -> Iterator[np.ndarray]:
+    """
+    Replay a capture through the simulator's receiver chunk by chunk.
+
+    Args:
+        simulator: OFDMSimulator matching the capture configuration
+        base_path: Capture path without SigMF suffix
+        chunk_symbols: OFDM symbols demodulated per chunk
+
+    Yields:
+        Hard-decision bits for each chunk; the final chunk is trimmed to the
+        recorded bit count when the capture stores one
+
+    Raises:
+        ValueError: If the capture does not match the simulator configuration
+    """
+    samples, metadata = open_capture(base_path)
+    meta = metadata["global"]
+
+    n_subcarriers = meta.get("radio_sim:n_subcarriers", simulator.n_subcarriers)
+    modulation = meta.get("radio_sim:modulation", simulator.modulation)
+    if n_subcarriers != simulator.n_subcarriers or modulation != simulator.modulation:
+        raise ValueError(
+            f"Capture recorded with {modulation}/{n_subcarriers} subcarriers, "
+            f"simulator is {simulator.modulation}/{simulator.n_subcarriers}"
+        )
+    if len(samples) % n_subcarriers:
+        raise ValueError("Capture length is not a whole number of OFDM symbols")
+
+    bits_remaining = meta.get("radio_sim:n_bits")
+    chunk_samples = chunk_symbols * n_subcarriers
+    for start in range(0, len(samples), chunk_samples):
+        # Only this slice of the memmap is paged in
+        stop = start + chunk_samples
+        chunk = np.asarray(samples[start:stop]).reshape(-1, n_subcarriers)
+        bits = simulator.demodulate_symbols(simulator.demodulate_ofdm(chunk))
+        if bits_remaining is not None:
+            bits = bits[:bits_remaining]
+            bits_remaining -= len(bits)
+        yield bits
+
+
+def replay_ber(
+    simulator: "OFDMSimulator",
+    reference_path: str,
+    received_path: str,
+    chunk_symbols: int = 4096,
+) -> float:
+    """
+    Compute BER between two captures by replaying both in lockstep.
+
+    Args:
+        simulator: OFDMSimulator matching the capture configuration
+        reference_path: Base path of the transmitted (reference) capture
+        received_path: Base path of the received capture
+        chunk_symbols: OFDM symbols demodulated per chunk
+
+    Returns:
+        BER value
+    """
+    errors = 0
+    n_bits = 0
+    for tx_bits, rx_bits in zip(
+        replay_capture(simulator, reference_path, chunk_symbols),
+        replay_capture(simulator, received_path, chunk_symbols),
+    ):
+        errors += int(np.count_nonzero(tx_bits != rx_bits))
+        n_bits += len(tx_bits)
+    return errors / n_bits if n_bits else 0.0
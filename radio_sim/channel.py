@@ -0,0 +1,152 @@
+"""
+Frequency-selective fading channel models.
+
+Implements a tapped-delay-line Rayleigh channel with an exponential power
+delay profile. Tap gains can evolve across OFDM symbols with a first-order
+autoregressive model, and the channel is applied per resource element in the
+frequency domain (equivalent to a cyclic prefix longer than the delay spread).
+"""
+
+import numpy as np
+from typing import Optional, Tuple, Union
+
+
+def exponential_pdp(delay_spread: float, n_taps: Optional[int] = None) -> np.ndarray:
+    """
+    Exponential power delay profile normalized to unit total power.
+
+    Args:
+        delay_spread: RMS delay spread in samples (0 gives a flat channel)
+        n_taps: Number of taps (default: enough to cover 5 delay spreads)
+
+    Returns:
+        Tap powers
+    """
+    if delay_spread <= 0:
+        return np.ones(1)
+    if n_taps is None:
+        n_taps = int(np.ceil(5 * delay_spread)) + 1
+    powers = np.exp(-np.arange(n_taps) / delay_spread)
+    return powers / np.sum(powers)
+
+
+def frequency_correlation(delay_spread: float, n_subcarriers: int) -> np.ndarray:
+    """
+    Frequency correlation matrix of the channel across subcarriers.
+
+    Args:
+        delay_spread: RMS delay spread in samples
+        n_subcarriers: Number of subcarriers (FFT size)
+
+    Returns:
+        Hermitian matrix R[k1, k2] = E{H[k1] H*[k2]}
+    """
+    pdp = exponential_pdp(delay_spread)
+    # Correlation only depends on the subcarrier lag, so evaluate each lag once
+    lags = np.arange(-(n_subcarriers - 1), n_subcarriers)
+    phases = np.exp(-2j * np.pi * np.outer(lags, np.arange(len(pdp))) / n_subcarriers)
+    correlation = phases @ pdp
+
+    index = (
+        np.arange(n_subcarriers)[:, np.newaxis]
+        - np.arange(n_subcarriers)[np.newaxis, :]
+    )
+    return correlation[index + n_subcarriers - 1]
+
+
+class MultipathChannel:
+    """
+    Rayleigh multipath channel with an exponential power delay profile.
+
+    Tap gains are complex Gaussian; with ``time_correlation`` below one they
+    follow an AR(1) process from one OFDM symbol to the next, otherwise the
+    channel is block fading over the requested symbols.
+    """
+
+    def __init__(
+        self,
+        n_subcarriers: int = 64,
+        delay_spread: float = 2.0,
+        time_correlation: float = 1.0,
+        seed: Optional[Union[int, np.random.Generator]] = None,
+    ):
+        """
+        Initialize channel model.
+
+        Args:
+            n_subcarriers: Number of OFDM subcarriers (FFT size)
+            delay_spread: RMS delay spread in samples
+            time_correlation: Tap correlation between consecutive OFDM symbols
+            seed: Random seed for reproducible realizations, or a Generator
+                to share
+        """
+        if not 0 <= time_correlation <= 1:
+            raise ValueError(
+                f"time_correlation must be in [0, 1], got {time_correlation}"
+            )
+        self.n_subcarriers = n_subcarriers
+        self.delay_spread = delay_spread
+        self.time_correlation = time_correlation
+        self.pdp = exponential_pdp(delay_spread)
+        if len(self.pdp) > n_subcarriers:
+            raise ValueError("Delay spread too large for the number of subcarriers")
+        self.rng = np.random.default_rng(seed)
+
+    def _complex_gaussian(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """Draw unit-power circularly symmetric Gaussian samples."""
+        return (
+            self.rng.normal(size=shape) + 1j * self.rng.normal(size=shape)
+        ) / np.sqrt(2)
+
+    def tap_gains(
+        self, n_symbols: int, batch_shape: Tuple[int, ...] = ()
+    ) -> np.ndarray:
+        """
+        Draw tap gains for consecutive OFDM symbols.
+
+        Args:
+            n_symbols: Number of OFDM symbols
+            batch_shape: Leading shape for independent realizations
+                (e.g. slots, or receive/transmit antenna pairs)
+
+        Returns:
+            Tap gains with shape batch_shape + (n_symbols, n_taps)
+        """
+        shape = tuple(batch_shape) + (n_symbols, len(self.pdp))
+        innovations = self._complex_gaussian(shape)
+
+        rho = self.time_correlation
+        if rho == 1:
+            gains = np.broadcast_to(innovations[..., :1, :], shape).copy()
+        else:
+            gains = np.empty(shape, dtype=np.complex128)
+            gains[..., 0, :] = innovations[..., 0, :]
+            scale = np.sqrt(1 - rho**2)
+            for t in range(1, n_symbols):
+                gains[..., t, :] = (
+                    rho * gains[..., t - 1, :] + scale * innovations[..., t, :]
+                )
+
+        return gains * np.sqrt(self.pdp)
+
+    def frequency_response(
+        self, n_symbols: int, batch_shape: Tuple[int, ...] = ()
+    ) -> np.ndarray:
+        """
+        Draw a channel realization over a (symbols, subcarriers) grid.
+
+        Args:
+            n_symbols: Number of OFDM symbols
+            batch_shape: Leading shape for independent realizations
+
+        Returns:
+            Channel coefficients with shape batch_shape + (n_symbols, n_subcarriers)
+        """
+        return np.fft.fft(
+            self.tap_gains(n_symbols, batch_shape), n=self.n_subcarriers, axis=-1
+        )
+
+    @staticmethod
+    def apply(grid: np.ndarray, response: np.ndarray) -> np.ndarray:
+        """Apply a frequency response to a resource grid element-wise."""
+        return grid * response
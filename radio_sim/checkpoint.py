@@ -0,0 +1,104 @@
+"""
+Checkpointing for long-running sweeps.
+
+A checkpoint records the sweep configuration, per-SNR results completed so
+far, the error/bit counters of the SNR point in progress and the simulator's
+random state (generator state and PN sequence position). Restoring it and
+continuing with the same chunk size reproduces an uninterrupted run exactly.
+
+Checkpoints are JSON files written atomically (temporary file + rename), so a
+crash while saving never leaves a truncated checkpoint behind.
+"""
+
+import json
+import os
+from typing import TYPE_CHECKING, List, Optional, TypedDict
+
+if TYPE_CHECKING:
+    from radio_sim.ofdm import OFDMSimulator
+
+CHECKPOINT_VERSION = 1
+
+
+class SweepProgress(TypedDict):
+    """Progress of an SNR sweep: completed results and the point in progress."""
+
+    snr_index: int
+    bits_done: int
+    errors: int
+    measured_bits: int
+    ber_values: List[float]
+
+
+def simulator_state(simulator: "OFDMSimulator") -> dict:
+    """Capture the random state of an OFDMSimulator."""
+    return {
+        "rng": simulator.rng.bit_generator.state,
+        "prbs_position": simulator.prbs.position
+        if simulator.prbs is not None
+        else None,
+    }
+
+
+def restore_simulator_state(simulator: "OFDMSimulator", state: dict) -> None:
+    """Restore random state captured by simulator_state()."""
+    simulator.rng.bit_generator.state = state["rng"]
+    if simulator.prbs is not None:
+        simulator.prbs.position = state["prbs_position"]
+
+
+def save_checkpoint(
+    path: str, config: dict, progress: SweepProgress, simulator: "OFDMSimulator"
+) -> None:
+    """
+    Atomically write a sweep checkpoint.
+
+    Args:
+        path: Checkpoint file path
+        config: Sweep configuration (validated on resume)
+        progress: Sweep progress counters and completed results
+        simulator: Simulator whose random state is saved
+    """
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "config": config,
+        "progress": progress,
+        "simulator": simulator_state(simulator),
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, config: dict) -> Optional[dict]:
+    """
+    Load a checkpoint for the given sweep configuration.
+
+    Args:
+        path: Checkpoint file path
+        config: Configuration of the sweep being resumed
+
+    Returns:
+        Checkpoint dict, or None if no checkpoint exists yet
+
+    Raises:
+        ValueError: If the checkpoint belongs to a different configuration
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        checkpoint = json.load(f)
+
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {checkpoint.get('version')}")
+    if checkpoint["config"] != config:
+        mismatched = sorted(
+            key
+            for key in set(config) | set(checkpoint["config"])
+            if config.get(key) != checkpoint["config"].get(key)
+        )
+        raise ValueError(f"Checkpoint configuration differs: {', '.join(mismatched)}")
+    return checkpoint
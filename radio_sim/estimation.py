@@ -0,0 +1,306 @@
+"""
+Pilot-aided channel estimation and equalization.
+
+Implements the receiver stage between OFDM demodulation and demapping:
+1. Pilot insertion on a (symbols, subcarriers) resource grid
+2. Least-squares (LS) estimation at pilot positions
+3. LMMSE smoothing/interpolation across subcarriers
+4. Linear interpolation across OFDM symbols
+5. Zero-forcing / MMSE one-tap equalization
+
+All stages operate on whole grids (with optional leading batch dimensions).
+Interpolation and LMMSE filter matrices depend only on the pilot pattern and
+channel statistics, so they are computed once and cached.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from radio_sim.channel import frequency_correlation
+
+
+@dataclass(frozen=True)
+class PilotPattern:
+    """
+    Rectangular pilot lattice on the resource grid.
+
+    Pilots occupy every ``symbol_spacing``-th OFDM symbol and, within those
+    symbols, every ``subcarrier_spacing``-th subcarrier. Pilot values are a
+    fixed QPSK sequence derived from ``sequence_seed``.
+    """
+
+    symbol_spacing: int = 1
+    subcarrier_spacing: int = 4
+    symbol_offset: int = 0
+    subcarrier_offset: int = 0
+    sequence_seed: int = 0
+
+    @classmethod
+    def comb(cls, spacing: int = 4) -> "PilotPattern":
+        """Comb-type pattern: pilots on every symbol, every ``spacing`` subcarriers."""
+        return cls(symbol_spacing=1, subcarrier_spacing=spacing)
+
+    @classmethod
+    def block(cls, spacing: int = 7) -> "PilotPattern":
+        """Block-type pattern: full pilot symbols every ``spacing`` symbols."""
+        return cls(symbol_spacing=spacing, subcarrier_spacing=1)
+
+    @classmethod
+    def dmrs(cls) -> "PilotPattern":
+        """DMRS-like pattern: two pilot symbols per slot, every other subcarrier."""
+        return cls(symbol_spacing=7, subcarrier_spacing=2, symbol_offset=2)
+
+    def symbol_indices(self, n_symbols: int) -> np.ndarray:
+        """OFDM symbols carrying pilots."""
+        return np.arange(self.symbol_offset, n_symbols, self.symbol_spacing)
+
+    def subcarrier_indices(self, n_subcarriers: int) -> np.ndarray:
+        """Subcarriers carrying pilots within a pilot symbol."""
+        return np.arange(self.subcarrier_offset, n_subcarriers, self.subcarrier_spacing)
+
+    def mask(self, n_symbols: int, n_subcarriers: int) -> np.ndarray:
+        """Boolean grid that is True at pilot resource elements."""
+        mask = np.zeros((n_symbols, n_subcarriers), dtype=bool)
+        mask[
+            np.ix_(
+                self.symbol_indices(n_symbols), self.subcarrier_indices(n_subcarriers)
+            )
+        ] = True
+        return mask
+
+    def n_data(self, n_symbols: int, n_subcarriers: int) -> int:
+        """Number of data resource elements in a grid."""
+        n_pilots = len(self.symbol_indices(n_symbols)) * len(
+            self.subcarrier_indices(n_subcarriers)
+        )
+        return n_symbols * n_subcarriers - n_pilots
+
+    def pilot_values(self, n_symbols: int, n_subcarriers: int) -> np.ndarray:
+        """Unit-power QPSK pilots with shape (n_pilot_symbols, n_pilot_subcarriers)."""
+        return _pilot_values(self, n_symbols, n_subcarriers)
+
+
+@lru_cache(maxsize=64)
+def _pilot_values(
+    pattern: PilotPattern, n_symbols: int, n_subcarriers: int
+) -> np.ndarray:
+    """Cached, read-only pilot sequence for a pattern and grid size."""
+    shape = (
+        len(pattern.symbol_indices(n_symbols)),
+        len(pattern.subcarrier_indices(n_subcarriers)),
+    )
+    rng = np.random.default_rng(pattern.sequence_seed)
+    bits = rng.integers(0, 2, size=shape + (2,))
+    values = ((1 - 2 * bits[..., 0]) + 1j * (1 - 2 * bits[..., 1])) / np.sqrt(2)
+    values.flags.writeable = False
+    return values
+
+
+@lru_cache(maxsize=64)
+def _data_indices(
+    pattern: PilotPattern, n_symbols: int, n_subcarriers: int
+) -> np.ndarray:
+    """Cached flat indices of the data resource elements in a grid."""
+    indices = np.flatnonzero(~pattern.mask(n_symbols, n_subcarriers))
+    indices.flags.writeable = False
+    return indices
+
+
+@lru_cache(maxsize=128)
+def interpolation_matrix(positions: tuple, length: int) -> np.ndarray:
+    """
+    Linear interpolation as a matrix.
+
+    Args:
+        positions: Sorted sample positions of the known values
+        length: Number of output points (0 .. length-1)
+
+    Returns:
+        Matrix W of shape (length, len(positions)) with values at all points
+        given by W @ known_values; points outside the positions are held
+        constant at the nearest known value
+    """
+    known = np.asarray(positions)
+    identity = np.eye(len(known))
+    matrix = np.stack(
+        [np.interp(np.arange(length), known, column) for column in identity], axis=1
+    )
+    matrix.flags.writeable = False
+    return matrix
+
+
+@lru_cache(maxsize=128)
+def lmmse_filter(
+    pattern: PilotPattern, n_subcarriers: int, snr_db: float, delay_spread: float
+) -> np.ndarray:
+    """
+    Frequency-domain LMMSE filter mapping pilot LS estimates to all subcarriers.
+
+    Cached per (pilot pattern, SNR, delay spread) so the matrix inversion is
+    paid once per configuration rather than once per slot.
+
+    Args:
+        pattern: Pilot pattern
+        n_subcarriers: Number of subcarriers
+        snr_db: SNR in dB per resource element
+        delay_spread: RMS delay spread in samples assumed by the filter
+
+    Returns:
+        Matrix W of shape (n_subcarriers, n_pilot_subcarriers)
+    """
+    pilots = pattern.subcarrier_indices(n_subcarriers)
+    correlation = frequency_correlation(delay_spread, n_subcarriers)
+    r_hp = correlation[:, pilots]
+    r_pp = correlation[np.ix_(pilots, pilots)]
+
+    # W = R_hp (R_pp + sigma^2 I)^-1, computed as a solve for stability
+    noise_var = 10 ** (-snr_db / 10)
+    regularized = r_pp + noise_var * np.eye(len(pilots))
+    matrix = np.linalg.solve(regularized.T, r_hp.T).T
+    matrix.flags.writeable = False
+    return matrix
+
+
+def insert_pilots(
+    data_symbols: np.ndarray, pattern: PilotPattern, n_symbols: int, n_subcarriers: int
+) -> np.ndarray:
+    """
+    Build resource grids from data symbols and pilots.
+
+    Args:
+        data_symbols: Data symbols with shape (..., n_data)
+        pattern: Pilot pattern
+        n_symbols: OFDM symbols per grid
+        n_subcarriers: Subcarriers per OFDM symbol
+
+    Returns:
+        Grids with shape (..., n_symbols, n_subcarriers)
+    """
+    batch_shape = data_symbols.shape[:-1]
+    grid = np.zeros(batch_shape + (n_symbols, n_subcarriers), dtype=np.complex128)
+    grid[
+        ...,
+        pattern.symbol_indices(n_symbols)[:, np.newaxis],
+        pattern.subcarrier_indices(n_subcarriers),
+    ] = pattern.pilot_values(n_symbols, n_subcarriers)
+
+    flat = grid.reshape(batch_shape + (-1,))
+    flat[..., _data_indices(pattern, n_symbols, n_subcarriers)] = data_symbols
+    return grid
+
+
+def extract_data(grid: np.ndarray, pattern: PilotPattern) -> np.ndarray:
+    """
+    Extract data resource elements from grids.
+
+    Args:
+        grid: Grids with shape (..., n_symbols, n_subcarriers)
+        pattern: Pilot pattern
+
+    Returns:
+        Data symbols with shape (..., n_data)
+    """
+    n_symbols, n_subcarriers = grid.shape[-2:]
+    flat = grid.reshape(grid.shape[:-2] + (-1,))
+    return flat[..., _data_indices(pattern, n_symbols, n_subcarriers)]
+
+
+def ls_estimate(rx_grid: np.ndarray, pattern: PilotPattern) -> np.ndarray:
+    """
+    Least-squares channel estimates at pilot positions.
+
+    Args:
+        rx_grid: Received grids with shape (..., n_symbols, n_subcarriers)
+        pattern: Pilot pattern
+
+    Returns:
+        Estimates with shape (..., n_pilot_symbols, n_pilot_subcarriers)
+    """
+    n_symbols, n_subcarriers = rx_grid.shape[-2:]
+    rx_pilots = rx_grid[
+        ...,
+        pattern.symbol_indices(n_symbols)[:, np.newaxis],
+        pattern.subcarrier_indices(n_subcarriers),
+    ]
+    return rx_pilots / pattern.pilot_values(n_symbols, n_subcarriers)
+
+
+def estimate_channel(
+    rx_grid: np.ndarray,
+    pattern: PilotPattern,
+    method: str = "ls",
+    snr_db: Optional[float] = None,
+    delay_spread: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Estimate the channel over whole resource grids.
+
+    Args:
+        rx_grid: Received grids with shape (..., n_symbols, n_subcarriers)
+        pattern: Pilot pattern
+        method: "ls" (linear interpolation) or "lmmse"
+        snr_db: SNR in dB (required for LMMSE)
+        delay_spread: RMS delay spread in samples (required for LMMSE)
+
+    Returns:
+        Channel estimates with the same shape as ``rx_grid``
+    """
+    n_symbols, n_subcarriers = rx_grid.shape[-2:]
+    h_pilots = ls_estimate(rx_grid, pattern)
+
+    if method == "ls":
+        freq_matrix = interpolation_matrix(
+            tuple(pattern.subcarrier_indices(n_subcarriers)), n_subcarriers
+        )
+    elif method == "lmmse":
+        if snr_db is None or delay_spread is None:
+            raise ValueError("LMMSE estimation requires snr_db and delay_spread")
+        freq_matrix = lmmse_filter(
+            pattern, n_subcarriers, float(snr_db), float(delay_spread)
+        )
+    else:
+        raise ValueError(f"Unsupported estimation method: {method}")
+
+    time_matrix = interpolation_matrix(
+        tuple(pattern.symbol_indices(n_symbols)), n_symbols
+    )
+
+    # Filter across subcarriers, then interpolate across symbols
+    return time_matrix @ (h_pilots @ freq_matrix.T)
+
+
+def equalize(
+    rx_grid: np.ndarray,
+    h_est: np.ndarray,
+    method: str = "zf",
+    noise_var: float = 0.0,
+    unbiased: bool = True,
+) -> np.ndarray:
+    """
+    One-tap frequency-domain equalization.
+
+    Args:
+        rx_grid: Received grids
+        h_est: Channel estimates with the same shape
+        method: "zf" (zero-forcing) or "mmse"
+        noise_var: Noise variance per resource element (used by MMSE)
+        unbiased: Rescale the MMSE output so its gain is one, which is
+            required for hard decisions on amplitude-modulated constellations;
+            with one tap this equals ZF. Pass False for the biased (shrunk)
+            estimate, e.g. for soft demapping
+
+    Returns:
+        Equalized grids
+    """
+    if method == "zf":
+        return rx_grid / h_est
+    if method == "mmse":
+        power = np.abs(h_est) ** 2
+        equalized = np.conj(h_est) * rx_grid / (power + noise_var)
+        if unbiased:
+            # Effective gain is |h|^2 / (|h|^2 + noise_var)
+            equalized = equalized * (power + noise_var) / power
+        return equalized
+    raise ValueError(f"Unsupported equalization method: {method}")
@@ -0,0 +1,633 @@
+"""
+Link-to-system (L2S) abstraction.
+
+System-level studies cannot run the coded link simulation for every link in
+every TTI. Instead, per-subcarrier SINRs of a link are compressed into one
+effective SINR and looked up in an AWGN BLER table:
+- EESM: gamma_eff = -beta * ln(mean(exp(-gamma_k / beta)))
+- MIESM: gamma_eff = beta * I^-1(mean(I(gamma_k / beta))), with I the
+  BICM mutual information per bit of the modulation
+
+Tables hold one SINR -> BLER curve per (modulation, code rate) on a shared
+uniform SNR grid, so the SNR axis is three numbers and each curve a row of a
+float32 array. They are generated from batched LDPC link sweeps and stored as
+``<base>.npy`` plus a JSON sidecar ``<base>.json`` (grid, entries, calibrated
+beta values and the SHA-256 of the array file); load_l2s_table() checks the
+hash and memory-maps the array, so many processes share one copy in the page
+cache.
+
+Effective SINR mapping and BLER lookup are vectorized over arbitrary leading
+link dimensions, so thousands of links are evaluated in one call.
+"""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.special import logsumexp
+
+from radio_sim.channel import MultipathChannel
+from radio_sim.ldpc import LDPCCode, default_code
+from radio_sim.ofdm import OFDMSimulator
+
+MODULATIONS = ("QPSK", "16QAM")
+METHODS = ("eesm", "miesm")
+TABLE_SUFFIX = ".npy"
+META_SUFFIX = ".json"
+TABLE_VERSION = 2
+BLER_FLOOR = 1e-5
+
+# Grid and Gauss-Hermite order of the tabulated mutual information curves
+_MI_SNR_DB = np.arange(-20.0, 30.25, 0.25)
+_MI_QUADRATURE_ORDER = 20
+
+
+def table_paths(base_path: str) -> Tuple[str, str]:
+    """Return (table_path, meta_path) for a table base path."""
+    return base_path + TABLE_SUFFIX, base_path + META_SUFFIX
+
+
+def _file_sha256(path: str) -> str:
+    """Hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _mutual_information_curve(modulation: str) -> np.ndarray:
+    """
+    BICM mutual information per bit on the _MI_SNR_DB grid.
+
+    The expectation over complex Gaussian noise uses a 2-D Gauss-Hermite
+    rule, so the curve is deterministic and smooth; it is forced
+    non-decreasing so it can be inverted.
+    """
+    constellation = OFDMSimulator(modulation=modulation).constellation
+    bits_per_symbol = int(np.log2(len(constellation)))
+    shifts = np.arange(bits_per_symbol - 1, -1, -1)
+    labels = (np.arange(len(constellation))[:, np.newaxis] >> shifts) & 1
+
+    # Nodes and weights for E[f(z)], z complex Gaussian with unit variance
+    nodes, weights = np.polynomial.hermite.hermgauss(_MI_QUADRATURE_ORDER)
+    noise = (nodes[:, np.newaxis] + 1j * nodes[np.newaxis, :]).ravel()
+    noise_weights = np.outer(weights, weights).ravel() / np.pi
+
+    mi = np.empty(len(_MI_SNR_DB))
+    for index, snr_db in enumerate(_MI_SNR_DB):
+        n0 = 10 ** (-snr_db / 10)
+        # metric[s, z, c]: log-likelihood of point c given point s was sent
+        y = constellation[:, np.newaxis] + np.sqrt(n0) * noise
+        metric = -np.abs(y[:, :, np.newaxis] - constellation) ** 2 / n0
+        total = logsumexp(metric, axis=-1)
+        loss = 0.0
+        for b in range(bits_per_symbol):
+            ones = labels[:, b] == 1
+            matching = np.where(
+                ones[:, np.newaxis],
+                logsumexp(metric[..., ones], axis=-1),
+                logsumexp(metric[..., ~ones], axis=-1),
+            )
+            loss += np.mean((total - matching) @ noise_weights)
+        mi[index] = 1 - loss / (bits_per_symbol * np.log(2))
+    mi = np.maximum.accumulate(np.clip(mi, 0.0, 1.0))
+    mi.flags.writeable = False
+    return mi
+
+
+def mutual_information(sinr_db: np.ndarray, modulation: str) -> np.ndarray:
+    """BICM mutual information per bit (0 to 1) at the given SINR in dB."""
+    return np.interp(sinr_db, _MI_SNR_DB, _mutual_information_curve(modulation))
+
+
+def inverse_mutual_information(mi: np.ndarray, modulation: str) -> np.ndarray:
+    """SINR in dB at which the modulation reaches a mutual information per bit."""
+    curve = _mutual_information_curve(modulation)
+    # Invert only the strictly increasing part of the curve
+    rising = np.concatenate([[True], np.diff(curve) > 0])
+    return np.interp(mi, curve[rising], _MI_SNR_DB[rising])
+
+
+def _expand_beta(beta: Union[float, np.ndarray]) -> np.ndarray:
+    """Beta broadcastable against (..., n_subcarriers) SINR arrays."""
+    return np.asarray(beta, dtype=np.float64)[..., np.newaxis]
+
+
+def eesm(sinr_db: np.ndarray, beta: Union[float, np.ndarray]) -> np.ndarray:
+    """
+    Exponential effective SINR mapping.
+
+    Args:
+        sinr_db: Per-subcarrier SINR in dB with shape (..., n_subcarriers)
+        beta: Calibration factor, scalar or broadcastable to sinr_db.shape[:-1]
+
+    Returns:
+        Effective SINR in dB with shape sinr_db.shape[:-1] (broadcast with beta)
+    """
+    sinr_db = np.asarray(sinr_db, dtype=np.float64)
+    beta = _expand_beta(beta)
+    sinr = 10 ** (sinr_db / 10)
+    # -beta * ln(mean(exp(-sinr / beta))), evaluated without underflow
+    effective = -beta[..., 0] * (
+        logsumexp(-sinr / beta, axis=-1) - np.log(sinr_db.shape[-1])
+    )
+    return 10 * np.log10(np.maximum(effective, np.finfo(float).tiny))
+
+
+def miesm(
+    sinr_db: np.ndarray, beta: Union[float, np.ndarray], modulation: str
+) -> np.ndarray:
+    """
+    Mutual-information effective SINR mapping.
+
+    Args:
+        sinr_db: Per-subcarrier SINR in dB with shape (..., n_subcarriers)
+        beta: Calibration factor, scalar or broadcastable to sinr_db.shape[:-1]
+        modulation: Modulation whose mutual information curve is used
+
+    Returns:
+        Effective SINR in dB with shape sinr_db.shape[:-1] (broadcast with beta)
+    """
+    beta_db = 10 * np.log10(_expand_beta(beta))
+    mean_mi = np.mean(
+        mutual_information(np.asarray(sinr_db) - beta_db, modulation), axis=-1
+    )
+    return inverse_mutual_information(mean_mi, modulation) + beta_db[..., 0]
+
+
+def effective_sinr(
+    sinr_db: np.ndarray,
+    beta: Union[float, np.ndarray],
+    modulation: str,
+    method: str = "eesm",
+) -> np.ndarray:
+    """Effective SINR in dB with the EESM or MIESM mapping."""
+    if method == "eesm":
+        return eesm(sinr_db, beta)
+    if method == "miesm":
+        return miesm(sinr_db, beta, modulation)
+    raise ValueError(f"Unknown effective SINR method: {method}")
+
+
+def _block_errors(
+    modem: OFDMSimulator,
+    code: LDPCCode,
+    gains: np.ndarray,
+    snr_db: np.ndarray,
+    max_iterations: int,
+) -> np.ndarray:
+    """
+    Coded block errors of a batch of codewords over per-symbol channel gains.
+
+    Args:
+        modem: Simulator providing bits, modulation and soft demapping
+        code: LDPC code (n must be a multiple of the bits per symbol)
+        gains: Complex channel gain per modulated symbol, shape
+            (batch, n / bits_per_symbol)
+        snr_db: Average SNR per codeword in dB, shape (batch,)
+        max_iterations: Maximum decoder iterations
+
+    Returns:
+        Boolean block error flag per codeword
+    """
+    batch, n_symbols = gains.shape
+    tx_bits = modem.generate_bits(batch * code.k).reshape(batch, code.k)
+    tx_symbols = modem.modulate(code.encode(tx_bits).ravel()).reshape(batch, n_symbols)
+
+    # Perfect-CSI zero forcing: noise variance per symbol is n0 / |h|^2
+    n0 = 10 ** (-np.asarray(snr_db, dtype=np.float64) / 10)[:, np.newaxis]
+    noise = (
+        modem.rng.normal(size=gains.shape) + 1j * modem.rng.normal(size=gains.shape)
+    ) * np.sqrt(n0 / 2)
+    equalized = tx_symbols + noise / gains
+    weights = np.repeat(np.abs(gains) ** 2 / n0, modem.bits_per_symbol, axis=-1)
+    llr = modem.demodulate_llr(equalized, 1.0).reshape(batch, code.n) * weights
+
+    rx_bits = code.extract_message(code.decode(llr, max_iterations=max_iterations).bits)
+    return np.any(rx_bits != tx_bits, axis=1)
+
+
+def _check_code(code: LDPCCode, modem: OFDMSimulator) -> int:
+    """Modulated symbols per codeword."""
+    if code.n % modem.bits_per_symbol:
+        raise ValueError(
+            f"Code length {code.n} is not a multiple of "
+            f"{modem.bits_per_symbol} bits per symbol"
+        )
+    return code.n // modem.bits_per_symbol
+
+
+def link_curve(
+    modulation: str,
+    code: LDPCCode,
+    snr_db: np.ndarray,
+    n_codewords: int = 200,
+    seed: int = 42,
+    max_iterations: int = 20,
+    batch_codewords: int = 2048,
+) -> np.ndarray:
+    """
+    AWGN BLER curve from a batched coded link sweep.
+
+    Codewords of all SNR points are decoded together in batches of up to
+    ``batch_codewords``.
+
+    Args:
+        modulation: Modulation scheme
+        code: LDPC code
+        snr_db: SNR points in dB
+        n_codewords: Codewords simulated per SNR point
+        seed: Random seed
+        max_iterations: Maximum decoder iterations
+        batch_codewords: Codewords per decoder batch
+
+    Returns:
+        BLER at each SNR point
+    """
+    modem = OFDMSimulator(modulation=modulation, seed=seed)
+    n_symbols = _check_code(code, modem)
+    snr_per_codeword = np.repeat(np.asarray(snr_db, dtype=np.float64), n_codewords)
+
+    errors = np.empty(len(snr_per_codeword), dtype=bool)
+    for start in range(0, len(errors), batch_codewords):
+        stop = start + batch_codewords
+        snr_batch = snr_per_codeword[start:stop]
+        gains = np.ones((len(snr_batch), n_symbols), dtype=np.complex128)
+        errors[start:stop] = _block_errors(
+            modem, code, gains, snr_batch, max_iterations
+        )
+    return errors.reshape(-1, n_codewords).mean(axis=1)
+
+
+def simulate_fading_links(
+    modulation: str,
+    code: LDPCCode,
+    n_links: int,
+    snr_db: Union[float, np.ndarray],
+    codewords_per_link: int = 20,
+    n_subcarriers: int = 64,
+    delay_spread: float = 2.0,
+    seed: int = 42,
+    max_iterations: int = 20,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Measure BLER of links over frequency-selective fading (for beta calibration).
+
+    Each link sees one block-fading multipath realization; the modulated
+    symbols of its codewords cycle over all subcarriers. All codewords of
+    all links are decoded in one batch.
+
+    Args:
+        modulation: Modulation scheme
+        code: LDPC code
+        n_links: Number of independent links
+        snr_db: Average SNR in dB, scalar or one per link
+        codewords_per_link: Codewords simulated per link
+        n_subcarriers: Subcarriers per link
+        delay_spread: RMS delay spread in samples
+        seed: Random seed
+        max_iterations: Maximum decoder iterations
+
+    Returns:
+        Tuple of (per-subcarrier SINR in dB with shape (n_links,
+        n_subcarriers), BLER per link)
+    """
+    modem = OFDMSimulator(modulation=modulation, n_subcarriers=n_subcarriers, seed=seed)
+    n_symbols = _check_code(code, modem)
+    channel = MultipathChannel(
+        n_subcarriers=n_subcarriers, delay_spread=delay_spread, seed=modem.rng
+    )
+    response = channel.frequency_response(1, (n_links,))[:, 0, :]
+
+    # Symbols of consecutive codewords continue across the subcarriers
+    subcarrier = (
+        np.arange(codewords_per_link * n_symbols).reshape(codewords_per_link, n_symbols)
+        % n_subcarriers
+    )
+    gains = response[:, subcarrier].reshape(n_links * codewords_per_link, n_symbols)
+    snr_db = np.broadcast_to(np.asarray(snr_db, dtype=np.float64), (n_links,))
+    errors = _block_errors(
+        modem, code, gains, np.repeat(snr_db, codewords_per_link), max_iterations
+    )
+
+    sinr_db = snr_db[:, np.newaxis] + 10 * np.log10(np.abs(response) ** 2)
+    return sinr_db, errors.reshape(n_links, codewords_per_link).mean(axis=1)
+
+
+class L2STable:
+    """
+    SINR -> BLER lookup tables with effective SINR mapping.
+
+    ``bler[entry]`` is the AWGN BLER curve of one (modulation, code rate)
+    entry on the uniform grid snr_start + snr_step * i.
+    """
+
+    def __init__(self, bler: np.ndarray, metadata: dict):
+        """
+        Initialize from a BLER array and its metadata.
+
+        Args:
+            bler: BLER curves with shape (n_entries, n_snr) (may be a memmap)
+            metadata: Grid, entries and beta values (see build_l2s_tables)
+        """
+        self.bler_table = bler
+        self.metadata = metadata
+        self.snr_start = float(metadata["snr_start"])
+        self.snr_step = float(metadata["snr_step"])
+        self.entries = metadata["entries"]
+        if bler.shape != (len(self.entries), metadata["n_snr"]):
+            raise ValueError(f"Table shape {bler.shape} does not match its metadata")
+        if metadata["n_snr"] < 2:
+            raise ValueError("L2S tables need at least 2 SNR points to interpolate")
+        self.modulations = [entry["modulation"] for entry in self.entries]
+        self.beta = {
+            method: np.array([entry["beta"][method] for entry in self.entries])
+            for method in METHODS
+        }
+
+    @property
+    def snr_db(self) -> np.ndarray:
+        return self.snr_start + self.snr_step * np.arange(self.bler_table.shape[1])
+
+    def entry_index(self, modulation: str, code_rate: float) -> int:
+        """Index of the entry for a modulation and code rate."""
+        for index, entry in enumerate(self.entries):
+            if entry["modulation"] == modulation and np.isclose(
+                entry["code_rate"], code_rate, atol=1e-3
+            ):
+                return index
+        raise KeyError(f"No table entry for {modulation} at code rate {code_rate}")
+
+    def bler(self, snr_db: np.ndarray, entry: Union[int, np.ndarray]) -> np.ndarray:
+        """
+        AWGN BLER at the given SNR, interpolated linearly in log10(BLER).
+
+        Args:
+            snr_db: (Effective) SNR in dB, any shape
+            entry: Entry index, scalar or broadcastable to snr_db
+
+        Returns:
+            BLER with the broadcast shape; SNRs outside the grid hold the
+            edge values
+        """
+        snr_db, entry = np.broadcast_arrays(
+            np.asarray(snr_db, dtype=np.float64), np.asarray(entry)
+        )
+        position = np.clip(
+            (snr_db - self.snr_start) / self.snr_step, 0, self.bler_table.shape[1] - 1
+        )
+        lower = np.minimum(position.astype(np.int64), self.bler_table.shape[1] - 2)
+        fraction = position - lower
+        # Only the two rows' neighbouring points are gathered from the table
+        log_lo = np.log10(np.maximum(self.bler_table[entry, lower], BLER_FLOOR))
+        log_hi = np.log10(np.maximum(self.bler_table[entry, lower + 1], BLER_FLOOR))
+        return 10 ** (log_lo + fraction * (log_hi - log_lo))
+
+    def effective_sinr(
+        self,
+        sinr_db: np.ndarray,
+        entry: Union[int, np.ndarray],
+        method: str = "eesm",
+        beta: Optional[Union[float, np.ndarray]] = None,
+    ) -> np.ndarray:
+        """
+        Effective SINR of links using each entry's calibrated beta.
+
+        Args:
+            sinr_db: Per-subcarrier SINR in dB with shape (..., n_subcarriers)
+            entry: Entry index, scalar or broadcastable to sinr_db.shape[:-1]
+            method: "eesm" or "miesm"
+            beta: Override of the calibrated beta
+
+        Returns:
+            Effective SINR in dB with shape sinr_db.shape[:-1]
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown effective SINR method: {method}")
+        sinr_db = np.asarray(sinr_db, dtype=np.float64)
+        entry = np.broadcast_to(np.asarray(entry), sinr_db.shape[:-1])
+        if beta is None:
+            beta = self.beta[method][entry]
+        beta = np.broadcast_to(np.asarray(beta, dtype=np.float64), sinr_db.shape[:-1])
+
+        if method == "eesm":
+            return eesm(sinr_db, beta)
+        # MIESM depends on the modulation: one vectorized pass per modulation
+        result = np.empty(sinr_db.shape[:-1])
+        modulation_of_entry = np.array(self.modulations)
+        for modulation in set(self.modulations):
+            mask = modulation_of_entry[entry] == modulation
+            if np.any(mask):
+                result[mask] = miesm(sinr_db[mask], beta[mask], modulation)
+        return result
+
+    def predict_bler(
+        self,
+        sinr_db: np.ndarray,
+        entry: Union[int, np.ndarray],
+        method: str = "eesm",
+        beta: Optional[Union[float, np.ndarray]] = None,
+    ) -> np.ndarray:
+        """BLER of links from their per-subcarrier SINR (see effective_sinr)."""
+        return self.bler(self.effective_sinr(sinr_db, entry, method, beta), entry)
+
+    def save(self, base_path: str) -> str:
+        """
+        Write the table as ``<base>.npy`` and ``<base>.json``.
+
+        Both files are written to temporary names and renamed into place, so
+        neither is ever partial. The JSON records the SHA-256 of the array
+        file, so a crash between the two renames leaves a pair that
+        load_l2s_table() rejects instead of a table with stale metadata.
+
+        Returns:
+            Path to the table file
+        """
+        table_path, meta_path = table_paths(base_path)
+        for method in METHODS:
+            for entry, beta in zip(self.entries, self.beta[method]):
+                entry["beta"][method] = float(beta)
+
+        with open(table_path + ".tmp", "wb") as f:
+            np.save(f, np.asarray(self.bler_table, dtype=np.float32))
+        self.metadata["table_sha256"] = _file_sha256(table_path + ".tmp")
+        with open(meta_path + ".tmp", "w") as f:
+            json.dump(self.metadata, f, indent=2)
+        os.replace(table_path + ".tmp", table_path)
+        os.replace(meta_path + ".tmp", meta_path)
+        return table_path
+
+
+def load_l2s_table(base_path: str, mmap: bool = True) -> L2STable:
+    """
+    Load a table written by L2STable.save().
+
+    Args:
+        base_path: Table path without suffix
+        mmap: Memory-map the BLER array read-only instead of reading it
+
+    Returns:
+        L2STable
+
+    Raises:
+        ValueError: If the table was written by an incompatible version or
+            the array file does not match its metadata
+    """
+    table_path, meta_path = table_paths(base_path)
+    with open(meta_path) as f:
+        metadata = json.load(f)
+    if metadata.get("version") != TABLE_VERSION:
+        raise ValueError(f"Unsupported L2S table version: {metadata.get('version')}")
+    if _file_sha256(table_path) != metadata.get("table_sha256"):
+        raise ValueError(
+            f"{table_path} does not match {meta_path}; the table was not fully saved"
+        )
+    bler = np.load(table_path, mmap_mode="r" if mmap else None)
+    return L2STable(bler, metadata)
+
+
+def calibrate_beta(
+    table: L2STable,
+    entry: int,
+    sinr_db: np.ndarray,
+    bler: np.ndarray,
+    method: str = "eesm",
+    betas: Optional[np.ndarray] = None,
+) -> float:
+    """
+    Fit beta so predicted BLER matches measured fading-link BLER.
+
+    All candidate betas are evaluated in one vectorized pass and the one with
+    the smallest mean squared log10(BLER) error is returned. Links with BLER
+    of zero or one carry little information and are ignored when any link
+    lies in between.
+
+    Args:
+        table: L2S table holding the entry's AWGN curve
+        entry: Entry index
+        sinr_db: Per-subcarrier SINR of each link, shape (n_links, n_subcarriers)
+        bler: Measured BLER per link
+        method: "eesm" or "miesm"
+        betas: Candidate beta values (default: logarithmic grid 0.1 to 30)
+
+    Returns:
+        Best beta
+    """
+    if betas is None:
+        betas = np.logspace(-1, np.log10(30), 61)
+    betas = np.asarray(betas, dtype=np.float64)
+    bler = np.asarray(bler, dtype=np.float64)
+    informative = (bler > 0) & (bler < 1)
+    if not np.any(informative):
+        informative = np.ones(len(bler), dtype=bool)
+
+    sinr = np.broadcast_to(
+        np.asarray(sinr_db)[informative], (len(betas),) + sinr_db[informative].shape
+    )
+    predicted = table.predict_bler(sinr, entry, method, beta=betas[:, np.newaxis])
+    measured = np.log10(np.maximum(bler[informative], BLER_FLOOR))
+    error = np.mean((np.log10(predicted) - measured) ** 2, axis=1)
+    return float(betas[np.argmin(error)])
+
+
+def build_l2s_tables(
+    base_path: Optional[str] = None,
+    modulations: Sequence[str] = MODULATIONS,
+    codes: Optional[Sequence[LDPCCode]] = None,
+    snr_range: tuple = (-4, 12, 0.25),
+    n_codewords: int = 200,
+    calibration_links: int = 64,
+    calibration_snr_db: Optional[np.ndarray] = None,
+    seed: int = 42,
+    max_iterations: int = 20,
+) -> L2STable:
+    """
+    Generate L2S tables from link-level sweeps and optionally save them.
+
+    For every (modulation, code) pair the AWGN BLER curve is simulated on
+    the SNR grid; with ``calibration_links`` > 0, fading links are simulated
+    and EESM and MIESM beta are calibrated against the curve (otherwise beta
+    is 1).
+
+    Args:
+        base_path: Table path without suffix (None to skip saving)
+        modulations: Modulation schemes
+        codes: LDPC codes, one entry per code rate (default: default_code())
+        snr_range: (start, stop, step) of the SNR grid in dB
+        n_codewords: Codewords per SNR point
+        calibration_links: Fading links per entry for beta calibration
+        calibration_snr_db: Average SNR per calibration link (default:
+            spread uniformly over the grid)
+        seed: Random seed
+        max_iterations: Maximum decoder iterations
+
+    Returns:
+        L2STable
+    """
+    if codes is None:
+        codes = [default_code()]
+    start, stop, step = snr_range
+    snr_db = np.arange(start, stop + step / 2, step)
+    rng = np.random.default_rng(seed)
+
+    entries = [(modulation, code) for modulation in modulations for code in codes]
+    seeds = rng.integers(0, 2**31, size=(len(entries), 2))
+    bler = np.stack(
+        [
+            link_curve(
+                modulation,
+                code,
+                snr_db,
+                n_codewords,
+                int(entry_seed[0]),
+                max_iterations,
+            )
+            for (modulation, code), entry_seed in zip(entries, seeds)
+        ]
+    ).astype(np.float32)
+
+    metadata = {
+        "version": TABLE_VERSION,
+        "snr_start": float(start),
+        "snr_step": float(step),
+        "n_snr": len(snr_db),
+        "n_codewords": n_codewords,
+        "entries": [
+            {
+                "modulation": modulation,
+                "code_rate": code.rate,
+                "n": code.n,
+                "k": code.k,
+                "beta": {method: 1.0 for method in METHODS},
+            }
+            for modulation, code in entries
+        ],
+    }
+    table = L2STable(bler, metadata)
+
+    if calibration_links > 0:
+        for index, ((modulation, code), entry_seed) in enumerate(zip(entries, seeds)):
+            link_snr = calibration_snr_db
+            if link_snr is None:
+                link_snr = np.linspace(snr_db[0], snr_db[-1], calibration_links)
+            sinr, measured = simulate_fading_links(
+                modulation,
+                code,
+                calibration_links,
+                link_snr,
+                seed=int(entry_seed[1]),
+                max_iterations=max_iterations,
+            )
+            for method in METHODS:
+                table.beta[method][index] = calibrate_beta(
+                    table, index, sinr, measured, method
+                )
+
+    if base_path is not None:
+        table.save(base_path)
+    return table
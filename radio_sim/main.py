@@ -7,13 +7,24 @@ Runs OFDM simulation and calculates BER for different SNR values.
 import numpy as np
 import argparse
 import sys
+import time
+from typing import Optional
+from radio_sim.checkpoint import (SweepProgress, load_checkpoint,
+                                  restore_simulator_state, save_checkpoint)
 from radio_sim.ofdm import OFDMSimulator, plot_ber_curve
+from radio_sim.snr_search import find_snr_for_ber
+from radio_sim.workqueue import merge_results, plan_sweep, queue_status, run_worker
 
 
 def run_simulation(modulation: str = "QPSK", 
-                  n_bits: int = 10000,
-                  snr_range: tuple = (0, 20, 2),
-                  seed: int = 42) -> dict:
+                   n_bits: int = 10000,
+                   snr_range: tuple = (0, 20, 2),
+                   seed: int = 42,
+                   bit_source: str = "random",
+                   chunk_bits: Optional[int] = None,
+                   checkpoint_path: Optional[str] = None,
+                   resume: bool = False,
+                   checkpoint_interval: float = 30.0) -> dict:
     """
     Run OFDM simulation across SNR range.
     
@@ -22,6 +33,13 @@ def run_simulation(modulation: str = "QPSK",
         n_bits: Number of bits to simulate
         snr_range: (start, stop, step) for SNR in dB
         seed: Random seed
+        bit_source: "random" or a PN sequence such as "pn9"/"pn23"
+        chunk_bits: Bits simulated per chunk (default: all n_bits at once);
+            rounded down to whole OFDM symbols
+        checkpoint_path: File to checkpoint progress to
+        resume: Continue from ``checkpoint_path`` if it exists
+        checkpoint_interval: Minimum seconds between mid-point checkpoints;
+            a checkpoint is always written after each SNR point
         
     Returns:
         Dictionary with simulation results
@@ -33,24 +51,76 @@ def run_simulation(modulation: str = "QPSK",
     print("-" * 50)
     
     # Initialize simulator
-    simulator = OFDMSimulator(modulation=modulation, seed=seed)
+    simulator = OFDMSimulator(modulation=modulation, seed=seed, bit_source=bit_source)
     
     # Generate SNR values
     snr_values = np.arange(snr_range[0], snr_range[1] + snr_range[2], snr_range[2])
-    ber_values = []
+
+    # Chunks are whole OFDM symbols so resuming splits bits identically
+    if chunk_bits is None:
+        chunk_bits = n_bits
+    else:
+        bits_per_ofdm_symbol = simulator.bits_per_symbol * simulator.n_subcarriers
+        chunk_bits = max(1, chunk_bits // bits_per_ofdm_symbol) * bits_per_ofdm_symbol
+
+    config = {
+        'modulation': modulation,
+        'n_bits': n_bits,
+        'snr_range': [float(x) for x in snr_range],
+        'seed': seed,
+        'bit_source': bit_source,
+        'chunk_bits': chunk_bits
+    }
+    progress: SweepProgress = {'snr_index': 0, 'bits_done': 0, 'errors': 0,
+                               'measured_bits': 0, 'ber_values': []}
+
+    if resume and checkpoint_path:
+        checkpoint = load_checkpoint(checkpoint_path, config)
+        if checkpoint is not None:
+            progress = checkpoint['progress']
+            restore_simulator_state(simulator, checkpoint['simulator'])
+            print(f"Resuming from checkpoint: {progress['snr_index']} SNR points done, "
+                  f"{progress['bits_done']} bits into the next")
+            for snr_db, ber in zip(snr_values, progress['ber_values']):
+                print(f"SNR: {snr_db:2d} dB, BER: {ber:.2e} (from checkpoint)")
+
+    last_save = time.monotonic()
     
     # Run simulation for each SNR
-    for snr_db in snr_values:
-        ber, sim_data = simulator.simulate_transmission(n_bits, snr_db)
-        ber_values.append(ber)
+    for index in range(progress['snr_index'], len(snr_values)):
+        snr_db = snr_values[index]
+
+        # Accumulate errors chunk by chunk
+        while progress['bits_done'] < n_bits:
+            chunk = min(chunk_bits, n_bits - progress['bits_done'])
+            _, sim_data = simulator.simulate_transmission(chunk, snr_db)
+            rx_bits = sim_data['rx_bits']
+            tx_bits = sim_data['tx_bits'][:len(rx_bits)]
+            progress['errors'] += int(np.count_nonzero(tx_bits != rx_bits))
+            progress['measured_bits'] += len(rx_bits)
+            progress['bits_done'] += chunk
+
+            if checkpoint_path and time.monotonic() - last_save >= checkpoint_interval:
+                save_checkpoint(checkpoint_path, config, progress, simulator)
+                last_save = time.monotonic()
+
+        measured_bits = progress['measured_bits']
+        ber = progress['errors'] / measured_bits if measured_bits else 0.0
+        progress['ber_values'].append(ber)
+        progress['snr_index'] = index + 1
+        progress['bits_done'] = progress['errors'] = progress['measured_bits'] = 0
         
         print(f"SNR: {snr_db:2d} dB, BER: {ber:.2e}")
         
         # Check if BER is acceptable (for CI testing)
         if snr_db >= 15 and ber > 1e-5:
             print(f"WARNING: High BER ({ber:.2e}) at SNR {snr_db} dB")
+
+        if checkpoint_path:
+            save_checkpoint(checkpoint_path, config, progress, simulator)
+            last_save = time.monotonic()
     
-    ber_array = np.array(ber_values)
+    ber_array = np.array(progress['ber_values'])
     
     # Summary
     print("-" * 50)
@@ -66,6 +136,104 @@ def run_simulation(modulation: str = "QPSK",
     }
 
 
+def run_snr_search(target_ber: float,
+                   modulation: str = "QPSK",
+                   n_bits: int = 10000,
+                   snr_bounds: tuple = (0, 20),
+                   tolerance: float = 0.1,
+                   seed: int = 42,
+                   bit_source: str = "random") -> dict:
+    """
+    Find the SNR that achieves a target BER with adaptive probing.
+
+    Args:
+        target_ber: Target bit error rate
+        modulation: Modulation scheme
+        n_bits: Number of bits per SNR point
+        snr_bounds: Initial (low, high) SNR bracket in dB
+        tolerance: Required SNR resolution in dB
+        seed: Random seed
+        bit_source: "random" or a PN sequence such as "pn9"/"pn23"
+
+    Returns:
+        Dictionary with search results (see find_snr_for_ber)
+    """
+    print("5G PHY CI Pipeline - Target BER Search")
+    print(f"Modulation: {modulation}")
+    print(f"Bits per simulation: {n_bits}")
+    print(f"Target BER: {target_ber:.1e} (tolerance: {tolerance} dB)")
+    print("-" * 50)
+
+    config = {'modulation': modulation, 'n_bits': n_bits, 'seed': seed,
+              'bit_source': bit_source}
+    results = find_snr_for_ber(
+        target_ber,
+        config=config,
+        snr_bounds=snr_bounds,
+        tolerance=tolerance,
+        verbose=True
+    )
+
+    print("-" * 50)
+    print("Search completed successfully!")
+    print(f"BER {target_ber:.1e} reached at {results['snr_db']:.2f} dB "
+          f"({results['n_points']} SNR points)")
+
+    return results
+
+
+def run_queue_role(role: str, queue_dir: str, modulation: str = "QPSK",
+                   n_bits: int = 10000, snr_range: tuple = (0, 20, 2), seed: int = 42,
+                   unit_bits: Optional[int] = None,
+                   stale_timeout: Optional[float] = None,
+                   bit_source: str = "random") -> Optional[dict]:
+    """
+    Run one role of a distributed sweep against a shared queue directory.
+
+    Args:
+        role: "coordinator" (plan units), "worker" (process units) or
+            "merge" (aggregate results)
+        queue_dir: Shared queue directory
+        modulation: Modulation scheme (coordinator)
+        n_bits: Number of bits per SNR point (coordinator)
+        snr_range: (start, stop, step) for SNR in dB (coordinator)
+        seed: Root random seed (coordinator)
+        unit_bits: Bits per work unit (coordinator)
+        stale_timeout: Seconds after which a worker requeues abandoned units
+        bit_source: "random" or a PN sequence such as "pn9"/"pn23" (coordinator)
+
+    Returns:
+        Merged results for the "merge" role, otherwise None
+    """
+    if role == "coordinator":
+        n_units = plan_sweep(queue_dir, modulation=modulation, n_bits=n_bits,
+                             snr_range=snr_range, seed=seed, unit_bits=unit_bits,
+                             bit_source=bit_source)
+        print(f"Planned {n_units} work units in {queue_dir}")
+        return None
+
+    if role == "worker":
+        processed = run_worker(queue_dir, stale_timeout=stale_timeout)
+        print(f"Worker processed {processed} work units")
+        return None
+
+    if role == "merge":
+        status = queue_status(queue_dir)
+        print(f"Work units: {status['done']} done, {status['claimed']} claimed, "
+              f"{status['pending']} pending")
+        results = merge_results(queue_dir)
+        print(f"Modulation: {results['modulation']}")
+        print(f"Bits per simulation: {results['n_bits']}")
+        print("-" * 50)
+        for snr_db, ber in zip(results['snr_values'], results['ber_values']):
+            print(f"SNR: {snr_db:5.1f} dB, BER: {ber:.2e}")
+        print("-" * 50)
+        print("Simulation completed successfully!")
+        return results
+
+    raise ValueError(f"Unknown queue role: {role}")
+
+
 def main() -> int:
     """Main entry point for CLI."""
     parser = argparse.ArgumentParser(
@@ -114,6 +282,83 @@ def main() -> int:
         help='Random seed (default: 42)'
     )
     
+    parser.add_argument(
+        '--bit-source',
+        choices=['random', 'pn7', 'pn9', 'pn11', 'pn15', 'pn23'],
+        default='random',
+        help='Data bit source (default: random)'
+    )
+
+    parser.add_argument(
+        '--target-ber',
+        type=float,
+        default=None,
+        help='Search for the SNR achieving this BER instead of sweeping; '
+             'the SNR start/stop values give the initial bracket'
+    )
+
+    parser.add_argument(
+        '--snr-tolerance',
+        type=float,
+        default=0.1,
+        help='SNR resolution in dB for --target-ber (default: 0.1)'
+    )
+
+    parser.add_argument(
+        '--chunk-bits',
+        type=int,
+        default=None,
+        help='Bits simulated per chunk (default: all bits at once)'
+    )
+
+    parser.add_argument(
+        '--checkpoint',
+        metavar='PATH',
+        default=None,
+        help='Periodically checkpoint sweep progress to this file'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Resume the sweep from --checkpoint if it exists'
+    )
+
+    parser.add_argument(
+        '--checkpoint-interval',
+        type=float,
+        default=30.0,
+        help='Seconds between mid-point checkpoints (default: 30)'
+    )
+
+    parser.add_argument(
+        '--queue-dir',
+        metavar='DIR',
+        default=None,
+        help='Shared directory for a distributed sweep (use with --role)'
+    )
+
+    parser.add_argument(
+        '--role',
+        choices=['coordinator', 'worker', 'merge'],
+        default=None,
+        help='Distributed sweep role: plan units, process units or merge results'
+    )
+
+    parser.add_argument(
+        '--unit-bits',
+        type=int,
+        default=None,
+        help='Bits per distributed work unit (default: one unit per SNR point)'
+    )
+
+    parser.add_argument(
+        '--stale-timeout',
+        type=float,
+        default=None,
+        help='Seconds after which workers requeue units abandoned by dead workers'
+    )
+
     parser.add_argument(
         '--plot',
         action='store_true',
@@ -121,14 +366,54 @@ def main() -> int:
     )
     
     args = parser.parse_args()
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requires --checkpoint")
+    if (args.role is None) != (args.queue_dir is None):
+        parser.error("--role and --queue-dir must be given together")
     
     try:
+        # Distributed sweep mode
+        if args.role is not None:
+            results = run_queue_role(
+                args.role,
+                args.queue_dir,
+                modulation=args.modulation,
+                n_bits=args.bits,
+                snr_range=(args.snr_start, args.snr_stop, args.snr_step),
+                seed=args.seed,
+                unit_bits=args.unit_bits,
+                stale_timeout=args.stale_timeout,
+                bit_source=args.bit_source
+            )
+            if results is not None and args.plot:
+                plot_ber_curve(results['snr_values'], results['ber_values'],
+                               results['modulation'])
+            return 0
+
+        # Target BER search mode
+        if args.target_ber is not None:
+            run_snr_search(
+                args.target_ber,
+                modulation=args.modulation,
+                n_bits=args.bits,
+                snr_bounds=(args.snr_start, args.snr_stop),
+                tolerance=args.snr_tolerance,
+                seed=args.seed,
+                bit_source=args.bit_source
+            )
+            return 0
+
         # Run simulation
         results = run_simulation(
             modulation=args.modulation,
             n_bits=args.bits,
             snr_range=(args.snr_start, args.snr_stop, args.snr_step),
-            seed=args.seed
+            seed=args.seed,
+            bit_source=args.bit_source,
+            chunk_bits=args.chunk_bits,
+            checkpoint_path=args.checkpoint,
+            resume=args.resume,
+            checkpoint_interval=args.checkpoint_interval
         )
         
         # Plot if requested
@@ -11,10 +11,18 @@ Implements basic OFDM transmission chain:
 """
 
 import numpy as np
-from typing import Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
 import matplotlib.pyplot as plt
 from numpy.typing import NDArray
 
+# Feature stages are imported where they are used, so importing the core
+# simulator does not load every subsystem
+if TYPE_CHECKING:
+    from radio_sim.channel import MultipathChannel
+    from radio_sim.estimation import PilotPattern
+    from radio_sim.fixed_point import QFormat
+    from radio_sim.ldpc import LDPCCode
+
 
 class OFDMSimulator:
     """
@@ -29,19 +37,33 @@ class OFDMSimulator:
     def __init__(self, 
                  n_subcarriers: int = 64,
                  modulation: str = "QPSK",
-                 seed: int = 42):
+                 seed: Union[int, np.random.SeedSequence, np.random.Generator] = 42,
+                 bit_source: str = "random"):
         """
         Initialize OFDM simulator.
         
         Args:
             n_subcarriers: Number of OFDM subcarriers
             modulation: Modulation scheme ("QPSK" or "16QAM")
-            seed: Random seed for reproducible results
+            seed: Random seed, SeedSequence, or a Generator to share
+            bit_source: "random" for seeded random bits, or a PN sequence
+                ("pn7", "pn9", "pn11", "pn15", "pn23") for deterministic data
         """
         self.n_subcarriers = n_subcarriers
         self.modulation = modulation
         self.rng = np.random.default_rng(seed)
         
+        # Data bit source
+        self.bit_source = bit_source
+        if bit_source == "random":
+            self.prbs = None
+        elif bit_source.startswith("pn") and bit_source[2:].isdigit():
+            from radio_sim.prbs import PRBSGenerator
+
+            self.prbs = PRBSGenerator(int(bit_source[2:]))
+        else:
+            raise ValueError(f"Unsupported bit source: {bit_source}")
+
         # Modulation constellation points
         if modulation == "QPSK":
             self.constellation = np.array([1+1j, -1+1j, -1-1j, 1-1j]) / np.sqrt(2)
@@ -59,8 +81,38 @@ class OFDMSimulator:
             raise ValueError(f"Unsupported modulation: {modulation}")
     
     def generate_bits(self, n_bits: int) -> np.ndarray:
-        """Generate random bits."""
-        return self.rng.integers(0, 2, size=n_bits, dtype=np.uint8)
+        """
+        Generate data bits.
+
+        Random bits are drawn as raw bytes and unpacked MSB first, so one
+        generator draw yields eight bits. For a given seed, the bits returned
+        by successive calls are the leading bits of ``rng.bytes(ceil(n / 8))``
+        for each call; the unused tail of a partial byte is discarded. PN
+        sources ignore the seed and continue their sequence across calls.
+
+        Args:
+            n_bits: Number of bits
+
+        Returns:
+            Bits as a uint8 array of zeros and ones
+        """
+        if self.prbs is not None:
+            return self.prbs.next_bits(n_bits)
+        return np.unpackbits(self.generate_packed_bits(-(-n_bits // 8)), count=n_bits)
+
+    def generate_packed_bits(self, n_bytes: int) -> np.ndarray:
+        """
+        Generate random data packed eight bits per byte (MSB first).
+
+        Args:
+            n_bytes: Number of bytes
+
+        Returns:
+            uint8 array of packed bits
+        """
+        if self.prbs is not None:
+            return np.packbits(self.prbs.next_bits(8 * n_bytes))
+        return np.frombuffer(self.rng.bytes(n_bytes), dtype=np.uint8)
     
     def modulate(self, bits: np.ndarray) -> NDArray[np.complex128]:
         """
@@ -81,6 +133,31 @@ class OFDMSimulator:
         
         return self.constellation[indices].astype(np.complex128)
     
+    def modulate_packed(self, packed_bits: np.ndarray) -> NDArray[np.complex128]:
+        """
+        Modulate packed bytes without unpacking them to one byte per bit.
+
+        Equivalent to ``modulate(np.unpackbits(packed_bits))``. When the bits
+        per symbol divide eight, constellation indices are sliced directly
+        out of each byte.
+
+        Args:
+            packed_bits: uint8 array, eight bits per byte (MSB first)
+
+        Returns:
+            Complex symbols array
+        """
+        packed_bits = np.asarray(packed_bits, dtype=np.uint8)
+        if 8 % self.bits_per_symbol:
+            return self.modulate(np.unpackbits(packed_bits))
+
+        step = self.bits_per_symbol
+        shifts = np.arange(8 - step, -1, -step, dtype=np.uint8)
+        mask = np.uint8((1 << self.bits_per_symbol) - 1)
+        indices = (packed_bits[:, np.newaxis] >> shifts) & mask
+
+        return self.constellation[indices.ravel()].astype(np.complex128)
+
     def generate_ofdm_symbol(self, data_symbols: np.ndarray) -> np.ndarray:
         """
         Generate OFDM symbol using IFFT.
@@ -104,6 +181,25 @@ class OFDMSimulator:
         
         return time_signal.astype(np.complex128)
     
+    def generate_ofdm_symbols(self, data_symbols: np.ndarray) -> np.ndarray:
+        """
+        Generate as many OFDM symbols as needed to carry all data symbols.
+
+        Args:
+            data_symbols: Modulated data symbols
+
+        Returns:
+            Time-domain OFDM symbols with shape (n_ofdm_symbols, n_subcarriers)
+        """
+        # Zero-pad the last OFDM symbol in frequency domain
+        n_ofdm_symbols = max(1, -(-len(data_symbols) // self.n_subcarriers))
+        padded = np.zeros(n_ofdm_symbols * self.n_subcarriers, dtype=np.complex128)
+        padded[:len(data_symbols)] = data_symbols
+        grid = padded.reshape(n_ofdm_symbols, self.n_subcarriers)
+
+        # IFFT along subcarriers to convert to time domain
+        return np.fft.ifft(grid, axis=-1) * np.sqrt(self.n_subcarriers)
+
     def add_awgn(self, signal: np.ndarray, snr_db: float) -> np.ndarray:
         """
         Add Additive White Gaussian Noise (AWGN) to signal.
@@ -131,15 +227,17 @@ class OFDMSimulator:
     
     def demodulate_ofdm(self, received_signal: np.ndarray) -> np.ndarray:
         """
-        Demodulate OFDM symbol using FFT.
+        Demodulate OFDM symbol(s) using FFT.
         
         Args:
-            received_signal: Received time-domain signal
+            received_signal: Received time-domain signal, one OFDM symbol per
+                row when shaped (n_ofdm_symbols, n_subcarriers)
             
         Returns:
-            Frequency-domain symbols
+            Frequency-domain symbols with the same shape as the input
         """
-        return (np.fft.fft(received_signal) / np.sqrt(self.n_subcarriers)).astype(np.complex128)
+        spectrum = np.fft.fft(received_signal, axis=-1) / np.sqrt(self.n_subcarriers)
+        return spectrum.astype(np.complex128)
     
     def demodulate_symbols(self, symbols: np.ndarray) -> np.ndarray:
         """
@@ -152,17 +250,41 @@ class OFDMSimulator:
             Demodulated bits
         """
         # Hard decision demodulation - find closest constellation point
+        symbols = np.ravel(symbols)
         distances = np.abs(symbols[:, np.newaxis] - self.constellation[np.newaxis, :])
         indices = np.argmin(distances, axis=1)
         
-        # Convert indices back to bits
-        bits = []
-        for idx in indices:
-            bit_pattern = format(idx, f'0{self.bits_per_symbol}b')
-            bits.extend([int(b) for b in bit_pattern])
+        # Convert indices back to bits (MSB first ordering)
+        shifts = np.arange(self.bits_per_symbol - 1, -1, -1)
+        bits = (indices[:, np.newaxis] >> shifts) & 1
         
-        return np.array(bits, dtype=np.uint8)
+        return bits.astype(np.uint8).ravel()
     
+    def demodulate_llr(self, symbols: np.ndarray, noise_var: float) -> np.ndarray:
+        """
+        Soft-demodulate constellation symbols to bit LLRs (max-log).
+
+        Args:
+            symbols: Received symbols
+            noise_var: Complex noise variance per symbol
+
+        Returns:
+            LLRs in transmitted bit order; positive values favour bit 0
+        """
+        symbols = np.ravel(symbols)
+        distances = np.abs(symbols[:, np.newaxis] - self.constellation) ** 2
+
+        shifts = np.arange(self.bits_per_symbol - 1, -1, -1)
+        labels = (np.arange(len(self.constellation))[:, np.newaxis] >> shifts) & 1
+
+        llr = np.empty((len(symbols), self.bits_per_symbol))
+        for b in range(self.bits_per_symbol):
+            ones = labels[:, b] == 1
+            nearest_one = np.min(distances[:, ones], axis=1)
+            llr[:, b] = nearest_one - np.min(distances[:, ~ones], axis=1)
+
+        return (llr / noise_var).ravel()
+
     def calculate_ber(self, tx_bits: np.ndarray, rx_bits: np.ndarray) -> float:
         """
         Calculate Bit Error Rate (BER).
@@ -200,14 +322,15 @@ class OFDMSimulator:
         tx_bits = self.generate_bits(n_bits)
         tx_symbols = self.modulate(tx_bits)
         
-        # Generate OFDM symbol
-        ofdm_symbol = self.generate_ofdm_symbol(tx_symbols)
+        # Generate OFDM symbols and serialize them into one IQ stream
+        ofdm_symbol = self.generate_ofdm_symbols(tx_symbols).ravel()
         
         # Add AWGN
         rx_signal = self.add_awgn(ofdm_symbol, snr_db)
         
         # Demodulate
-        rx_symbols = self.demodulate_ofdm(rx_signal)
+        rx_grid = rx_signal.reshape(-1, self.n_subcarriers)
+        rx_symbols = self.demodulate_ofdm(rx_grid).ravel()
         rx_bits = self.demodulate_symbols(rx_symbols[:len(tx_symbols)])
         
         # Calculate BER
@@ -225,12 +348,410 @@ class OFDMSimulator:
             'n_bits': n_bits,
             'modulation': self.modulation
         }
+
+        return ber, sim_data
+
+    def simulate_coded_transmission(self, n_codewords: int, snr_db: float,
+                                    code: "LDPCCode",
+                                    max_iterations: int = 20) -> Tuple[float, dict]:
+        """
+        Simulate LDPC-coded OFDM transmission.
+
+        Information bits are LDPC-encoded before modulation; the receiver
+        soft-demaps to LLRs and decodes all codewords as one batch.
+
+        Args:
+            n_codewords: Number of codewords to transmit
+            snr_db: SNR in dB
+            code: LDPC code
+            max_iterations: Maximum decoder iterations
+
+        Returns:
+            Tuple of (information BER, simulation_data)
+        """
+        # Generate, encode and modulate data
+        tx_bits = self.generate_bits(n_codewords * code.k).reshape(n_codewords, code.k)
+        coded_bits = code.encode(tx_bits).ravel()
+        padding = -len(coded_bits) % self.bits_per_symbol
+        padded_bits = np.concatenate([coded_bits, np.zeros(padding, dtype=np.uint8)])
+        tx_symbols = self.modulate(padded_bits)
+
+        # OFDM modulation and AWGN
+        ofdm_symbol = self.generate_ofdm_symbols(tx_symbols).ravel()
+        rx_signal = self.add_awgn(ofdm_symbol, snr_db)
+        noise_var = np.mean(np.abs(ofdm_symbol) ** 2) / 10 ** (snr_db / 10)
+
+        # Demodulate, soft-demap and decode
+        rx_grid = rx_signal.reshape(-1, self.n_subcarriers)
+        rx_symbols = self.demodulate_ofdm(rx_grid).ravel()[:len(tx_symbols)]
+        llr = self.demodulate_llr(rx_symbols, noise_var)[:len(coded_bits)]
+        llr = llr.reshape(n_codewords, code.n)
+        result = code.decode(llr, max_iterations=max_iterations)
+        rx_bits = code.extract_message(result.bits)
+
+        # Calculate BER and BLER on information bits
+        ber = self.calculate_ber(tx_bits.ravel(), rx_bits.ravel())
+        bler = float(np.mean(np.any(tx_bits != rx_bits, axis=1)))
+
+        sim_data = {
+            'tx_bits': tx_bits,
+            'rx_bits': rx_bits,
+            'rx_symbols': rx_symbols,
+            'bler': bler,
+            'iterations': result.iterations,
+            'average_iterations': result.average_iterations,
+            'converged': result.converged,
+            'code_rate': code.rate,
+            'snr_db': snr_db,
+            'n_bits': tx_bits.size,
+            'modulation': self.modulation
+        }
         
         return ber, sim_data
 
+    def simulate_fading_transmission(self, n_bits: int, snr_db: float,
+                                     channel: "MultipathChannel",
+                                     pilot_pattern: Optional["PilotPattern"] = None,
+                                     estimator: str = "lmmse",
+                                     equalizer: str = "zf",
+                                     slot_symbols: int = 14) -> Tuple[float, dict]:
+        """
+        Simulate transmission over a fading channel with pilot-aided reception.
+
+        Data is mapped onto slots of ``slot_symbols`` OFDM symbols around the
+        pilot pattern. Every slot sees an independent channel realization, and
+        all slots are estimated and equalized in one batched pass.
+
+        Args:
+            n_bits: Number of bits to transmit
+            snr_db: SNR in dB
+            channel: Multipath channel model (must match n_subcarriers)
+            pilot_pattern: Pilot pattern for channel estimation (default:
+                PilotPattern.comb())
+            estimator: Channel estimation method ("ls" or "lmmse")
+            equalizer: Equalization method ("zf" or "mmse")
+            slot_symbols: OFDM symbols per slot
+
+        Returns:
+            Tuple of (BER, simulation_data)
+        """
+        from radio_sim.estimation import (PilotPattern, equalize, estimate_channel,
+                                          extract_data, insert_pilots)
+
+        if channel.n_subcarriers != self.n_subcarriers:
+            raise ValueError("Channel and simulator subcarrier counts differ")
+        if pilot_pattern is None:
+            pilot_pattern = PilotPattern.comb()
+
+        # Generate and modulate data, then map it onto slots around the pilots
+        tx_bits = self.generate_bits(n_bits)
+        tx_symbols = self.modulate(tx_bits)
+        n_data = pilot_pattern.n_data(slot_symbols, self.n_subcarriers)
+        n_slots = max(1, -(-len(tx_symbols) // n_data))
+        data = np.zeros(n_slots * n_data, dtype=np.complex128)
+        data[:len(tx_symbols)] = tx_symbols
+        tx_grid = insert_pilots(data.reshape(n_slots, n_data), pilot_pattern,
+                                slot_symbols, self.n_subcarriers)
+
+        # Fading channel in frequency domain, AWGN on the serialized IQ stream
+        response = channel.frequency_response(slot_symbols, (n_slots,))
+        faded_grid = channel.apply(tx_grid, response)
+        faded = np.fft.ifft(faded_grid, axis=-1) * np.sqrt(self.n_subcarriers)
+        rx_signal = self.add_awgn(faded.ravel(), snr_db)
+        rx_grid = self.demodulate_ofdm(rx_signal.reshape(tx_grid.shape))
+
+        # Estimate, equalize and demap
+        h_est = estimate_channel(rx_grid, pilot_pattern, estimator,
+                                 snr_db=snr_db, delay_spread=channel.delay_spread)
+        eq_grid = equalize(rx_grid, h_est, equalizer, noise_var=10 ** (-snr_db / 10))
+        rx_symbols = extract_data(eq_grid, pilot_pattern).ravel()[:len(tx_symbols)]
+        rx_bits = self.demodulate_symbols(rx_symbols)
+
+        ber = self.calculate_ber(tx_bits, rx_bits)
+
+        sim_data = {
+            'tx_bits': tx_bits,
+            'tx_symbols': tx_symbols,
+            'rx_signal': rx_signal,
+            'rx_symbols': rx_symbols,
+            'rx_bits': rx_bits,
+            'channel': response,
+            'channel_estimate': h_est,
+            'snr_db': snr_db,
+            'n_bits': n_bits,
+            'modulation': self.modulation
+        }
+
+        return ber, sim_data
+
+    def simulate_pa_transmission(self, n_bits: int, snr_db: float,
+                                 pa: Callable[[np.ndarray], np.ndarray],
+                                 input_backoff_db: float = 6.0) -> Tuple[float, dict]:
+        """
+        Simulate transmission through a nonlinear power amplifier.
+
+        The PA distorts the time-domain OFDM symbols before AWGN is added.
+        The receiver removes the common complex gain of the PA (its Bussgang
+        gain, as a pilot-aided receiver would), so the remaining BER loss
+        comes from the nonlinear distortion alone.
+
+        Args:
+            n_bits: Number of bits to transmit
+            snr_db: SNR in dB, relative to the PA output power
+            pa: Memoryless PA model (see radio_sim.papr)
+            input_backoff_db: Average input power below PA saturation
+
+        Returns:
+            Tuple of (BER, simulation_data)
+        """
+        from radio_sim.papr import apply_backoff, papr_db
+
+        tx_bits = self.generate_bits(n_bits)
+        tx_symbols = self.modulate(tx_bits)
+        ofdm_symbols = self.generate_ofdm_symbols(tx_symbols)
+
+        pa_output = apply_backoff(ofdm_symbols, pa, input_backoff_db)
+        rx_signal = self.add_awgn(pa_output.ravel(), snr_db)
+
+        rx_grid = rx_signal.reshape(ofdm_symbols.shape)
+        rx_symbols = self.demodulate_ofdm(rx_grid).ravel()[:len(tx_symbols)]
+        gain = np.vdot(tx_symbols, rx_symbols) / np.vdot(tx_symbols, tx_symbols)
+        rx_symbols = rx_symbols / gain
+        rx_bits = self.demodulate_symbols(rx_symbols)
+
+        ber = self.calculate_ber(tx_bits, rx_bits)
+
+        sim_data = {
+            'tx_bits': tx_bits,
+            'tx_symbols': tx_symbols,
+            'rx_signal': rx_signal,
+            'rx_symbols': rx_symbols,
+            'rx_bits': rx_bits,
+            'pa_gain': gain,
+            'papr_db': papr_db(ofdm_symbols),
+            'snr_db': snr_db,
+            'input_backoff_db': input_backoff_db,
+            'n_bits': n_bits,
+            'modulation': self.modulation
+        }
+
+        return ber, sim_data
+
+    def simulate_sync_transmission(self, n_bits: int, snr_db: float,
+                                   timing_offset: int = 0,
+                                   cfo: float = 0.0,
+                                   phase_noise_std: float = 0.0,
+                                   cp_length: int = 16,
+                                   method: str = "preamble") -> Tuple[float, dict]:
+        """
+        Simulate CP-OFDM transmission with timing, CFO and phase noise.
+
+        The receiver estimates timing and CFO, corrects the CFO, removes the
+        cyclic prefixes and tracks the remaining common phase error of each
+        OFDM symbol before demodulating.
+
+        Args:
+            n_bits: Number of bits to transmit
+            snr_db: SNR in dB
+            timing_offset: Samples of noise received before the transmission
+                (less than one OFDM symbol for the "cp" method)
+            cfo: Carrier frequency offset in subcarrier spacings (within
+                +-1 for "preamble", +-0.5 for "cp")
+            phase_noise_std: Phase noise increment per sample in radians
+            cp_length: Cyclic prefix length in samples
+            method: Synchronization method ("preamble" or "cp")
+
+        Returns:
+            Tuple of (BER, simulation_data)
+        """
+        from radio_sim.sync import (add_cyclic_prefix, apply_cfo, apply_phase_noise,
+                                    apply_timing_offset, correct_common_phase, cp_sync,
+                                    preamble_sync, remove_cyclic_prefix,
+                                    schmidl_cox_preamble)
+
+        if method not in ("preamble", "cp"):
+            raise ValueError(f"Unknown synchronization method: {method}")
+
+        tx_bits = self.generate_bits(n_bits)
+        tx_symbols = self.modulate(tx_bits)
+        ofdm_symbols = self.generate_ofdm_symbols(tx_symbols)
+        n_ofdm_symbols = len(ofdm_symbols)
+        symbol_length = self.n_subcarriers + cp_length
+
+        # Serialize CP-OFDM symbols, led by a CP-prefixed preamble if used
+        frames = [add_cyclic_prefix(ofdm_symbols, cp_length).ravel()]
+        if method == "preamble":
+            preamble = schmidl_cox_preamble(self.n_subcarriers)
+            frames.insert(0, add_cyclic_prefix(preamble, cp_length))
+        tx_stream = np.concatenate(frames)
+
+        # Idle (noise-only) samples around the burst, then receiver impairments
+        signal_power = np.mean(np.abs(tx_stream) ** 2)
+        burst = np.concatenate([apply_timing_offset(tx_stream, timing_offset),
+                                np.zeros(symbol_length, dtype=np.complex128)])
+        noise_std = np.sqrt(signal_power / 10 ** (snr_db / 10) / 2)
+        rx_signal = burst + noise_std * (self.rng.normal(size=len(burst))
+                                         + 1j * self.rng.normal(size=len(burst)))
+        rx_signal = apply_cfo(rx_signal, cfo, self.n_subcarriers)
+        if phase_noise_std > 0:
+            rx_signal = apply_phase_noise(rx_signal, phase_noise_std, self.rng)
+
+        # Synchronize: locate the first data symbol's cyclic prefix
+        if method == "preamble":
+            sync = preamble_sync(rx_signal, preamble)
+            data_start = sync.timing + self.n_subcarriers
+        else:
+            sync = cp_sync(rx_signal, self.n_subcarriers, cp_length, snr_db)
+            data_start = sync.timing
+        data_start = min(data_start, len(rx_signal) - n_ofdm_symbols * symbol_length)
+
+        corrected = apply_cfo(rx_signal, -sync.cfo, self.n_subcarriers)
+        data = remove_cyclic_prefix(corrected, self.n_subcarriers, cp_length,
+                                    n_ofdm_symbols, data_start)
+        rx_grid = self.demodulate_ofdm(data)
+        rx_grid = correct_common_phase(rx_grid, self.constellation)
+        rx_symbols = rx_grid.ravel()[:len(tx_symbols)]
+        rx_bits = self.demodulate_symbols(rx_symbols)
+
+        ber = self.calculate_ber(tx_bits, rx_bits)
+
+        true_start = timing_offset + (symbol_length if method == "preamble" else 0)
+        sim_data = {
+            'tx_bits': tx_bits,
+            'tx_symbols': tx_symbols,
+            'rx_signal': rx_signal,
+            'rx_symbols': rx_symbols,
+            'rx_bits': rx_bits,
+            'timing_estimate': data_start,
+            'timing_error': data_start - true_start,
+            'cfo_estimate': sync.cfo,
+            'cfo_error': sync.cfo - cfo,
+            'snr_db': snr_db,
+            'n_bits': n_bits,
+            'modulation': self.modulation
+        }
+
+        return ber, sim_data
+
+    def simulate_fixed_point_transmission(
+            self, n_bits: int, snr_db: float,
+            input_format: Optional["QFormat"] = None,
+            llr_format: Optional["QFormat"] = None) -> Tuple[float, dict]:
+        """
+        Simulate transmission into the fixed-point receiver model.
+
+        The transmitter and channel are floating point; the received stream
+        is quantized to integer IQ and demodulated with a block-floating-point
+        FFT and integer max-log LLRs (see radio_sim.fixed_point). Bits are
+        hard decisions on the LLR signs.
+
+        Args:
+            n_bits: Number of bits to transmit
+            snr_db: SNR in dB
+            input_format: Q-format of the received IQ and FFT outputs
+                (default: QFormat(16, 12))
+            llr_format: Q-format of the LLRs (default: QFormat(8, 2))
+
+        Returns:
+            Tuple of (BER, simulation_data)
+        """
+        from radio_sim.fixed_point import QFormat, fixed_point_demodulate
+
+        if input_format is None:
+            input_format = QFormat(16, 12)
+        if llr_format is None:
+            llr_format = QFormat(8, 2)
+        tx_bits = self.generate_bits(n_bits)
+        tx_symbols = self.modulate(tx_bits)
+        ofdm_symbols = self.generate_ofdm_symbols(tx_symbols)
+        rx_signal = self.add_awgn(ofdm_symbols.ravel(), snr_db)
+
+        receiver = fixed_point_demodulate(
+            rx_signal, self.constellation, self.n_subcarriers,
+            noise_var=10 ** (-snr_db / 10),
+            input_format=input_format, llr_format=llr_format
+        )
+        llr = receiver['llr'][:len(tx_symbols) * self.bits_per_symbol]
+        rx_bits = (llr < 0).astype(np.uint8)
+
+        ber = self.calculate_ber(tx_bits, rx_bits)
+
+        sim_data = {
+            'tx_bits': tx_bits,
+            'tx_symbols': tx_symbols,
+            'rx_signal': rx_signal,
+            'rx_bits': rx_bits,
+            'rx_iq': receiver['rx_iq'],
+            'fft_iq': receiver['fft_iq'],
+            'fft_exponent': receiver['fft_exponent'],
+            'llr': llr,
+            'snr_db': snr_db,
+            'n_bits': n_bits,
+            'modulation': self.modulation
+        }
+
+        return ber, sim_data
+
+    def record_transmission(self, n_bits: int, snr_db: float, base_path: str,
+                            chunk_bits: int = 1 << 20) -> Tuple[str, str]:
+        """
+        Simulate a transmission and record TX and RX IQ streams to disk.
+
+        Bits are generated, modulated and written chunk by chunk, so the
+        capture size is not limited by available memory.
+
+        Args:
+            n_bits: Number of bits to transmit
+            snr_db: SNR in dB
+            base_path: Capture base path; "_tx" and "_rx" suffixes are added
+            chunk_bits: Bits processed per chunk (rounded to whole OFDM symbols)
+
+        Returns:
+            Tuple of (tx_base_path, rx_base_path)
+        """
+        from radio_sim.capture import CaptureWriter
+
+        bits_per_ofdm_symbol = self.bits_per_symbol * self.n_subcarriers
+        chunk_bits = max(1, chunk_bits // bits_per_ofdm_symbol) * bits_per_ofdm_symbol
+
+        metadata: Dict[str, Any] = {
+            'n_subcarriers': self.n_subcarriers,
+            'modulation': self.modulation,
+            'n_bits': n_bits,
+        }
+        tx_path, rx_path = f"{base_path}_tx", f"{base_path}_rx"
+
+        rx_metadata = dict(metadata, snr_db=snr_db)
+        with CaptureWriter(tx_path, description="OFDM TX", **metadata) as tx, \
+                CaptureWriter(rx_path, description="OFDM RX", **rx_metadata) as rx:
+            for start in range(0, n_bits, chunk_bits):
+                bits = self.generate_bits(min(chunk_bits, n_bits - start))
+                tx_signal = self.generate_ofdm_symbols(self.modulate(bits)).ravel()
+                tx.write(tx_signal)
+                rx.write(self.add_awgn(tx_signal, snr_db))
+
+        return tx_path, rx_path
+
+
+SCATTER_LIMIT = 10000
+
 
 def plot_constellation(symbols: np.ndarray, title: str = "Constellation") -> None:
-    """Plot constellation diagram."""
+    """
+    Plot constellation diagram.
+
+    Up to SCATTER_LIMIT symbols are drawn as a scatter plot; larger inputs
+    are drawn as a density heatmap (see radio_sim.plotting).
+    """
+    if len(symbols) > SCATTER_LIMIT:
+        from radio_sim.plotting import ConstellationHistogram
+
+        extent = max(1.5, float(np.percentile(np.abs(symbols), 99.9)))
+        histogram = ConstellationHistogram(extent=extent)
+        histogram.update(symbols)
+        histogram.plot(title=title)
+        plt.show()
+        return
     plt.figure(figsize=(8, 6))
     plt.scatter(symbols.real, symbols.imag, alpha=0.7)
     plt.grid(True)
@@ -0,0 +1,264 @@
+"""
+PAPR analysis and power amplifier models.
+
+Time-domain statistics of OFDM symbols:
+- PAPR per symbol, vectorized over arbitrary symbol batches
+- Oversampled PAPR via a zero-padded IFFT (Nyquist-rate samples
+  underestimate the analog peaks)
+- CCDF curves accumulated from fixed-width histograms, so arbitrarily many
+  symbols can be measured batch by batch without keeping them
+
+Memoryless PA models (Rapp, soft clipping, AM/AM-AM/PM tables) operate on
+whole sample arrays. Amplitudes are relative to the PA saturation level,
+which is 1; apply_backoff() sets the input drive for a given backoff.
+"""
+
+import numpy as np
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from radio_sim.ofdm import OFDMSimulator
+
+
+def papr_db(signal: np.ndarray, axis: int = -1) -> np.ndarray:
+    """
+    Peak-to-average power ratio of each symbol.
+
+    Args:
+        signal: Time-domain samples, one symbol along ``axis``
+        axis: Sample axis
+
+    Returns:
+        PAPR in dB for every symbol in the batch
+    """
+    power = np.abs(signal) ** 2
+    return 10 * np.log10(np.max(power, axis=axis) / np.mean(power, axis=axis))
+
+
+def oversampled_symbols(freq_symbols: np.ndarray, oversampling: int = 4) -> np.ndarray:
+    """
+    Oversampled time-domain OFDM symbols via a zero-padded IFFT.
+
+    Zeros are inserted between the positive and negative frequency halves,
+    so the oversampled waveform interpolates the Nyquist-rate one.
+
+    Args:
+        freq_symbols: Frequency-domain symbols with shape (..., n_subcarriers)
+        oversampling: Oversampling factor
+
+    Returns:
+        Time-domain symbols with shape (..., oversampling * n_subcarriers),
+        scaled to the same average power as generate_ofdm_symbols()
+    """
+    n_subcarriers = freq_symbols.shape[-1]
+    n_fft = oversampling * n_subcarriers
+    half = (n_subcarriers + 1) // 2
+
+    padded = np.zeros(freq_symbols.shape[:-1] + (n_fft,), dtype=np.complex128)
+    padded[..., :half] = freq_symbols[..., :half]
+    upper = n_fft - (n_subcarriers - half)
+    padded[..., upper:] = freq_symbols[..., half:]
+    return np.fft.ifft(padded, axis=-1) * (n_fft / np.sqrt(n_subcarriers))
+
+
+class CCDFAccumulator:
+    """
+    Streaming PAPR CCDF estimator.
+
+    PAPR values are binned into a fixed-width histogram as they arrive; the
+    CCDF is read off the cumulative counts, so memory does not depend on the
+    number of symbols measured.
+    """
+
+    def __init__(self, max_db: float = 16.0, resolution_db: float = 0.01):
+        """
+        Initialize accumulator.
+
+        Args:
+            max_db: Upper edge of the histogram (higher values land in the
+                last bin)
+            resolution_db: Bin width in dB
+        """
+        self.resolution_db = resolution_db
+        self.counts = np.zeros(int(np.ceil(max_db / resolution_db)), dtype=np.int64)
+        self.peak_db = -np.inf
+
+    @property
+    def n_symbols(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, papr_values: np.ndarray) -> None:
+        """Add a batch of PAPR values in dB."""
+        papr_values = np.ravel(papr_values)
+        if papr_values.size == 0:
+            return
+        bins = np.clip(
+            (papr_values / self.resolution_db).astype(np.int64), 0, len(self.counts) - 1
+        )
+        self.counts += np.bincount(bins, minlength=len(self.counts))
+        self.peak_db = max(self.peak_db, float(np.max(papr_values)))
+
+    def merge(self, other: "CCDFAccumulator") -> None:
+        """Combine counts from another accumulator with the same binning."""
+        if other.resolution_db != self.resolution_db or len(other.counts) != len(
+            self.counts
+        ):
+            raise ValueError("Cannot merge accumulators with different binning")
+        self.counts += other.counts
+        self.peak_db = max(self.peak_db, other.peak_db)
+
+    def ccdf(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Complementary CDF of the accumulated PAPR values.
+
+        Returns:
+            Tuple of (thresholds in dB, probability that PAPR exceeds each
+            threshold), to the histogram resolution
+        """
+        if self.n_symbols == 0:
+            raise ValueError("No PAPR values accumulated")
+        thresholds = np.arange(len(self.counts)) * self.resolution_db
+        exceed = np.cumsum(self.counts[::-1])[::-1] / self.n_symbols
+        return thresholds, exceed
+
+    def papr_at(self, probability: float) -> float:
+        """Smallest threshold exceeded with at most the given probability."""
+        thresholds, exceed = self.ccdf()
+        below = np.flatnonzero(exceed <= probability)
+        return (
+            float(thresholds[below[0]])
+            if len(below)
+            else len(self.counts) * self.resolution_db
+        )
+
+
+def measure_papr_ccdf(
+    simulator: "OFDMSimulator",
+    n_symbols: int,
+    oversampling: int = 4,
+    batch_symbols: int = 4096,
+    accumulator: Optional[CCDFAccumulator] = None,
+) -> CCDFAccumulator:
+    """
+    Measure the PAPR CCDF of random OFDM symbols batch by batch.
+
+    Args:
+        simulator: OFDMSimulator providing bits, modulation and FFT size
+        n_symbols: Number of OFDM symbols to measure
+        oversampling: Oversampling factor (1 for Nyquist-rate PAPR)
+        batch_symbols: OFDM symbols generated per batch
+        accumulator: Existing accumulator to add to
+
+    Returns:
+        Accumulator holding the measured PAPR histogram
+    """
+    if accumulator is None:
+        accumulator = CCDFAccumulator()
+    bits_per_ofdm_symbol = simulator.bits_per_symbol * simulator.n_subcarriers
+
+    for start in range(0, n_symbols, batch_symbols):
+        batch = min(batch_symbols, n_symbols - start)
+        data = simulator.modulate(simulator.generate_bits(batch * bits_per_ofdm_symbol))
+        freq_symbols = data.reshape(batch, simulator.n_subcarriers)
+        accumulator.update(papr_db(oversampled_symbols(freq_symbols, oversampling)))
+    return accumulator
+
+
+def rapp(
+    signal: np.ndarray, smoothness: float = 2.0, saturation: float = 1.0
+) -> np.ndarray:
+    """
+    Rapp solid-state PA model (AM/AM only).
+
+    Args:
+        signal: Complex input samples
+        smoothness: Knee sharpness p (large values approach hard clipping)
+        saturation: Output saturation amplitude
+
+    Returns:
+        Amplified samples with unit small-signal gain
+    """
+    amplitude = np.abs(signal)
+    return signal / (1 + (amplitude / saturation) ** (2 * smoothness)) ** (
+        1 / (2 * smoothness)
+    )
+
+
+def soft_clip(signal: np.ndarray, clip_level: float = 1.0) -> np.ndarray:
+    """
+    Amplitude limiter preserving phase.
+
+    Args:
+        signal: Complex input samples
+        clip_level: Maximum output amplitude
+
+    Returns:
+        Samples with amplitude limited to ``clip_level``
+    """
+    amplitude = np.abs(signal)
+    scale = np.minimum(1.0, clip_level / np.maximum(amplitude, np.finfo(float).tiny))
+    return signal * scale
+
+
+class TablePA:
+    """
+    PA model from measured AM/AM and AM/PM tables.
+
+    Output amplitude and phase rotation are linearly interpolated in the
+    input amplitude; inputs beyond the table hold its last entry.
+    """
+
+    def __init__(
+        self,
+        input_amplitude: np.ndarray,
+        output_amplitude: np.ndarray,
+        phase_shift_deg: Optional[np.ndarray] = None,
+    ):
+        """
+        Initialize table model.
+
+        Args:
+            input_amplitude: Increasing input amplitudes
+            output_amplitude: Output amplitude at each input amplitude
+            phase_shift_deg: AM/PM phase rotation in degrees (default: none)
+        """
+        self.input_amplitude = np.asarray(input_amplitude, dtype=np.float64)
+        self.output_amplitude = np.asarray(output_amplitude, dtype=np.float64)
+        if phase_shift_deg is None:
+            phase_shift_deg = np.zeros_like(self.input_amplitude)
+        self.phase_shift = np.deg2rad(np.asarray(phase_shift_deg, dtype=np.float64))
+        if not (
+            len(self.input_amplitude)
+            == len(self.output_amplitude)
+            == len(self.phase_shift)
+        ):
+            raise ValueError("AM/AM and AM/PM tables must have the same length")
+        if np.any(np.diff(self.input_amplitude) <= 0):
+            raise ValueError("Input amplitudes must be strictly increasing")
+
+    def __call__(self, signal: np.ndarray) -> np.ndarray:
+        amplitude = np.abs(signal)
+        gain = np.interp(amplitude, self.input_amplitude, self.output_amplitude)
+        phase = np.angle(signal) + np.interp(
+            amplitude, self.input_amplitude, self.phase_shift
+        )
+        return gain * np.exp(1j * phase)
+
+
+def apply_backoff(
+    signal: np.ndarray, pa: Callable[[np.ndarray], np.ndarray], input_backoff_db: float
+) -> np.ndarray:
+    """
+    Drive a PA with its average input power set below saturation.
+
+    Args:
+        signal: Complex samples at any power level
+        pa: PA model taking and returning sample arrays
+        input_backoff_db: Average input power below saturation (power 1)
+
+    Returns:
+        PA output rescaled by the inverse of the drive gain, so a linear PA
+        returns the input unchanged
+    """
+    drive = np.sqrt(10 ** (-input_backoff_db / 10) / np.mean(np.abs(signal) ** 2))
+    return pa(signal * drive) / drive
@@ -0,0 +1,260 @@
+"""
+Density plots for long simulation runs.
+
+Scatter plots keep one artist vertex per symbol and become unusable beyond
+~1e5 points. Here constellations are accumulated into a fixed 2-D bin grid
+chunk by chunk, so memory and rendering time do not depend on the number of
+symbols, and time-domain and eye-diagram views draw a decimated subset:
+- Time-domain traces are reduced to a min/max envelope per pixel-sized
+  bucket, which keeps every peak visible
+- Eye diagrams overlay a bounded number of evenly spaced traces
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from radio_sim.ofdm import OFDMSimulator
+
+
+class ConstellationHistogram:
+    """
+    Streaming 2-D histogram of complex symbols.
+
+    Symbols are binned on a square grid over [-extent, extent] in both I and
+    Q as they arrive; symbols outside the grid are counted but not binned.
+    """
+
+    def __init__(self, extent: float = 1.5, bins: int = 256):
+        """
+        Initialize histogram.
+
+        Args:
+            extent: Half-width of the grid in constellation units
+            bins: Number of bins along each axis
+        """
+        self.extent = float(extent)
+        self.bins = bins
+        self.counts = np.zeros((bins, bins), dtype=np.int64)
+        self.outside = 0
+
+    @property
+    def n_symbols(self) -> int:
+        return int(self.counts.sum()) + self.outside
+
+    def update(self, symbols: np.ndarray) -> None:
+        """Add a chunk of complex symbols."""
+        symbols = np.ravel(symbols)
+        if symbols.size == 0:
+            return
+        scale = self.bins / (2 * self.extent)
+        i = np.floor((symbols.real + self.extent) * scale).astype(np.int64)
+        q = np.floor((symbols.imag + self.extent) * scale).astype(np.int64)
+        inside = (i >= 0) & (i < self.bins) & (q >= 0) & (q < self.bins)
+        # Row index is Q so the array displays with I along the x axis
+        flat = q[inside] * self.bins + i[inside]
+        self.counts += np.bincount(flat, minlength=self.bins**2).reshape(
+            self.bins, self.bins
+        )
+        self.outside += int(symbols.size - np.count_nonzero(inside))
+
+    def merge(self, other: "ConstellationHistogram") -> None:
+        """Combine counts from another histogram with the same grid."""
+        if other.extent != self.extent or other.bins != self.bins:
+            raise ValueError("Cannot merge histograms with different grids")
+        self.counts += other.counts
+        self.outside += other.outside
+
+    def density(self) -> np.ndarray:
+        """Fraction of all accumulated symbols in each bin (rows are Q, columns I)."""
+        if self.n_symbols == 0:
+            raise ValueError("No symbols accumulated")
+        return self.counts / self.n_symbols
+
+    def plot(
+        self,
+        ax: Optional[plt.Axes] = None,
+        title: str = "Constellation",
+        reference: Optional[np.ndarray] = None,
+    ) -> plt.Axes:
+        """
+        Draw the histogram as a log-scaled heatmap.
+
+        Args:
+            ax: Axes to draw on (default: a new figure)
+            title: Axes title
+            reference: Ideal constellation points to mark on top
+
+        Returns:
+            The axes drawn on
+        """
+        if ax is None:
+            _, ax = plt.subplots(figsize=(8, 6))
+        counts = np.ma.masked_equal(self.counts, 0)
+        image = ax.imshow(
+            counts,
+            origin="lower",
+            cmap="viridis",
+            interpolation="nearest",
+            extent=(-self.extent, self.extent, -self.extent, self.extent),
+            norm=LogNorm(vmin=1, vmax=max(int(self.counts.max()), 1)),
+        )
+        plt.colorbar(image, ax=ax, label="Symbols per bin")
+        if reference is not None:
+            ax.scatter(
+                reference.real, reference.imag, s=60, c="red", marker="x", linewidth=2
+            )
+        ax.set_xlabel("In-phase")
+        ax.set_ylabel("Quadrature")
+        ax.set_title(f"{title} ({self.n_symbols:,} symbols)")
+        ax.set_aspect("equal")
+        return ax
+
+
+def measure_constellation(
+    simulator: "OFDMSimulator",
+    n_symbols: int,
+    snr_db: float,
+    batch_symbols: int = 4096,
+    histogram: Optional[ConstellationHistogram] = None,
+) -> ConstellationHistogram:
+    """
+    Accumulate received constellation points of random OFDM symbols batch by batch.
+
+    Args:
+        simulator: OFDMSimulator providing bits, modulation and FFT size
+        n_symbols: Number of OFDM symbols to simulate
+        snr_db: Signal-to-noise ratio in dB
+        batch_symbols: OFDM symbols simulated per batch
+        histogram: Existing histogram to add to
+
+    Returns:
+        Histogram of the equalizer-free received data symbols
+    """
+    if histogram is None:
+        histogram = ConstellationHistogram()
+    bits_per_ofdm_symbol = simulator.bits_per_symbol * simulator.n_subcarriers
+
+    for start in range(0, n_symbols, batch_symbols):
+        batch = min(batch_symbols, n_symbols - start)
+        data = simulator.modulate(simulator.generate_bits(batch * bits_per_ofdm_symbol))
+        rx_signal = simulator.add_awgn(
+            simulator.generate_ofdm_symbols(data).ravel(), snr_db
+        )
+        histogram.update(simulator.demodulate_ofdm(rx_signal.reshape(batch, -1)))
+    return histogram
+
+
+def minmax_decimate(
+    signal: np.ndarray, max_points: int = 2000
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a real trace to a min/max envelope for plotting.
+
+    The trace is cut into max_points / 2 buckets and each bucket contributes
+    its minimum and maximum in time order, so peaks survive decimation.
+
+    Args:
+        signal: Real samples
+        max_points: Maximum number of points returned
+
+    Returns:
+        Tuple of (sample indices, values)
+    """
+    signal = np.asarray(signal)
+    n_buckets = max_points // 2
+    if len(signal) <= max_points or n_buckets < 1:
+        return np.arange(len(signal)), signal
+
+    bucket_size = int(np.ceil(len(signal) / n_buckets))
+    n_buckets = len(signal) // bucket_size
+    buckets = signal[: n_buckets * bucket_size].reshape(n_buckets, bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+    lo = np.argmin(buckets, axis=1)
+    hi = np.argmax(buckets, axis=1)
+
+    first, second = np.minimum(lo, hi), np.maximum(lo, hi)
+    indices = np.stack([offsets + first, offsets + second], axis=1).ravel()
+    tail = np.arange(n_buckets * bucket_size, len(signal))
+    if len(tail):
+        tail = tail[[np.argmin(signal[tail]), np.argmax(signal[tail])]]
+        indices = np.concatenate([indices, np.unique(tail)])
+    return indices, signal[indices]
+
+
+def eye_traces(
+    signal: np.ndarray, samples_per_symbol: int, span: int = 2, max_traces: int = 200
+) -> np.ndarray:
+    """
+    Cut a stream into overlapping eye-diagram traces, keeping a bounded subset.
+
+    Args:
+        signal: Real samples
+        samples_per_symbol: Samples per symbol period
+        span: Symbol periods per trace
+        max_traces: Maximum number of traces returned (evenly spaced
+            through the stream)
+
+    Returns:
+        Traces with shape (n_traces, span * samples_per_symbol + 1)
+    """
+    signal = np.asarray(signal)
+    length = span * samples_per_symbol + 1
+    n_available = (len(signal) - length) // samples_per_symbol + 1
+    if n_available < 1:
+        raise ValueError("Stream is shorter than one eye-diagram trace")
+    starts = (
+        np.unique(
+            np.linspace(0, n_available - 1, min(max_traces, n_available)).astype(
+                np.int64
+            )
+        )
+        * samples_per_symbol
+    )
+    return signal[starts[:, np.newaxis] + np.arange(length)]
+
+
+def plot_time_domain(
+    signal: np.ndarray,
+    ax: Optional[plt.Axes] = None,
+    title: str = "Time-Domain Signal",
+    max_points: int = 2000,
+) -> plt.Axes:
+    """Plot the real and imaginary parts of a stream as decimated envelopes."""
+    if ax is None:
+        _, ax = plt.subplots(figsize=(10, 4))
+    for part, style, label in (
+        (signal.real, "b-", "Real"),
+        (signal.imag, "r--", "Imaginary"),
+    ):
+        indices, values = minmax_decimate(part, max_points)
+        ax.plot(indices, values, style, linewidth=0.8, label=label)
+    ax.set_xlabel("Sample Index")
+    ax.set_ylabel("Amplitude")
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    return ax
+
+
+def plot_eye_diagram(
+    signal: np.ndarray,
+    samples_per_symbol: int,
+    ax: Optional[plt.Axes] = None,
+    title: str = "Eye Diagram",
+    span: int = 2,
+    max_traces: int = 200,
+) -> plt.Axes:
+    """Overlay a bounded number of eye-diagram traces of the real part of a stream."""
+    if ax is None:
+        _, ax = plt.subplots(figsize=(8, 5))
+    traces = eye_traces(np.real(signal), samples_per_symbol, span, max_traces)
+    time = np.arange(traces.shape[1]) / samples_per_symbol
+    ax.plot(time, traces.T, "b-", alpha=0.2, linewidth=0.8)
+    ax.set_xlabel("Time (symbols)")
+    ax.set_ylabel("Amplitude")
+    ax.set_title(f"{title} ({len(traces)} traces)")
+    ax.grid(True, alpha=0.3)
+    return ax
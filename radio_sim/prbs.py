@@ -0,0 +1,87 @@
+"""
+Pseudo-random binary sequences (PRBS / PN sequences).
+
+Deterministic test patterns for bit-exact comparison with lab equipment.
+PN9, PN11, PN15 and PN23 follow ITU-T O.150: its generator polynomials, and
+the inverted output the standard specifies for PN15 and PN23. PN7 is not an
+O.150 pattern and uses the common x^7 + x^6 + 1 polynomial. The shift
+register starts from the all-ones state.
+
+The LFSR recurrence s[n] = s[n - a] ^ s[n - b] also holds with both lags
+scaled by any power of two (the generator polynomial squared over GF(2)), so
+a full period is produced in O(log period) vectorized XOR steps instead of
+one Python iteration per bit.
+"""
+
+import numpy as np
+from functools import lru_cache
+
+# order -> (a, b) for the generator polynomial x^a + x^b + 1
+PRBS_POLYNOMIALS = {
+    7: (7, 6),
+    9: (9, 5),
+    11: (11, 9),
+    15: (15, 14),
+    23: (23, 18),
+}
+
+# Orders whose O.150 pattern is the inverted register output
+PRBS_INVERTED = frozenset({15, 23})
+
+
+@lru_cache(maxsize=len(PRBS_POLYNOMIALS))
+def prbs_period(order: int) -> np.ndarray:
+    """
+    One full period (2**order - 1 bits) of a PRBS.
+
+    Args:
+        order: PRBS order (e.g. 9 for PN9, 23 for PN23)
+
+    Returns:
+        Read-only uint8 bit array
+    """
+    if order not in PRBS_POLYNOMIALS:
+        raise ValueError(f"Unsupported PRBS order: {order}")
+    a, b = PRBS_POLYNOMIALS[order]
+    length = 2**order - 1
+
+    bits = np.zeros(length + a, dtype=np.uint8)
+    bits[:a] = 1
+    known = a
+    while known < length:
+        # Largest power-of-two lag scaling that only reads already-known bits
+        scale = 1 << max(0, (known // a).bit_length() - 1)
+        count = min(scale * b, length - known)
+        lag_a, lag_b = scale * a, scale * b
+        target = slice(known, known + count)
+        from_a = slice(known - lag_a, known - lag_a + count)
+        from_b = slice(known - lag_b, known - lag_b + count)
+        bits[target] = bits[from_a] ^ bits[from_b]
+        known += count
+
+    period = bits[:length]
+    if order in PRBS_INVERTED:
+        period ^= 1
+    period.flags.writeable = False
+    return period
+
+
+class PRBSGenerator:
+    """Stateful PRBS source that continues the sequence across calls."""
+
+    def __init__(self, order: int = 9):
+        """
+        Initialize PRBS generator.
+
+        Args:
+            order: PRBS order (see PRBS_POLYNOMIALS)
+        """
+        self.order = order
+        self.period = prbs_period(order)
+        self.position = 0
+
+    def next_bits(self, n_bits: int) -> np.ndarray:
+        """Return the next ``n_bits`` of the sequence."""
+        indices = (self.position + np.arange(n_bits)) % len(self.period)
+        self.position = (self.position + n_bits) % len(self.period)
+        return self.period[indices]
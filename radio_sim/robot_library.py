@@ -0,0 +1,143 @@
+"""
+Robot Framework keyword library for the simulation pipeline.
+
+Runs simulations in the Robot process instead of spawning
+``python -m radio_sim.main`` per test case, so the interpreter, NumPy and
+matplotlib are imported once per suite and keywords check the result
+dictionary directly instead of scraping stdout.
+
+Usage in a suite::
+
+    Library    radio_sim.robot_library.RadioSimLibrary
+
+    ${results}=    Run OFDM Sweep    modulation=QPSK    bits=20000
+    ...    snr_start=15    snr_stop=20
+    BER At SNR Should Be Below    20    1e-5
+
+Sweeps are deterministic for a given configuration, so results are cached
+for the lifetime of the library (one instance per Robot run) and repeated
+sweeps across test cases are free.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from radio_sim import __version__
+from radio_sim.main import run_simulation
+
+
+class RadioSimLibrary:
+    """Keywords for running OFDM sweeps and checking their BER."""
+
+    ROBOT_LIBRARY_SCOPE = "GLOBAL"
+    ROBOT_LIBRARY_VERSION = __version__
+
+    def __init__(self) -> None:
+        """Initialize with an empty result cache."""
+        self._cache: Dict[tuple, dict] = {}
+        self._last: Optional[dict] = None
+
+    def run_ofdm_sweep(
+        self,
+        modulation: str = "QPSK",
+        bits: int = 10000,
+        snr_start: int = 0,
+        snr_stop: int = 20,
+        snr_step: int = 2,
+        seed: int = 42,
+        bit_source: str = "random",
+    ) -> dict:
+        """
+        Run an SNR sweep and return its results dictionary.
+
+        The results become the default for the checking keywords. Results
+        for a configuration already run in this suite are reused.
+
+        Example:
+        | ${results}= | Run OFDM Sweep | modulation=16QAM | snr_start=15 | snr_stop=25 |
+        | Should Be Equal | ${results}[modulation] | 16QAM |
+        """
+        key = (modulation, bits, snr_start, snr_stop, snr_step, seed, bit_source)
+        if key not in self._cache:
+            self._cache[key] = run_simulation(
+                modulation=modulation,
+                n_bits=bits,
+                snr_range=(snr_start, snr_stop, snr_step),
+                seed=seed,
+                bit_source=bit_source,
+            )
+        self._last = self._cache[key]
+        return self._last
+
+    def clear_simulation_cache(self) -> None:
+        """Forget all cached sweep results."""
+        self._cache.clear()
+        self._last = None
+
+    def _results(self, results: Optional[dict]) -> dict:
+        if results is not None:
+            return results
+        if self._last is None:
+            raise AssertionError("No sweep has been run; use 'Run OFDM Sweep' first")
+        return self._last
+
+    def ber_at_snr(self, snr: float, results: Optional[dict] = None) -> float:
+        """
+        Return the BER measured at ``snr`` dB.
+
+        Uses the last sweep unless ``results`` is given. Fails if the SNR
+        was not part of the sweep.
+        """
+        results = self._results(results)
+        matches = np.flatnonzero(np.isclose(results["snr_values"], snr))
+        if len(matches) == 0:
+            raise AssertionError(
+                f"SNR {snr} dB not in sweep "
+                f"({', '.join(str(s) for s in results['snr_values'])})"
+            )
+        return float(results["ber_values"][matches[0]])
+
+    def ber_at_snr_should_be_below(
+        self, snr: float, threshold: float, results: Optional[dict] = None
+    ) -> None:
+        """
+        Fail unless the BER at ``snr`` dB is below ``threshold``.
+
+        Example:
+        | BER At SNR Should Be Below | 20 | 1e-5 |
+        """
+        ber = self.ber_at_snr(snr, results)
+        if not ber < threshold:
+            raise AssertionError(
+                f"BER {ber:.2e} at {snr} dB is not below {threshold:.2e}"
+            )
+
+    def ber_should_be_below_from_snr(
+        self, snr: float, threshold: float, results: Optional[dict] = None
+    ) -> None:
+        """Fail if any SNR point at or above ``snr`` dB has BER >= ``threshold``."""
+        results = self._results(results)
+        failures = [
+            f"{ber:.2e} at {snr_db} dB"
+            for snr_db, ber in zip(results["snr_values"], results["ber_values"])
+            if snr_db >= snr and not ber < threshold
+        ]
+        if failures:
+            raise AssertionError(
+                f"BER not below {threshold:.2e}: {', '.join(failures)}"
+            )
+
+    def ber_should_decrease_with_snr(self, results: Optional[dict] = None) -> None:
+        """Fail if BER ever increases from one SNR point to the next."""
+        results = self._results(results)
+        ber = np.asarray(results["ber_values"])
+        increases = np.flatnonzero(np.diff(ber) > 0)
+        if len(increases):
+            snr_values = results["snr_values"]
+            raise AssertionError(
+                "BER increases between "
+                + ", ".join(
+                    f"{snr_values[i]} and {snr_values[i + 1]} dB" for i in increases
+                )
+            )
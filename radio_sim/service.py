@@ -0,0 +1,448 @@
+"""
+Asyncio-based simulation service.
+
+Runs a long-lived local HTTP service (TCP or Unix socket, stdlib only) that
+wraps OFDMSimulator, so test harnesses can reuse a warm interpreter instead of
+cold-starting ``python -m radio_sim`` for every scenario.
+
+Endpoints:
+- GET /health: liveness check
+- POST /simulate: JSON sweep request, answered with newline-delimited JSON
+  (one line per SNR point as it completes, then a summary line)
+
+A sweep runs its SNR points in order on one random stream, like
+run_simulation, so the service returns the same BERs as the CLI for the same
+configuration. Each point is one process-pool job that resumes from the
+simulator state the previous point ended in. Concurrent requests with an
+identical configuration share a single sweep instead of running it once per
+request.
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterator, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from radio_sim.checkpoint import restore_simulator_state, simulator_state
+from radio_sim.ofdm import OFDMSimulator
+
+SUPPORTED_MODULATIONS = ("QPSK", "16QAM")
+MAX_REQUEST_BYTES = 64 * 1024
+
+
+class SweepConfig(NamedTuple):
+    """Hashable sweep configuration, mirroring run_simulation arguments."""
+
+    modulation: str = "QPSK"
+    n_bits: int = 10000
+    snr_start: float = 0
+    snr_stop: float = 20
+    snr_step: float = 2
+    seed: int = 42
+
+    @property
+    def snr_values(self) -> np.ndarray:
+        """SNR points in dB, generated the same way as run_simulation."""
+        return np.arange(self.snr_start, self.snr_stop + self.snr_step, self.snr_step)
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "SweepConfig":
+        """
+        Build a configuration from a decoded JSON request body.
+
+        Args:
+            payload: Request fields; ``snr_range`` is ``[start, stop, step]``
+
+        Returns:
+            Validated sweep configuration
+
+        Raises:
+            ValueError: If a field is missing its expected type or range
+        """
+        if not isinstance(payload, dict):
+            raise ValueError("Request body must be a JSON object")
+
+        snr_range = payload.get("snr_range", (0, 20, 2))
+        if len(snr_range) != 3:
+            raise ValueError("snr_range must be [start, stop, step]")
+
+        config = cls(
+            modulation=str(payload.get("modulation", "QPSK")),
+            n_bits=int(payload.get("n_bits", 10000)),
+            snr_start=snr_range[0],
+            snr_stop=snr_range[1],
+            snr_step=snr_range[2],
+            seed=int(payload.get("seed", 42)),
+        )
+
+        if config.modulation not in SUPPORTED_MODULATIONS:
+            raise ValueError(f"Unsupported modulation: {config.modulation}")
+        if config.n_bits <= 0:
+            raise ValueError("n_bits must be positive")
+        if config.snr_step <= 0:
+            raise ValueError("snr_range step must be positive")
+
+        return config
+
+
+def simulate_point(
+    modulation: str, n_bits: int, snr_db: float, seed: int, state: Optional[dict] = None
+) -> Tuple[dict, dict]:
+    """
+    Simulate one SNR point of a sweep in a worker process.
+
+    Args:
+        modulation: Modulation scheme
+        n_bits: Number of bits to simulate
+        snr_db: SNR in dB
+        seed: Random seed of the sweep
+        state: Simulator state after the previous point (None for the first)
+
+    Returns:
+        Tuple of (JSON-serialisable point result, simulator state after the point)
+    """
+    simulator = OFDMSimulator(modulation=modulation, seed=seed)
+    if state is not None:
+        restore_simulator_state(simulator, state)
+    ber, _ = simulator.simulate_transmission(n_bits, snr_db)
+    return {"snr_db": snr_db, "ber": ber}, simulator_state(simulator)
+
+
+class _SharedSweep:
+    """Results of one in-flight sweep, read by every request that joined it."""
+
+    def __init__(self) -> None:
+        self.results: List[dict] = []
+        self.error: Optional[Exception] = None
+        self.done = False
+        self.changed = asyncio.Condition()
+        self.task: Optional[asyncio.Task] = None
+
+    async def publish(
+        self,
+        point: Optional[dict] = None,
+        error: Optional[Exception] = None,
+        done: bool = False,
+    ) -> None:
+        """Record a point or the end of the sweep and wake the readers."""
+        async with self.changed:
+            if point is not None:
+                self.results.append(point)
+            self.error = error
+            self.done = done
+            self.changed.notify_all()
+
+    async def read(self) -> AsyncIterator[dict]:
+        """Yield all points in SNR order, including those computed before joining."""
+        index = 0
+        while True:
+            async with self.changed:
+                await self.changed.wait_for(
+                    lambda: len(self.results) > index or self.done
+                )
+                points = self.results[index:]
+                finished = self.done
+            for point in points:
+                yield point
+            index += len(points)
+            if finished and index == len(self.results):
+                if self.error is not None:
+                    raise self.error
+                return
+
+
+class SimulationService:
+    """
+    Request-coalescing front end for OFDM sweeps.
+
+    Work is submitted to an executor (a process pool by default) so CPU-bound
+    simulation never blocks the event loop. In-flight sweeps are keyed by
+    their full configuration; a request for a sweep that is already running
+    reads the existing sweep's results.
+    """
+
+    def __init__(
+        self, executor: Optional[Executor] = None, max_workers: Optional[int] = None
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            executor: Executor for simulation work (default: process pool)
+            max_workers: Pool size when creating the default executor
+        """
+        self._owns_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(max_workers=max_workers)
+        self._inflight: Dict[SweepConfig, _SharedSweep] = {}
+        self.points_computed = 0
+
+    def _shared_sweep(self, config: SweepConfig) -> _SharedSweep:
+        """Return the in-flight sweep for a configuration, starting it if needed."""
+        shared = self._inflight.get(config)
+        if shared is None:
+            shared = _SharedSweep()
+            self._inflight[config] = shared
+            # The sweep runs as its own task, so a disconnecting client cannot
+            # cancel work another request is still reading
+            shared.task = asyncio.create_task(self._run_sweep(config, shared))
+            shared.task.add_done_callback(lambda _: self._inflight.pop(config, None))
+        return shared
+
+    async def _run_sweep(self, config: SweepConfig, shared: _SharedSweep) -> None:
+        """Simulate the points of a sweep in order, carrying the random state."""
+        loop = asyncio.get_running_loop()
+        state = None
+        try:
+            for snr_db in config.snr_values:
+                point, state = await loop.run_in_executor(
+                    self.executor,
+                    simulate_point,
+                    config.modulation,
+                    config.n_bits,
+                    float(snr_db),
+                    config.seed,
+                    state,
+                )
+                self.points_computed += 1
+                await shared.publish(point)
+        except Exception as e:
+            await shared.publish(error=e, done=True)
+        else:
+            await shared.publish(done=True)
+
+    async def sweep(self, config: SweepConfig) -> AsyncIterator[dict]:
+        """
+        Run a sweep, yielding per-SNR results in SNR order.
+
+        Args:
+            config: Sweep configuration
+
+        Yields:
+            Point results with ``snr_db`` and ``ber`` keys
+        """
+        async for point in self._shared_sweep(config).read():
+            yield point
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve a single HTTP/1.1 request and close the connection."""
+        try:
+            try:
+                method, path, body = await _read_request(reader)
+            except (ValueError, asyncio.IncompleteReadError) as e:
+                await _send_json(writer, 400, {"error": str(e)})
+                return
+
+            if method == "GET" and path == "/health":
+                await _send_json(writer, 200, {"status": "ok"})
+            elif method == "POST" and path == "/simulate":
+                await self._handle_simulate(writer, body)
+            else:
+                await _send_json(
+                    writer, 404, {"error": f"No route for {method} {path}"}
+                )
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_simulate(self, writer: asyncio.StreamWriter, body: bytes) -> None:
+        """Validate a sweep request and stream its results back."""
+        try:
+            config = SweepConfig.from_dict(json.loads(body or b"{}"))
+        except (ValueError, TypeError) as e:
+            await _send_json(writer, 400, {"error": str(e)})
+            return
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/x-ndjson\r\n"
+            b"Transfer-Encoding: chunked\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+
+        results = {}
+        try:
+            async for point in self.sweep(config):
+                results[point["snr_db"]] = point["ber"]
+                await _write_chunk(writer, point)
+        except Exception as e:
+            await _write_chunk(writer, {"error": f"Simulation failed - {e}"})
+        else:
+            snr_values = sorted(results)
+            await _write_chunk(
+                writer,
+                {
+                    "summary": True,
+                    "snr_values": snr_values,
+                    "ber_values": [results[snr] for snr in snr_values],
+                    "modulation": config.modulation,
+                    "n_bits": config.n_bits,
+                    "seed": config.seed,
+                },
+            )
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 8765, unix_path: Optional[str] = None
+    ) -> asyncio.AbstractServer:
+        """
+        Start listening on TCP, or on a Unix socket if ``unix_path`` is set.
+
+        Returns:
+            The running asyncio server
+        """
+        if unix_path:
+            return await asyncio.start_unix_server(
+                self.handle_connection, path=unix_path
+            )
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def close(self) -> None:
+        """Shut down the executor if the service created it."""
+        if self._owns_executor:
+            self.executor.shutdown(cancel_futures=True)
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+    """Parse request line, headers and body from a client stream."""
+    request_line = await reader.readline()
+    parts = request_line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise ValueError("Malformed request line")
+    method, path, _ = parts
+
+    content_length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            content_length = int(value.strip())
+
+    if content_length > MAX_REQUEST_BYTES:
+        raise ValueError("Request body too large")
+    body = await reader.readexactly(content_length) if content_length else b""
+    return method.upper(), path, body
+
+
+async def _send_json(writer: asyncio.StreamWriter, status: int, payload: dict) -> None:
+    """Send a complete, non-streamed JSON response."""
+    body = json.dumps(payload).encode()
+    reason = http.client.responses.get(status, "")
+    writer.write(
+        f"HTTP/1.1 {status} {reason}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+
+
+async def _write_chunk(writer: asyncio.StreamWriter, payload: dict) -> None:
+    """Write one NDJSON line as an HTTP chunk."""
+    line = json.dumps(payload).encode() + b"\n"
+    writer.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+    await writer.drain()
+
+
+def request_sweep(
+    config: SweepConfig,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    timeout: float = 60.0,
+) -> Iterator[dict]:
+    """
+    Client helper: stream a sweep from a running service.
+
+    Args:
+        config: Sweep configuration
+        host: Service host
+        port: Service TCP port
+        timeout: Socket timeout in seconds
+
+    Yields:
+        Decoded NDJSON lines (points, then the summary)
+
+    Raises:
+        RuntimeError: If the service rejects the request or reports an error
+    """
+    body = json.dumps(
+        {
+            "modulation": config.modulation,
+            "n_bits": config.n_bits,
+            "snr_range": [config.snr_start, config.snr_stop, config.snr_step],
+            "seed": config.seed,
+        }
+    )
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        conn.request(
+            "POST", "/simulate", body=body, headers={"Content-Type": "application/json"}
+        )
+        response = conn.getresponse()
+        if response.status != 200:
+            raise RuntimeError(
+                f"Service returned {response.status}: {response.read().decode()}"
+            )
+        for line in response:
+            message = json.loads(line)
+            if "error" in message:
+                raise RuntimeError(message["error"])
+            yield message
+    finally:
+        conn.close()
+
+
+async def serve(
+    host: str, port: int, unix_path: Optional[str], workers: Optional[int]
+) -> None:
+    """Run the service until cancelled."""
+    service = SimulationService(max_workers=workers)
+    server = await service.start(host, port, unix_path)
+    where = unix_path or f"http://{host}:{port}"
+    print(f"5G PHY simulation service listening on {where}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main() -> int:
+    """Main entry point for the service CLI."""
+    parser = argparse.ArgumentParser(description="5G PHY OFDM Simulation Service")
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8765, help="TCP port (default: 8765)"
+    )
+    parser.add_argument(
+        "--unix", metavar="PATH", help="Listen on a Unix socket instead of TCP"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+Shared-memory transport for multi-process simulation.
+
+Large NumPy arrays (constellations, channel realizations, pilot/LMMSE tables,
+result buffers) are placed in ``multiprocessing.shared_memory`` segments once
+by the parent. Workers receive only small picklable SharedArraySpec records,
+attach to the segments zero-copy, and write results in place into
+preallocated shared output arrays.
+
+Lifecycle: the parent's SharedArrayPool owns every segment and unlinks all of
+them when it is closed (context manager exit, garbage collection or
+interpreter exit). Workers only ever attach and close, so a crashing worker
+cannot leak a segment; if the parent itself is killed, the multiprocessing
+resource tracker unlinks whatever it created.
+"""
+
+import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from radio_sim.ofdm import OFDMSimulator
+
+
+class SharedArraySpec(NamedTuple):
+    """Picklable description of an array living in shared memory."""
+
+    name: str
+    shape: tuple
+    dtype: str
+
+
+def _attach_segment(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without taking ownership of it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _release(segments: Sequence[shared_memory.SharedMemory], unlink: bool) -> None:
+    """Close (and optionally unlink) segments, ignoring already-released ones."""
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            # A view is still exported; the mapping is freed when it dies
+            pass
+        if unlink:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedArrayPool:
+    """
+    Owner of a set of named shared-memory arrays.
+
+    Arrays are addressed by key; ``specs`` maps keys to SharedArraySpec
+    records that can be sent to workers.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._segments: List[shared_memory.SharedMemory] = []
+        self.arrays: Dict[str, np.ndarray] = {}
+        self.specs: Dict[str, SharedArraySpec] = {}
+        # Unlink even if close() is never called explicitly
+        self._finalizer = weakref.finalize(self, _release, self._segments, True)
+
+    def create(
+        self,
+        key: str,
+        shape: tuple,
+        dtype: DTypeLike = np.float64,
+        fill: Optional[complex] = 0,
+    ) -> np.ndarray:
+        """
+        Allocate a shared array.
+
+        Args:
+            key: Name used to look the array up in this pool
+            shape: Array shape
+            dtype: Array dtype
+            fill: Initial value (None leaves memory uninitialized)
+
+        Returns:
+            Array view backed by the new segment
+        """
+        if key in self.specs:
+            raise ValueError(f"Shared array '{key}' already exists")
+        array_dtype = np.dtype(dtype)
+        shape = tuple(int(n) for n in np.atleast_1d(shape))
+        size = max(1, int(np.prod(shape)) * array_dtype.itemsize)
+
+        segment = shared_memory.SharedMemory(create=True, size=size)
+        self._segments.append(segment)
+
+        array: np.ndarray = np.ndarray(shape, dtype=array_dtype, buffer=segment.buf)
+        if fill is not None:
+            array[...] = fill
+        self.arrays[key] = array
+        self.specs[key] = SharedArraySpec(segment.name, shape, array_dtype.str)
+        return array
+
+    def share(self, key: str, array: np.ndarray) -> np.ndarray:
+        """Copy an existing array into a new shared segment."""
+        array = np.asarray(array)
+        shared = self.create(key, array.shape, array.dtype, fill=None)
+        shared[...] = array
+        return shared
+
+    def close(self) -> None:
+        """Release and unlink every segment owned by the pool."""
+        self.arrays.clear()
+        self.specs.clear()
+        self._finalizer()
+
+    def __enter__(self) -> "SharedArrayPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+@contextmanager
+def attach_arrays(
+    specs: Mapping[str, SharedArraySpec]
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Attach to shared arrays from a worker process.
+
+    Args:
+        specs: Mapping of key to SharedArraySpec (e.g. SharedArrayPool.specs)
+
+    Yields:
+        Mapping of key to array views; segments are closed (not unlinked)
+        on exit, including when the worker raises
+    """
+    segments: List[shared_memory.SharedMemory] = []
+    arrays: Dict[str, np.ndarray] = {}
+    try:
+        for key, spec in specs.items():
+            segment = _attach_segment(spec.name)
+            segments.append(segment)
+            arrays[key] = np.ndarray(
+                spec.shape, dtype=np.dtype(spec.dtype), buffer=segment.buf
+            )
+        yield arrays
+    finally:
+        # Drop the views so the segments can be closed
+        arrays.clear()
+        _release(segments, unlink=False)
+
+
+def _sweep_point(
+    specs: Mapping[str, SharedArraySpec],
+    index: int,
+    modulation: str,
+    n_bits: int,
+    seed: np.random.SeedSequence,
+) -> None:
+    """Worker: simulate one SNR point, writing counters into shared outputs."""
+    with attach_arrays(specs) as arrays:
+        simulator = OFDMSimulator(modulation=modulation, seed=seed)
+        # Use the parent's precomputed table rather than a private copy
+        simulator.constellation = arrays["constellation"]
+
+        snr_db = float(arrays["snr_values"][index])
+        _, sim_data = simulator.simulate_transmission(n_bits, snr_db)
+        rx_bits = sim_data["rx_bits"]
+        arrays["errors"][index] = np.count_nonzero(
+            sim_data["tx_bits"][: len(rx_bits)] != rx_bits
+        )
+        arrays["bits"][index] = len(rx_bits)
+
+
+def parallel_ber_sweep(
+    modulation: str = "QPSK",
+    n_bits: int = 10000,
+    snr_values: Sequence[float] = (0, 5, 10, 15, 20),
+    seed: int = 42,
+    max_workers: Optional[int] = None,
+) -> dict:
+    """
+    Run an SNR sweep across a process pool using shared-memory I/O.
+
+    Each SNR point is seeded from ``SeedSequence(seed).spawn``, so results do
+    not depend on worker count or scheduling (they differ from the
+    sequential single-stream run_simulation).
+
+    Args:
+        modulation: Modulation scheme
+        n_bits: Number of bits per SNR point
+        snr_values: SNR points in dB
+        seed: Root random seed
+        max_workers: Worker processes (default: CPU count)
+
+    Returns:
+        Dictionary with simulation results
+    """
+    snr_array = np.asarray(snr_values, dtype=np.float64)
+    seeds = np.random.SeedSequence(seed).spawn(len(snr_array))
+
+    with SharedArrayPool() as pool:
+        pool.share("constellation", OFDMSimulator(modulation=modulation).constellation)
+        pool.share("snr_values", snr_array)
+        errors = pool.create("errors", (len(snr_array),), np.int64)
+        bits = pool.create("bits", (len(snr_array),), np.int64)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _sweep_point, pool.specs, index, modulation, n_bits, seeds[index]
+                )
+                for index in range(len(snr_array))
+            ]
+            for future in futures:
+                future.result()
+
+        ber_values = errors / np.maximum(bits, 1)
+
+    return {
+        "snr_values": snr_array,
+        "ber_values": ber_values,
+        "modulation": modulation,
+        "n_bits": n_bits,
+        "seed": seed,
+    }
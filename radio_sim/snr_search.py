@@ -0,0 +1,174 @@
+"""
+Target-BER SNR search.
+
+Answers "what SNR achieves BER X for this configuration?" with a handful of
+adaptive simulation points instead of a fine uniform sweep:
+1. Bracket the target between an SNR above and below it
+2. Fit a monotone curve to log10(BER) through every point simulated so far
+3. Probe where the curve crosses the target, safeguarded towards bisection
+4. Stop once the bracket is narrower than the requested tolerance
+"""
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+from scipy.optimize import brentq
+from typing import Callable, Dict, Optional, Tuple
+
+from radio_sim.ofdm import OFDMSimulator
+
+# Probes are kept at least this fraction of the bracket width away from its
+# ends so every step shrinks the bracket even when the fit is poor
+_SAFEGUARD = 0.1
+
+
+def _config_ber_function(config: dict, target_ber: float) -> Callable[[float], float]:
+    """
+    Build a deterministic SNR -> BER function from a run_simulation config.
+
+    Raises:
+        ValueError: If the config simulates too few bits to resolve target_ber
+    """
+    n_bits = config.get("n_bits", 10000)
+    if target_ber * n_bits < 1:
+        raise ValueError(
+            f"{n_bits} bits cannot resolve BER {target_ber:.1e}; "
+            f"use at least {int(np.ceil(1 / target_ber))} bits"
+        )
+    modulation = config.get("modulation", "QPSK")
+    seed = config.get("seed", 42)
+    bit_source = config.get("bit_source", "random")
+
+    def simulate(snr_db: float) -> float:
+        # A fresh simulator per point keeps each point independent of probe order
+        simulator = OFDMSimulator(
+            modulation=modulation, seed=seed, bit_source=bit_source
+        )
+        ber, _ = simulator.simulate_transmission(n_bits, snr_db)
+        return ber
+
+    return simulate
+
+
+def _fit_crossing(
+    points: Dict[float, float], target_ber: float, lo: float, hi: float
+) -> Optional[float]:
+    """SNR in [lo, hi] where the log-BER fit crosses the target, if it can be fit."""
+    snrs = np.array(sorted(snr for snr, ber in points.items() if ber > 0))
+    if len(snrs) < 2:
+        return None
+    log_ber = np.log10([points[snr] for snr in snrs])
+    if snrs[-1] < hi:
+        # Points above the last nonzero BER measured no errors; extend the
+        # last fitted segment linearly in log-BER up to the bracket end
+        slope = (log_ber[-1] - log_ber[-2]) / (snrs[-1] - snrs[-2])
+        if slope >= 0:
+            return None
+        log_ber = np.append(log_ber, log_ber[-1] + slope * (hi - snrs[-1]))
+        snrs = np.append(snrs, hi)
+    curve = PchipInterpolator(snrs, log_ber)
+    target = np.log10(target_ber)
+    try:
+        return float(brentq(lambda snr: curve(snr) - target, lo, hi))
+    except ValueError:
+        return None
+
+
+def _estimate_crossing(
+    points: Dict[float, float], target_ber: float, lo: float, hi: float
+) -> float:
+    """Fitted target crossing in [lo, hi], or the midpoint if there is no fit."""
+    crossing = _fit_crossing(points, target_ber, lo, hi)
+    return 0.5 * (lo + hi) if crossing is None else crossing
+
+
+def _bracket(
+    evaluate: Callable[[float], float],
+    target_ber: float,
+    snr_bounds: Tuple[float, float],
+    max_points: int,
+) -> Tuple[float, float]:
+    """(lo, hi) with BER(lo) > target >= BER(hi), widening the bounds outwards."""
+    lo, hi = float(snr_bounds[0]), float(snr_bounds[1])
+    if hi <= lo:
+        raise ValueError(f"SNR bounds must satisfy low < high, got {snr_bounds}")
+    width = hi - lo
+    for _ in range(max_points):
+        if evaluate(lo) > target_ber:
+            break
+        hi, lo = lo, lo - width
+    else:
+        raise ValueError(f"Target not bracketed within {max_points} points")
+    for _ in range(max_points):
+        if evaluate(hi) <= target_ber:
+            break
+        lo, hi = hi, hi + width
+    else:
+        raise ValueError(f"Target not bracketed within {max_points} points")
+    return lo, hi
+
+
+def find_snr_for_ber(
+    target_ber: float,
+    config: Optional[dict] = None,
+    snr_bounds: Tuple[float, float] = (0.0, 20.0),
+    tolerance: float = 0.1,
+    max_points: int = 20,
+    ber_function: Optional[Callable[[float], float]] = None,
+    verbose: bool = False,
+) -> dict:
+    """
+    Find the SNR at which BER falls to a target value.
+
+    Args:
+        target_ber: Target bit error rate
+        config: run_simulation-style settings (modulation, n_bits, seed,
+            bit_source); ignored when ``ber_function`` is given
+        snr_bounds: Initial (low, high) SNR bracket in dB; widened if the
+            target is not inside it
+        tolerance: Stop when the bracket is narrower than this (dB)
+        max_points: Maximum number of simulated SNR points
+        ber_function: Custom SNR -> BER function (defaults to simulation)
+        verbose: Print each probe
+
+    Returns:
+        Dictionary with the SNR estimate, final bracket and all points
+
+    Raises:
+        ValueError: If the target cannot be resolved or bracketed
+    """
+    if not 0 < target_ber < 0.5:
+        raise ValueError(f"Target BER must be in (0, 0.5), got {target_ber}")
+    if ber_function is None:
+        ber_function = _config_ber_function(config or {}, target_ber)
+
+    points: Dict[float, float] = {}
+
+    def evaluate(snr_db: float) -> float:
+        if snr_db not in points:
+            if len(points) >= max_points:
+                raise ValueError(f"Target not reached within {max_points} points")
+            points[snr_db] = ber_function(snr_db)
+            if verbose:
+                print(f"SNR: {snr_db:6.2f} dB, BER: {points[snr_db]:.2e}")
+        return points[snr_db]
+
+    lo, hi = _bracket(evaluate, target_ber, snr_bounds, max_points)
+    while hi - lo > tolerance:
+        margin = _SAFEGUARD * (hi - lo)
+        probe = _estimate_crossing(points, target_ber, lo, hi)
+        probe = float(np.clip(probe, lo + margin, hi - margin))
+
+        if evaluate(probe) > target_ber:
+            lo = probe
+        else:
+            hi = probe
+
+    snr_values = sorted(points)
+    return {
+        "snr_db": _estimate_crossing(points, target_ber, lo, hi),
+        "target_ber": target_ber,
+        "bracket": (lo, hi),
+        "snr_values": np.array(snr_values),
+        "ber_values": np.array([points[snr] for snr in snr_values]),
+        "n_points": len(points),
+    }
@@ -0,0 +1,310 @@
+"""
+File-based distributed work queue for multi-node sweeps.
+
+A sweep is planned once into a shared directory (NFS in production, a temp
+dir in tests) and then processed by any number of workers on any node, with
+no broker beyond the filesystem:
+
+    <queue_dir>/sweep.json    Sweep configuration
+    <queue_dir>/pending/      Units waiting to be claimed
+    <queue_dir>/claimed/      Units being simulated
+    <queue_dir>/done/         Per-unit error/bit counts
+
+Each unit is one slice of one SNR point with its own child seed from
+``SeedSequence(seed).spawn``, so merged results do not depend on how many
+workers ran or which unit each one claimed. Workers claim a unit by renaming
+it from pending/ to claimed/; rename is atomic, so exactly one worker wins.
+Results are written to a temporary file and renamed into done/. Units whose
+worker died can be returned to pending/ with requeue_stale().
+"""
+
+import json
+import os
+import socket
+import time
+from typing import Optional
+
+import numpy as np
+
+from radio_sim.ofdm import OFDMSimulator
+
+SWEEP_FILE = "sweep.json"
+PENDING, CLAIMED, DONE = "pending", "claimed", "done"
+
+
+def _write_json_atomic(path: str, data: dict) -> None:
+    """Write JSON via a temporary file and rename so readers never see partial files."""
+    tmp_path = f"{path}.{socket.gethostname()}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _unit_files(queue_dir: str, state: str) -> list:
+    """Sorted unit file names in a queue state directory."""
+    return sorted(
+        name
+        for name in os.listdir(os.path.join(queue_dir, state))
+        if name.endswith(".json")
+    )
+
+
+def load_sweep(queue_dir: str) -> dict:
+    """Load the configuration of a planned sweep."""
+    path = os.path.join(queue_dir, SWEEP_FILE)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No sweep planned in {queue_dir}")
+    return _read_json(path)
+
+
+def plan_sweep(
+    queue_dir: str,
+    modulation: str = "QPSK",
+    n_bits: int = 10000,
+    snr_range: tuple = (0, 20, 2),
+    seed: int = 42,
+    unit_bits: Optional[int] = None,
+    bit_source: str = "random",
+) -> int:
+    """
+    Split a sweep into seeded work units in a shared directory.
+
+    Planning the same sweep again is a no-op, so a restarted coordinator
+    does not duplicate work.
+
+    Args:
+        queue_dir: Shared queue directory
+        modulation: Modulation scheme
+        n_bits: Number of bits per SNR point
+        snr_range: (start, stop, step) for SNR in dB
+        seed: Root random seed
+        unit_bits: Bits per work unit (default: one unit per SNR point);
+            rounded down to whole OFDM symbols
+        bit_source: "random" or a PN sequence such as "pn9"/"pn23"; each
+            unit continues the sequence where the previous one stops, as in
+            a sequential run
+
+    Returns:
+        Number of work units in the sweep
+
+    Raises:
+        ValueError: If n_bits or unit_bits is not positive, or the directory
+            holds a different sweep
+    """
+    if n_bits <= 0:
+        raise ValueError("n_bits must be positive")
+    if unit_bits is not None and unit_bits <= 0:
+        raise ValueError("unit_bits must be positive")
+    snr_values = np.arange(snr_range[0], snr_range[1] + snr_range[2], snr_range[2])
+
+    simulator = OFDMSimulator(modulation=modulation, bit_source=bit_source)
+    bits_per_ofdm_symbol = simulator.bits_per_symbol * simulator.n_subcarriers
+    if unit_bits is None:
+        unit_bits = n_bits
+    else:
+        unit_bits = max(1, unit_bits // bits_per_ofdm_symbol) * bits_per_ofdm_symbol
+    unit_bits = min(unit_bits, n_bits)
+    units_per_point = -(-n_bits // unit_bits)
+    n_units = len(snr_values) * units_per_point
+    snr_list = [float(snr) for snr in snr_values]
+
+    config = {
+        "modulation": modulation,
+        "n_bits": n_bits,
+        "snr_values": snr_list,
+        "seed": seed,
+        "bit_source": bit_source,
+        "unit_bits": unit_bits,
+        "n_units": n_units,
+    }
+
+    sweep_path = os.path.join(queue_dir, SWEEP_FILE)
+    if os.path.exists(sweep_path):
+        existing = _read_json(sweep_path)
+        if existing != config:
+            raise ValueError(f"{queue_dir} already holds a different sweep")
+        return n_units
+
+    for state in (PENDING, CLAIMED, DONE):
+        os.makedirs(os.path.join(queue_dir, state), exist_ok=True)
+
+    seeds = np.random.SeedSequence(seed).spawn(n_units)
+    for unit_id, child in enumerate(seeds):
+        snr_index, part = divmod(unit_id, units_per_point)
+        unit = {
+            "unit_id": unit_id,
+            "snr_index": snr_index,
+            "snr_db": snr_list[snr_index],
+            "n_bits": min(unit_bits, n_bits - part * unit_bits),
+            "bit_offset": snr_index * n_bits + part * unit_bits,
+            "entropy": child.entropy,
+            "spawn_key": list(child.spawn_key),
+        }
+        _write_json_atomic(
+            os.path.join(queue_dir, PENDING, f"unit-{unit_id:06d}.json"), unit
+        )
+
+    # Written last: workers only start once every unit exists
+    _write_json_atomic(sweep_path, config)
+    return n_units
+
+
+def claim_unit(queue_dir: str) -> Optional[dict]:
+    """
+    Claim the next pending unit.
+
+    Returns:
+        Unit record, or None if nothing is pending
+    """
+    for name in _unit_files(queue_dir, PENDING):
+        claimed_path = os.path.join(queue_dir, CLAIMED, name)
+        try:
+            os.rename(os.path.join(queue_dir, PENDING, name), claimed_path)
+        except FileNotFoundError:
+            # Another worker won the race for this unit
+            continue
+        # Rename keeps the mtime; stamp the claim time for requeue_stale()
+        os.utime(claimed_path)
+        return _read_json(claimed_path)
+    return None
+
+
+def run_unit(config: dict, unit: dict) -> dict:
+    """
+    Simulate one work unit.
+
+    Returns:
+        Result record with error and measured bit counts
+    """
+    seed = np.random.SeedSequence(unit["entropy"], spawn_key=tuple(unit["spawn_key"]))
+    simulator = OFDMSimulator(
+        modulation=config["modulation"],
+        seed=seed,
+        bit_source=config.get("bit_source", "random"),
+    )
+    if simulator.prbs is not None:
+        # Start where this unit's bits begin in the sequential PN stream
+        simulator.prbs.position = unit["bit_offset"] % len(simulator.prbs.period)
+    _, sim_data = simulator.simulate_transmission(unit["n_bits"], unit["snr_db"])
+    rx_bits = sim_data["rx_bits"]
+    return {
+        "unit_id": unit["unit_id"],
+        "snr_index": unit["snr_index"],
+        "errors": int(np.count_nonzero(sim_data["tx_bits"][: len(rx_bits)] != rx_bits)),
+        "measured_bits": len(rx_bits),
+        "worker": f"{socket.gethostname()}:{os.getpid()}",
+    }
+
+
+def complete_unit(queue_dir: str, unit: dict, result: dict) -> None:
+    """Publish a unit's result and release its claim."""
+    name = f"unit-{unit['unit_id']:06d}.json"
+    _write_json_atomic(os.path.join(queue_dir, DONE, name), result)
+    try:
+        os.remove(os.path.join(queue_dir, CLAIMED, name))
+    except FileNotFoundError:
+        # Requeued and finished elsewhere; results are identical
+        pass
+
+
+def requeue_stale(queue_dir: str, timeout: float) -> int:
+    """
+    Return units claimed longer than ``timeout`` seconds ago to pending.
+
+    Returns:
+        Number of units requeued
+    """
+    requeued = 0
+    now = time.time()
+    for name in _unit_files(queue_dir, CLAIMED):
+        claimed_path = os.path.join(queue_dir, CLAIMED, name)
+        try:
+            if now - os.path.getmtime(claimed_path) < timeout:
+                continue
+            if os.path.exists(os.path.join(queue_dir, DONE, name)):
+                os.remove(claimed_path)
+                continue
+            os.rename(claimed_path, os.path.join(queue_dir, PENDING, name))
+            requeued += 1
+        except FileNotFoundError:
+            # Completed or requeued concurrently
+            continue
+    return requeued
+
+
+def run_worker(
+    queue_dir: str,
+    max_units: Optional[int] = None,
+    stale_timeout: Optional[float] = None,
+) -> int:
+    """
+    Process units until the queue is empty.
+
+    Args:
+        queue_dir: Shared queue directory
+        max_units: Stop after this many units
+        stale_timeout: If set, requeue units claimed longer ago than this
+            (seconds) once nothing is pending
+
+    Returns:
+        Number of units processed by this worker
+    """
+    config = load_sweep(queue_dir)
+    processed = 0
+    while max_units is None or processed < max_units:
+        unit = claim_unit(queue_dir)
+        if unit is None:
+            if stale_timeout is not None and requeue_stale(queue_dir, stale_timeout):
+                continue
+            break
+        complete_unit(queue_dir, unit, run_unit(config, unit))
+        processed += 1
+    return processed
+
+
+def queue_status(queue_dir: str) -> dict:
+    """Number of units in each queue state."""
+    return {
+        state: len(_unit_files(queue_dir, state)) for state in (PENDING, CLAIMED, DONE)
+    }
+
+
+def merge_results(queue_dir: str) -> dict:
+    """
+    Aggregate completed units into standard sweep results.
+
+    Returns:
+        Dictionary with simulation results (as returned by run_simulation)
+
+    Raises:
+        ValueError: If some units have not completed
+    """
+    config = load_sweep(queue_dir)
+    done = _unit_files(queue_dir, DONE)
+    if len(done) != config["n_units"]:
+        raise ValueError(
+            f"Sweep incomplete: {len(done)} of {config['n_units']} units done"
+        )
+
+    n_points = len(config["snr_values"])
+    errors = np.zeros(n_points, dtype=np.int64)
+    measured_bits = np.zeros(n_points, dtype=np.int64)
+    for name in done:
+        result = _read_json(os.path.join(queue_dir, DONE, name))
+        errors[result["snr_index"]] += result["errors"]
+        measured_bits[result["snr_index"]] += result["measured_bits"]
+
+    return {
+        "snr_values": np.array(config["snr_values"]),
+        "ber_values": errors / np.maximum(measured_bits, 1),
+        "modulation": config["modulation"],
+        "n_bits": config["n_bits"],
+        "seed": config["seed"],
+    }
@@ -0,0 +1,86 @@
+"""
+Tests for sweep checkpointing and bit-exact resume.
+"""
+
+import json
+import os
+import pytest
+import numpy as np
+from radio_sim.main import run_simulation
+from radio_sim.ofdm import OFDMSimulator
+
+
+SWEEP = dict(
+    modulation="QPSK", n_bits=5000, snr_range=(0, 6, 2), seed=42, chunk_bits=1000
+)
+
+
+class Preempted(Exception):
+    """Raised to simulate a sweep being killed mid-run."""
+
+
+def interrupt_after(monkeypatch, n_calls):
+    """Make simulate_transmission fail after a number of successful calls."""
+    original = OFDMSimulator.simulate_transmission
+    calls = {"count": 0}
+
+    def flaky(self, *args, **kwargs):
+        if calls["count"] == n_calls:
+            raise Preempted()
+        calls["count"] += 1
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(OFDMSimulator, "simulate_transmission", flaky)
+
+
+class TestCheckpointResume:
+    """Test checkpoint/resume behaviour of run_simulation."""
+
+    def test_default_is_single_chunk(self):
+        """Test that the default run matches one simulate_transmission per SNR."""
+        results = run_simulation(
+            modulation="QPSK", n_bits=2000, snr_range=(0, 4, 2), seed=42
+        )
+
+        simulator = OFDMSimulator(modulation="QPSK", seed=42)
+        expected = [simulator.simulate_transmission(2000, snr)[0] for snr in (0, 2, 4)]
+        np.testing.assert_array_equal(results["ber_values"], expected)
+
+    @pytest.mark.parametrize("n_calls", [2, 5, 13])
+    def test_resume_is_bit_exact(self, tmp_path, monkeypatch, n_calls):
+        """Test that an interrupted and resumed sweep matches an uninterrupted one."""
+        reference = run_simulation(**SWEEP)
+        path = str(tmp_path / "sweep.json")
+
+        with monkeypatch.context() as patch:
+            interrupt_after(patch, n_calls)
+            with pytest.raises(Preempted):
+                run_simulation(**SWEEP, checkpoint_path=path, checkpoint_interval=0)
+        assert os.path.exists(path)
+
+        resumed = run_simulation(**SWEEP, checkpoint_path=path, resume=True)
+
+        np.testing.assert_array_equal(resumed["ber_values"], reference["ber_values"])
+        assert not os.path.exists(path + ".tmp")
+
+    def test_resume_without_checkpoint_starts_fresh(self, tmp_path):
+        """Test that --resume with no checkpoint yet runs the whole sweep."""
+        path = str(tmp_path / "sweep.json")
+        results = run_simulation(**SWEEP, checkpoint_path=path, resume=True)
+
+        with open(path) as f:
+            checkpoint = json.load(f)
+        assert checkpoint["progress"]["snr_index"] == len(results["snr_values"])
+        assert checkpoint["progress"]["ber_values"] == list(results["ber_values"])
+
+    def test_configuration_mismatch(self, tmp_path):
+        """Test that a checkpoint from another configuration is rejected."""
+        path = str(tmp_path / "sweep.json")
+        run_simulation(**SWEEP, checkpoint_path=path)
+
+        with pytest.raises(ValueError, match="seed"):
+            run_simulation(**dict(SWEEP, seed=1), checkpoint_path=path, resume=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
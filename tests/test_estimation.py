@@ -0,0 +1,162 @@
+"""
+Tests for fading channels, pilot-aided channel estimation and equalization.
+"""
+
+import pytest
+import numpy as np
+from radio_sim.ofdm import OFDMSimulator
+from radio_sim.channel import MultipathChannel, exponential_pdp
+from radio_sim.estimation import (
+    PilotPattern,
+    equalize,
+    estimate_channel,
+    extract_data,
+    insert_pilots,
+    lmmse_filter,
+)
+
+
+class TestMultipathChannel:
+    """Test the fading channel model."""
+
+    def test_power_delay_profile(self):
+        """Test PDP normalization."""
+        pdp = exponential_pdp(2.0)
+        assert np.isclose(np.sum(pdp), 1.0)
+        assert np.all(np.diff(pdp) < 0)
+        np.testing.assert_array_equal(exponential_pdp(0), [1.0])
+
+    def test_frequency_response(self):
+        """Test response shape and unit average power."""
+        channel = MultipathChannel(n_subcarriers=64, delay_spread=2.0, seed=1)
+        response = channel.frequency_response(14, (200,))
+
+        assert response.shape == (200, 14, 64)
+        assert np.isclose(np.mean(np.abs(response) ** 2), 1.0, rtol=0.1)
+        # Block fading: identical across symbols within a realization
+        np.testing.assert_allclose(response[:, 0], response[:, -1])
+
+    def test_invalid_time_correlation(self):
+        """Test that invalid time correlation is rejected."""
+        with pytest.raises(ValueError):
+            MultipathChannel(time_correlation=1.5)
+
+
+class TestChannelEstimation:
+    """Test pilot insertion, estimation and equalization."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.n_symbols = 14
+        self.n_subcarriers = 64
+        self.channel = MultipathChannel(self.n_subcarriers, delay_spread=2.0, seed=7)
+
+    @pytest.mark.parametrize(
+        "pattern", [PilotPattern.comb(), PilotPattern.block(), PilotPattern.dmrs()]
+    )
+    def test_pilot_insertion_roundtrip(self, pattern):
+        """Test that data survives pilot insertion and extraction."""
+        n_data = pattern.n_data(self.n_symbols, self.n_subcarriers)
+        data = np.arange(3 * n_data).reshape(3, n_data) + 1j
+
+        grid = insert_pilots(data, pattern, self.n_symbols, self.n_subcarriers)
+
+        assert grid.shape == (3, self.n_symbols, self.n_subcarriers)
+        assert (
+            np.count_nonzero(pattern.mask(self.n_symbols, self.n_subcarriers)) + n_data
+            == self.n_symbols * self.n_subcarriers
+        )
+        np.testing.assert_array_equal(extract_data(grid, pattern), data)
+
+    def test_noiseless_estimation_at_pilots(self):
+        """Test that LS estimates are exact at pilot positions without noise."""
+        pattern = PilotPattern.block()
+        response = self.channel.frequency_response(self.n_symbols)
+        n_data = pattern.n_data(self.n_symbols, self.n_subcarriers)
+        grid = insert_pilots(
+            np.ones(n_data), pattern, self.n_symbols, self.n_subcarriers
+        )
+
+        h_est = estimate_channel(grid * response, pattern, "ls")
+
+        np.testing.assert_allclose(h_est, response)
+
+    def test_lmmse_beats_ls(self):
+        """Test that LMMSE has lower estimation error than LS at low SNR."""
+        pattern = PilotPattern.comb()
+        snr_db = 5
+        rng = np.random.default_rng(0)
+        response = self.channel.frequency_response(self.n_symbols, (50,))
+        n_data = pattern.n_data(self.n_symbols, self.n_subcarriers)
+        grid = insert_pilots(
+            np.ones((50, n_data)), pattern, self.n_symbols, self.n_subcarriers
+        )
+        noise_std = np.sqrt(10 ** (-snr_db / 10) / 2)
+        rx = grid * response + noise_std * (
+            rng.normal(size=grid.shape) + 1j * rng.normal(size=grid.shape)
+        )
+
+        mse_ls = np.mean(np.abs(estimate_channel(rx, pattern, "ls") - response) ** 2)
+        mse_lmmse = np.mean(
+            np.abs(
+                estimate_channel(rx, pattern, "lmmse", snr_db=snr_db, delay_spread=2.0)
+                - response
+            )
+            ** 2
+        )
+
+        assert mse_lmmse < mse_ls
+
+    def test_lmmse_filter_is_cached(self):
+        """Test that LMMSE filters are reused per configuration."""
+        pattern = PilotPattern.comb()
+        first = lmmse_filter(pattern, 64, 10.0, 2.0)
+
+        assert lmmse_filter(pattern, 64, 10.0, 2.0) is first
+        assert lmmse_filter(pattern, 64, 12.0, 2.0) is not first
+        assert not first.flags.writeable
+
+    def test_equalizers(self):
+        """Test ZF inversion, unbiased MMSE and MMSE shrinkage."""
+        response = self.channel.frequency_response(2)
+        grid = np.ones((2, self.n_subcarriers), dtype=complex)
+
+        np.testing.assert_allclose(equalize(grid * response, response, "zf"), grid)
+        np.testing.assert_allclose(
+            equalize(grid * response, response, "mmse", noise_var=0.1), grid
+        )
+        biased = equalize(
+            grid * response, response, "mmse", noise_var=0.1, unbiased=False
+        )
+        assert np.all(np.abs(biased) < 1)
+        with pytest.raises(ValueError):
+            equalize(grid, response, "invalid")
+
+
+class TestFadingSimulation:
+    """Test the pilot-aided fading simulation chain."""
+
+    def test_fading_transmission(self):
+        """Test end-to-end transmission over a fading channel."""
+        simulator = OFDMSimulator(modulation="QPSK", seed=42)
+        channel = MultipathChannel(64, delay_spread=2.0, seed=42)
+
+        ber, sim_data = simulator.simulate_fading_transmission(
+            20000, snr_db=30, channel=channel, pilot_pattern=PilotPattern.dmrs()
+        )
+
+        assert len(sim_data["rx_bits"]) == 20000
+        assert sim_data["channel"].shape == sim_data["channel_estimate"].shape
+        assert ber < 1e-2
+
+    def test_subcarrier_mismatch(self):
+        """Test that mismatched channel and simulator sizes are rejected."""
+        simulator = OFDMSimulator(n_subcarriers=64)
+        with pytest.raises(ValueError):
+            simulator.simulate_fading_transmission(
+                100, 10, MultipathChannel(n_subcarriers=128)
+            )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
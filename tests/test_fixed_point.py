@@ -0,0 +1,153 @@
+"""
+Tests for the fixed-point receiver model.
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+from radio_sim.fixed_point import (
+    QFormat,
+    bfp_fft,
+    dequantize_iq,
+    fixed_point_demodulate,
+    max_log_llr,
+    quantize_iq,
+)
+from radio_sim.ofdm import OFDMSimulator
+
+
+def random_iq(shape, seed=0):
+    """Unit-power complex Gaussian samples."""
+    rng = np.random.default_rng(seed)
+    return (rng.normal(size=shape) + 1j * rng.normal(size=shape)) / np.sqrt(2)
+
+
+class TestQFormat:
+    """Test quantization, rounding and saturation."""
+
+    def test_dtype_selection(self):
+        """Test that the smallest integer type is chosen."""
+        assert QFormat(8, 2).dtype == np.int8
+        assert QFormat(16, 12).dtype == np.int16
+        assert QFormat(18, 15).dtype == np.int32
+
+    def test_round_half_up(self):
+        """Test rounding of values halfway between steps."""
+        fmt = QFormat(16, 1)
+        assert list(fmt.quantize([0.25, -0.25, 0.75, 1.0])) == [1, 0, 2, 2]
+
+    def test_saturation(self):
+        """Test that out-of-range values clip to the word limits."""
+        fmt = QFormat(16, 15)
+        assert list(fmt.quantize([1.0, -1.0, 5.0, -5.0])) == [
+            32767,
+            -32768,
+            32767,
+            -32768,
+        ]
+
+    def test_iq_roundtrip(self):
+        """Test that IQ quantization error is within half a step."""
+        fmt = QFormat(16, 12)
+        signal = random_iq(1000)
+        iq = quantize_iq(signal, fmt)
+
+        assert iq.shape == (1000, 2) and iq.dtype == np.int16
+        assert iq.nbytes * 4 == signal.nbytes
+        assert (
+            np.max(np.abs(dequantize_iq(iq, fmt) - signal))
+            <= np.sqrt(2) * 0.5 / fmt.scale
+        )
+
+
+class TestBlockFloatingPointFFT:
+    """Test the integer BFP FFT."""
+
+    @pytest.mark.parametrize("n_fft", [2, 16, 64, 1024])
+    def test_matches_float_fft(self, n_fft):
+        """Test accuracy against np.fft on the quantized input."""
+        fmt = QFormat(16, 12)
+        iq = quantize_iq(random_iq((20, n_fft)), fmt)
+        output, exponent = bfp_fft(iq, fmt)
+
+        reference = np.fft.fft(dequantize_iq(iq, fmt), axis=-1)
+        result = dequantize_iq(output, fmt) * 2.0 ** exponent[:, np.newaxis]
+        error = max(np.sum(np.abs(reference - result) ** 2), 1e-30)
+        sqnr_db = 10 * np.log10(np.sum(np.abs(reference) ** 2) / error)
+
+        assert output.dtype == np.int16 and exponent.shape == (20,)
+        assert sqnr_db > 50
+
+    def test_full_scale_input_does_not_overflow(self):
+        """Test a DC full-scale block, the worst case for growth."""
+        fmt = QFormat(16, 15)
+        iq = np.full((1, 64, 2), fmt.max_int, dtype=np.int16)
+        output, exponent = bfp_fft(iq, fmt)
+        result = dequantize_iq(output, fmt) * 2.0 ** exponent[:, np.newaxis]
+
+        assert np.isclose(
+            result[0, 0], 64 * (1 + 1j) * fmt.max_int / fmt.scale, rtol=1e-3
+        )
+        assert np.max(np.abs(result[0, 1:])) < 0.01 * np.abs(result[0, 0])
+
+    def test_exponent_per_block(self):
+        """Test that quiet blocks keep more precision than loud ones."""
+        fmt = QFormat(16, 12)
+        signal = random_iq((2, 64))
+        signal[1] *= 1 / 16
+        _, exponent = bfp_fft(quantize_iq(signal, fmt), fmt)
+
+        assert exponent[0] > exponent[1]
+
+    def test_rejects_non_power_of_two(self):
+        """Test that the radix-2 FFT requires a power-of-two size."""
+        with pytest.raises(ValueError):
+            bfp_fft(np.zeros((48, 2), dtype=np.int16))
+
+
+class TestFixedPointReceiver:
+    """Test integer LLRs and the end-to-end fixed-point link."""
+
+    def test_llr_signs_match_float(self):
+        """Test integer max-log LLR signs against the float demodulator."""
+        simulator = OFDMSimulator(modulation="16QAM")
+        symbols = simulator.modulate(simulator.generate_bits(4 * 512))
+        received = symbols + 0.1 * random_iq(512)
+        fmt = QFormat(16, 12)
+        llr = max_log_llr(
+            quantize_iq(received, fmt)[np.newaxis],
+            np.zeros(1, dtype=np.int64),
+            simulator.constellation,
+            fmt,
+            noise_var=0.02,
+        )
+        reference = simulator.demodulate_llr(received, noise_var=0.02)
+
+        assert llr.dtype == np.int8
+        confident = np.abs(reference) > 1
+        assert np.array_equal(np.sign(llr[0][confident]), np.sign(reference[confident]))
+
+    @pytest.mark.parametrize("modulation", ["QPSK", "16QAM"])
+    def test_ber_close_to_float(self, modulation):
+        """Test that fixed-point BER tracks the float receiver."""
+        fixed, _ = OFDMSimulator(
+            modulation=modulation
+        ).simulate_fixed_point_transmission(40000, 8)
+        floating, _ = OFDMSimulator(modulation=modulation).simulate_transmission(
+            40000, 8
+        )
+
+        assert abs(fixed - floating) < 0.1 * floating + 1e-3
+
+    def test_bit_exact_reproducible(self):
+        """Test that the golden model output is identical across runs."""
+
+        def digest():
+            rx = OFDMSimulator(seed=7).add_awgn(random_iq(64 * 50), 10)
+            result = fixed_point_demodulate(rx, OFDMSimulator().constellation, 64, 0.1)
+            return hashlib.sha256(
+                result["fft_iq"].tobytes() + result["llr"].tobytes()
+            ).hexdigest()
+
+        assert digest() == digest()
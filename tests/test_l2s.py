@@ -0,0 +1,238 @@
+"""
+Tests for link-to-system abstraction tables.
+"""
+
+import numpy as np
+import pytest
+from radio_sim.l2s import (
+    TABLE_VERSION,
+    L2STable,
+    build_l2s_tables,
+    calibrate_beta,
+    eesm,
+    inverse_mutual_information,
+    link_curve,
+    load_l2s_table,
+    miesm,
+    mutual_information,
+    simulate_fading_links,
+)
+from radio_sim.ldpc import LDPCCode, dual_diagonal_base_matrix
+
+
+def small_code():
+    """Rate-1/2 code with n = 64 for fast sweeps."""
+    return LDPCCode.from_base_matrix(dual_diagonal_base_matrix(4, 8, 8), 8)
+
+
+def synthetic_table():
+    """Two-entry table with log-linear BLER curves on a 1 dB grid."""
+    snr_db = np.arange(-5, 16, 1.0)
+    bler = np.stack(
+        [
+            10 ** np.clip(-(snr_db - 2) / 2, -5, 0),
+            10 ** np.clip(-(snr_db - 8) / 2, -5, 0),
+        ]
+    ).astype(np.float32)
+    metadata = {
+        "version": TABLE_VERSION,
+        "snr_start": -5.0,
+        "snr_step": 1.0,
+        "n_snr": len(snr_db),
+        "n_codewords": 100,
+        "entries": [
+            {
+                "modulation": "QPSK",
+                "code_rate": 0.5,
+                "n": 64,
+                "k": 32,
+                "beta": {"eesm": 1.5, "miesm": 1.0},
+            },
+            {
+                "modulation": "16QAM",
+                "code_rate": 0.5,
+                "n": 64,
+                "k": 32,
+                "beta": {"eesm": 4.0, "miesm": 1.0},
+            },
+        ],
+    }
+    return L2STable(bler, metadata)
+
+
+class TestEffectiveSINR:
+    """Test EESM and MIESM mappings."""
+
+    @pytest.mark.parametrize("modulation", ["QPSK", "16QAM"])
+    def test_flat_channel_is_identity(self, modulation):
+        """Test that equal SINR on all subcarriers maps to itself."""
+        sinr_db = np.full((3, 16), 7.0)
+        assert np.allclose(eesm(sinr_db, 2.0), 7.0)
+        assert np.allclose(miesm(sinr_db, 1.0, modulation), 7.0, atol=0.05)
+
+    def test_bounded_by_mean_and_min(self):
+        """Test that the effective SINR lies between worst and average subcarrier."""
+        rng = np.random.default_rng(0)
+        sinr_db = rng.normal(10, 6, (100, 64))
+        mean_db = 10 * np.log10(np.mean(10 ** (sinr_db / 10), axis=-1))
+
+        for effective in (eesm(sinr_db, 3.0), miesm(sinr_db, 1.0, "16QAM")):
+            assert effective.shape == (100,)
+            assert np.all(effective <= mean_db + 1e-6)
+            assert np.all(effective >= sinr_db.min(axis=-1) - 0.05)
+
+    def test_per_link_beta(self):
+        """Test that one beta per link broadcasts over the subcarrier axis."""
+        sinr_db = np.random.default_rng(1).normal(5, 5, (4, 32))
+        betas = np.array([0.5, 1.0, 2.0, 4.0])
+        expected = [eesm(sinr_db[i], betas[i]) for i in range(4)]
+        assert np.allclose(eesm(sinr_db, betas), expected)
+
+    def test_mutual_information_inverse(self):
+        """Test that the mutual information curve is increasing and invertible."""
+        snr_db = np.linspace(-10, 15, 26)
+        mi = mutual_information(snr_db, "QPSK")
+
+        assert np.all(np.diff(mi) > 0)
+        assert 0 < mi[0] and mi[-1] <= 1
+        assert np.allclose(inverse_mutual_information(mi, "QPSK"), snr_db, atol=1e-6)
+
+
+class TestL2STable:
+    """Test BLER lookup, persistence and calibration."""
+
+    def test_bler_interpolation(self):
+        """Test log-domain interpolation and clamping at the grid edges."""
+        table = synthetic_table()
+
+        assert np.isclose(table.bler(4.0, 0), 0.1)
+        assert np.isclose(table.bler(5.0, 0), 10**-1.5)
+        assert np.isclose(table.bler(-50.0, 1), 1.0)
+        assert np.isclose(table.bler(50.0, 0), 1e-5)
+        assert np.allclose(table.bler(np.array([4.0, 10.0]), np.array([0, 1])), 0.1)
+
+    def test_entry_index(self):
+        """Test entry lookup by modulation and code rate."""
+        table = synthetic_table()
+        assert table.entry_index("16QAM", 0.5) == 1
+        with pytest.raises(KeyError):
+            table.entry_index("QPSK", 0.75)
+
+    def test_mixed_entries_vectorized(self):
+        """Test that links with different entries match per-entry evaluation."""
+        table = synthetic_table()
+        rng = np.random.default_rng(2)
+        sinr_db = rng.normal(6, 4, (500, 48))
+        entry = rng.integers(0, 2, 500)
+
+        for method in ("eesm", "miesm"):
+            mixed = table.predict_bler(sinr_db, entry, method)
+            for index in (0, 1):
+                mask = entry == index
+                assert np.allclose(
+                    mixed[mask], table.predict_bler(sinr_db[mask], index, method)
+                )
+
+    def test_save_and_mmap(self, tmp_path):
+        """Test that saved tables reload memory-mapped with the same contents."""
+        table = synthetic_table()
+        table.beta["eesm"][1] = 5.5
+        table.save(str(tmp_path / "tables"))
+        loaded = load_l2s_table(str(tmp_path / "tables"))
+
+        assert isinstance(loaded.bler_table, np.memmap)
+        assert np.array_equal(loaded.bler_table, table.bler_table)
+        assert loaded.beta["eesm"][1] == 5.5
+        assert np.allclose(loaded.snr_db, table.snr_db)
+
+    def test_rejects_unknown_version(self, tmp_path):
+        """Test that tables from another format version are refused."""
+        table = synthetic_table()
+        table.metadata["version"] = 99
+        table.save(str(tmp_path / "tables"))
+        with pytest.raises(ValueError):
+            load_l2s_table(str(tmp_path / "tables"))
+
+    def test_rejects_mismatched_files(self, tmp_path):
+        """Test that a table file replaced without its metadata is refused."""
+        base = str(tmp_path / "tables")
+        synthetic_table().save(base)
+        table = synthetic_table()
+        table.bler_table = table.bler_table[::-1].copy()
+        # Simulate a crash after the array was renamed but before the JSON was
+        table.save(str(tmp_path / "newer"))
+        (tmp_path / "newer.npy").replace(tmp_path / "tables.npy")
+
+        with pytest.raises(ValueError, match="does not match"):
+            load_l2s_table(base)
+
+    def test_rejects_single_snr_point(self):
+        """Test that a table with one SNR column is refused."""
+        table = synthetic_table()
+        metadata = dict(table.metadata, n_snr=1)
+        with pytest.raises(ValueError, match="at least 2 SNR points"):
+            L2STable(table.bler_table[:, :1], metadata)
+
+    def test_calibrate_recovers_beta(self):
+        """Test calibration against BLER generated with a known beta."""
+        table = synthetic_table()
+        sinr_db = np.random.default_rng(3).normal(5, 6, (200, 32))
+        measured = table.predict_bler(sinr_db, 0, "eesm", beta=2.5)
+        betas = np.linspace(0.5, 5.0, 46)
+        assert np.isclose(
+            calibrate_beta(table, 0, sinr_db, measured, "eesm", betas), 2.5
+        )
+
+
+class TestLinkSweeps:
+    """Test table generation from coded link simulations."""
+
+    def test_link_curve_waterfall(self):
+        """Test that the AWGN BLER curve falls from one to zero."""
+        bler = link_curve(
+            "QPSK",
+            small_code(),
+            np.array([-6.0, 2.0, 10.0]),
+            n_codewords=50,
+            batch_codewords=64,
+        )
+        assert bler[0] == 1.0
+        assert bler[-1] == 0.0
+
+    def test_fading_links(self):
+        """Test fading link outputs and that stronger links fail less."""
+        sinr_db, bler = simulate_fading_links(
+            "QPSK",
+            small_code(),
+            40,
+            np.linspace(-2, 14, 40),
+            codewords_per_link=10,
+            n_subcarriers=32,
+        )
+        assert sinr_db.shape == (40, 32)
+        assert bler.shape == (40,)
+        assert bler[:10].mean() > bler[-10:].mean()
+
+    def test_build_and_predict(self, tmp_path):
+        """Test building, saving and predicting fading BLER with calibrated beta."""
+        code = small_code()
+        table = build_l2s_tables(
+            str(tmp_path / "l2s"),
+            modulations=("QPSK",),
+            codes=[code],
+            snr_range=(-4, 12, 1),
+            n_codewords=100,
+            calibration_links=48,
+        )
+        loaded = load_l2s_table(str(tmp_path / "l2s"))
+
+        assert loaded.bler_table.shape == (1, 17)
+        assert loaded.entries[0]["code_rate"] == code.rate
+        assert loaded.beta["eesm"][0] == table.beta["eesm"][0] != 1.0
+
+        sinr_db, measured = simulate_fading_links(
+            "QPSK", code, 100, np.linspace(-4, 12, 100), seed=7
+        )
+        for method in ("eesm", "miesm"):
+            predicted = loaded.predict_bler(sinr_db, 0, method)
+            assert np.mean(np.abs(predicted - measured)) < 0.15
@@ -0,0 +1,171 @@
+"""
+Tests for LDPC encoding and batched layered min-sum decoding.
+"""
+
+import pytest
+import numpy as np
+from scipy import sparse
+from radio_sim.ofdm import OFDMSimulator
+from radio_sim.ldpc import (
+    LDPCCode,
+    default_code,
+    dual_diagonal_base_matrix,
+    lift_base_matrix,
+)
+from radio_sim.benchmark import benchmark_ldpc_decoder
+
+
+# (7,4) Hamming code as a small generic parity-check matrix
+HAMMING_H = np.array(
+    [
+        [1, 1, 0, 1, 1, 0, 0],
+        [1, 0, 1, 1, 0, 1, 0],
+        [0, 1, 1, 1, 0, 0, 1],
+    ]
+)
+
+
+class TestLDPCCode:
+    """Test code construction and encoding."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.code = default_code()
+        self.rng = np.random.default_rng(0)
+
+    def test_lifting(self):
+        """Test quasi-cyclic lifting of a base matrix."""
+        parity_check = lift_base_matrix(np.array([[0, 1], [-1, 2]]), lifting_size=3)
+
+        assert parity_check.shape == (6, 6)
+        np.testing.assert_array_equal(parity_check[:3, :3], np.eye(3))
+        np.testing.assert_array_equal(parity_check[3:, :3], 0)
+        np.testing.assert_array_equal(
+            parity_check[:3, 3:], np.roll(np.eye(3), 1, axis=1)
+        )
+
+    def test_default_code_dimensions(self):
+        """Test that the dual-diagonal construction is full rank."""
+        assert self.code.n == 648
+        assert self.code.k == 324
+        assert self.code.rate == 0.5
+
+    def test_encode_satisfies_parity_checks(self):
+        """Test that encoded codewords have zero syndrome and are systematic."""
+        messages = self.rng.integers(0, 2, size=(32, self.code.k), dtype=np.uint8)
+        codewords = self.code.encode(messages)
+
+        assert codewords.shape == (32, self.code.n)
+        assert np.all(self.code.syndrome_ok(codewords))
+        np.testing.assert_array_equal(self.code.extract_message(codewords), messages)
+        np.testing.assert_array_equal(codewords @ self.code.parity_check.T % 2, 0)
+
+    def test_generic_sparse_matrix(self):
+        """Test a generic code given as a scipy sparse matrix."""
+        code = LDPCCode(sparse.csr_matrix(HAMMING_H))
+        messages = np.array([[1, 0, 1, 1], [0, 0, 0, 1]], dtype=np.uint8)
+
+        codewords = code.encode(messages)
+
+        assert code.k == 4
+        assert np.all(code.syndrome_ok(codewords))
+
+    def test_invalid_inputs(self):
+        """Test that malformed inputs are rejected."""
+        with pytest.raises(ValueError):
+            self.code.encode(np.zeros(10, dtype=np.uint8))
+        with pytest.raises(ValueError):
+            self.code.decode(np.zeros((1, 10)))
+        with pytest.raises(ValueError):
+            dual_diagonal_base_matrix(n_block_rows=4, n_block_cols=4)
+
+
+class TestLDPCDecoder:
+    """Test the layered normalized min-sum decoder."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.code = default_code()
+        self.rng = np.random.default_rng(1)
+        self.messages = self.rng.integers(0, 2, size=(64, self.code.k), dtype=np.uint8)
+        self.codewords = self.code.encode(self.messages)
+
+    def bpsk_llr(self, ebn0_db):
+        """BPSK over AWGN channel LLRs for the fixture codewords."""
+        noise_var = 1 / (2 * self.code.rate * 10 ** (ebn0_db / 10))
+        received = (
+            1
+            - 2.0 * self.codewords
+            + np.sqrt(noise_var) * self.rng.normal(size=self.codewords.shape)
+        )
+        return 2 * received / noise_var
+
+    def test_noiseless_decoding_stops_immediately(self):
+        """Test early termination on already-valid codewords."""
+        result = self.code.decode(10.0 * (1 - 2.0 * self.codewords))
+
+        np.testing.assert_array_equal(result.bits, self.codewords)
+        assert np.all(result.converged)
+        assert np.all(result.iterations == 1)
+
+    def test_decoding_corrects_errors(self):
+        """Test that the decoder corrects channel errors at moderate Eb/N0."""
+        llr = self.bpsk_llr(3.0)
+        raw_errors = np.sum((llr < 0) != self.codewords)
+
+        result = self.code.decode(llr)
+
+        assert raw_errors > 0
+        assert np.sum(result.bits != self.codewords) < raw_errors / 10
+        assert 1 <= result.average_iterations < 20
+
+    def test_early_termination_matches_full_decoding(self):
+        """Test that early termination does not change converged outputs."""
+        llr = self.bpsk_llr(3.0)
+
+        early = self.code.decode(llr, max_iterations=10)
+        full = self.code.decode(llr, max_iterations=10, early_termination=False)
+
+        both = early.converged & full.converged
+        np.testing.assert_array_equal(early.bits[both], full.bits[both])
+        assert np.all(full.iterations == 10)
+
+
+class TestCodedSimulation:
+    """Test the LDPC-coded OFDM chain."""
+
+    def test_soft_demapping_signs(self):
+        """Test that noiseless LLR signs reproduce the transmitted bits."""
+        simulator = OFDMSimulator(modulation="16QAM", seed=42)
+        bits = simulator.generate_bits(400)
+
+        llr = simulator.demodulate_llr(simulator.modulate(bits), noise_var=0.1)
+
+        np.testing.assert_array_equal((llr < 0).astype(np.uint8), bits)
+
+    def test_coded_transmission(self):
+        """Test that coding removes errors at an SNR where uncoded QPSK fails."""
+        code = default_code()
+        ber, sim_data = OFDMSimulator(
+            modulation="QPSK", seed=42
+        ).simulate_coded_transmission(20, snr_db=6, code=code)
+        uncoded_ber, _ = OFDMSimulator(
+            modulation="QPSK", seed=42
+        ).simulate_transmission(20 * code.k, snr_db=6)
+
+        assert sim_data["rx_bits"].shape == (20, code.k)
+        assert uncoded_ber > 0
+        assert ber < uncoded_ber
+        assert sim_data["average_iterations"] >= 1
+
+    def test_benchmark_reports_throughput(self):
+        """Test that the benchmark reports decoding throughput."""
+        stats = benchmark_ldpc_decoder(batch_size=16, repeats=1)
+
+        assert stats["codewords_per_sec"] > 0
+        assert stats["batch_size"] == 16
+        assert 0 <= stats["frame_error_rate"] <= 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -52,6 +52,18 @@ class TestMainSimulation:
         assert result.returncode == 0, f"CLI failed: {result.stderr}"
         assert "Simulation completed successfully!" in result.stdout
 
+    def test_cli_target_ber_search(self):
+        """Test target BER search mode of the CLI."""
+        result = subprocess.run([
+            sys.executable, "-m", "radio_sim.main",
+            "--bits", "20000",
+            "--target-ber", "1e-2",
+            "--snr-tolerance", "0.5"
+        ], capture_output=True, text=True)
+
+        assert result.returncode == 0, f"CLI failed: {result.stderr}"
+        assert "Search completed successfully!" in result.stdout
+
 
 class TestPerformanceRequirements:
     """Test that simulation meets performance requirements."""
@@ -7,6 +7,8 @@ Tests the OFDM simulator with different configurations and verifies:
 - OFDM symbol generation
 """
 
+import subprocess
+import sys
 import pytest
 import numpy as np
 from radio_sim.ofdm import OFDMSimulator
@@ -40,6 +42,34 @@ class TestOFDMSimulator:
         assert bits.dtype == np.uint8
         assert np.all((bits == 0) | (bits == 1))
     
+    def test_bit_generation_reproducibility(self):
+        """Test that bits are the MSB-first expansion of the seeded byte stream."""
+        bits = OFDMSimulator(seed=7).generate_bits(100)
+        stream = np.random.default_rng(7).bytes(13)
+        expected = np.unpackbits(np.frombuffer(stream, dtype=np.uint8))
+
+        np.testing.assert_array_equal(bits, expected[:100])
+
+    def test_pn_bit_source(self):
+        """Test deterministic PN9 data independent of the seed."""
+        sim1 = OFDMSimulator(seed=1, bit_source="pn9")
+        sim2 = OFDMSimulator(seed=2, bit_source="pn9")
+
+        np.testing.assert_array_equal(sim1.generate_bits(600), sim2.generate_bits(600))
+        with pytest.raises(ValueError):
+            OFDMSimulator(bit_source="pn99")
+
+    @pytest.mark.parametrize("modulation", ["QPSK", "16QAM"])
+    def test_packed_modulation(self, modulation):
+        """Test that packed-index modulation matches bitwise modulation."""
+        simulator = OFDMSimulator(modulation=modulation, seed=42)
+        packed = simulator.generate_packed_bits(64)
+
+        np.testing.assert_array_equal(
+            simulator.modulate_packed(packed),
+            simulator.modulate(np.unpackbits(packed))
+        )
+
     def test_qpsk_modulation(self):
         """Test QPSK modulation."""
         # Test known bit patterns
@@ -110,6 +140,19 @@ class TestOFDMSimulator:
             rtol=1e-10
         )
     
+    def test_multi_symbol_ofdm_roundtrip(self):
+        """Test that data spanning several OFDM symbols is recovered."""
+        bits = self.simulator_16qam.generate_bits(1000)  # 250 symbols -> 4 OFDM symbols
+        symbols = self.simulator_16qam.modulate(bits)
+
+        ofdm_symbols = self.simulator_16qam.generate_ofdm_symbols(symbols)
+        assert ofdm_symbols.shape == (4, self.simulator_16qam.n_subcarriers)
+
+        demod_symbols = self.simulator_16qam.demodulate_ofdm(ofdm_symbols).ravel()
+        demod_symbols = demod_symbols[:len(symbols)]
+        demod_bits = self.simulator_16qam.demodulate_symbols(demod_symbols)
+        np.testing.assert_array_equal(bits, demod_bits)
+
     def test_symbol_demodulation(self):
         """Test symbol demodulation."""
         # Test with perfect symbols (no noise)
@@ -222,6 +265,15 @@ class TestSimulationIntegration:
         # Results should be different (very low probability of being exactly equal)
         assert ber1 != ber2, "Different seeds should give different results"
 
+    def test_core_import_is_lightweight(self):
+        """Test that importing the simulator does not load the feature stages."""
+        code = ("import sys, radio_sim.ofdm; "
+                "print(sorted(m for m in sys.modules if m.startswith('radio_sim.')))")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                                text=True, check=True).stdout
+
+        assert output.strip() == "['radio_sim.ofdm']"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,100 @@
+"""
+Tests for the multi-user OFDMA simulator.
+"""
+
+import numpy as np
+import pytest
+from radio_sim.ofdma import RB_SUBCARRIERS, OFDMASimulator, ResourceAllocation
+
+
+class TestResourceAllocation:
+    """Test RB-to-UE allocation."""
+
+    def test_contiguous_covers_band(self):
+        """Test that contiguous allocation gives every RB to one UE."""
+        allocation = ResourceAllocation.contiguous(n_ue=7, n_rb=52)
+
+        assert allocation.rbs_per_ue.sum() == 52
+        assert allocation.rbs_per_ue.min() >= 7
+        assert np.all(np.diff(allocation.rb_owner) >= 0)
+        assert len(allocation.subcarrier_owner) == 52 * RB_SUBCARRIERS
+
+    def test_from_rb_sets(self):
+        """Test explicit RB sets, including unused RBs."""
+        allocation = ResourceAllocation.from_rb_sets(
+            [[0, 2], [1], []], n_rb=5, modulations=["QPSK", "16QAM", "QPSK"]
+        )
+
+        assert list(allocation.rb_owner) == [0, 1, 0, -1, -1]
+        assert list(allocation.rbs_per_ue) == [2, 1, 0]
+
+    def test_overlapping_sets_rejected(self):
+        """Test that an RB cannot be given to two UEs."""
+        with pytest.raises(ValueError):
+            ResourceAllocation.from_rb_sets([[0, 1], [1, 2]], n_rb=4)
+
+    def test_invalid_modulation_rejected(self):
+        """Test that unknown modulations are rejected."""
+        with pytest.raises(ValueError):
+            ResourceAllocation.contiguous(2, 4, modulations=["QPSK", "64QAM"])
+
+
+class TestOFDMASimulator:
+    """Test batched multi-UE simulation."""
+
+    def test_per_ue_statistics(self):
+        """Test that per-UE BER follows each UE's SNR and modulation."""
+        allocation = ResourceAllocation.contiguous(
+            n_ue=4,
+            n_rb=52,
+            modulations=["QPSK", "QPSK", "16QAM", "16QAM"],
+            snr_db=[0, 40, 0, 40],
+        )
+        results = OFDMASimulator(n_rb=52, seed=1).simulate_slots(allocation, n_slots=20)
+
+        assert results["ber"][0] > 10 * results["ber"][1]
+        assert results["ber"][2] > 10 * results["ber"][3]
+        assert results["ber"][0] < 0.5 and results["ber"][2] < 0.5
+        assert list(results["bits_per_slot"]) == [
+            13 * 12 * 14 * b for b in (2, 2, 4, 4)
+        ]
+
+    def test_unallocated_ue_reports_zero(self):
+        """Test that a UE without RBs gets no bits and no throughput."""
+        allocation = ResourceAllocation.from_rb_sets([[0, 1], []], n_rb=4, snr_db=60)
+        results = OFDMASimulator(n_rb=4).simulate_slots(allocation, n_slots=3)
+
+        assert results["bits_per_slot"][1] == 0
+        assert results["ber"][1] == 0 and results["throughput"][1] == 0
+        assert results["throughput"][0] > 0
+
+    def test_throughput_counts_error_free_slots(self):
+        """Test that throughput only counts slots without bit errors."""
+        allocation = ResourceAllocation.contiguous(n_ue=2, n_rb=10, snr_db=[80, -10])
+        results = OFDMASimulator(n_rb=10, delay_spread=0).simulate_slots(
+            allocation, n_slots=4
+        )
+
+        assert results["bler"][0] == 0 and results["bler"][1] == 1
+        assert results["throughput"][0] == results["bits_per_slot"][0] / 1e-3
+        assert results["cell_throughput"] == results["throughput"][0]
+
+    def test_isolated_from_other_ues(self):
+        """Test that adding UEs elsewhere in the band does not change a UE's bits."""
+        alone = ResourceAllocation.from_rb_sets([[0, 1, 2]], n_rb=12, snr_db=60)
+        shared = ResourceAllocation.from_rb_sets(
+            [[0, 1, 2], [3, 4], [5]], n_rb=12, snr_db=[60, 0, 0]
+        )
+
+        assert OFDMASimulator(n_rb=12).simulate_slots(alone)["errors"][0] == 0
+        assert OFDMASimulator(n_rb=12).simulate_slots(shared)["errors"][0] == 0
+
+    def test_hundreds_of_ues(self):
+        """Test a slot with hundreds of UEs is processed in one pass."""
+        allocation = ResourceAllocation.contiguous(
+            n_ue=270, n_rb=273, snr_db=np.linspace(0, 40, 270)
+        )
+        results = OFDMASimulator(n_rb=273).simulate_slots(allocation, n_slots=2)
+
+        assert results["ber"].shape == (270,)
+        assert results["ber"][:10].mean() > results["ber"][-10:].mean()
@@ -0,0 +1,142 @@
+"""
+Tests for PAPR analysis and PA models.
+"""
+
+import numpy as np
+import pytest
+from radio_sim.ofdm import OFDMSimulator
+from radio_sim.papr import (
+    CCDFAccumulator,
+    TablePA,
+    apply_backoff,
+    measure_papr_ccdf,
+    oversampled_symbols,
+    papr_db,
+    rapp,
+    soft_clip,
+)
+
+
+def random_freq_symbols(n_symbols, seed=0):
+    """Random QPSK frequency-domain OFDM symbols."""
+    simulator = OFDMSimulator(seed=seed)
+    bits = simulator.generate_bits(n_symbols * 2 * simulator.n_subcarriers)
+    return simulator.modulate(bits).reshape(n_symbols, simulator.n_subcarriers)
+
+
+class TestPAPR:
+    """Test PAPR computation and CCDF accumulation."""
+
+    def test_constant_envelope(self):
+        """Test that a constant-envelope signal has 0 dB PAPR."""
+        signal = np.exp(1j * np.linspace(0, 10, 64))[np.newaxis, :]
+        assert np.allclose(papr_db(signal), 0.0)
+
+    def test_single_tone_peak(self):
+        """Test PAPR of an impulse over N samples is 10*log10(N)."""
+        signal = np.zeros((3, 64), dtype=complex)
+        signal[:, 5] = 1.0
+        assert np.allclose(papr_db(signal), 10 * np.log10(64))
+
+    def test_oversampling_interpolates(self):
+        """Test that oversampled symbols contain the Nyquist-rate samples."""
+        freq_symbols = random_freq_symbols(8)
+        simulator = OFDMSimulator()
+        nyquist = simulator.generate_ofdm_symbols(freq_symbols.ravel())
+
+        assert np.allclose(oversampled_symbols(freq_symbols, 1), nyquist)
+        assert np.allclose(oversampled_symbols(freq_symbols, 4)[:, ::4], nyquist)
+        assert np.all(
+            papr_db(oversampled_symbols(freq_symbols, 4)) >= papr_db(nyquist) - 1e-9
+        )
+
+    def test_streaming_matches_batch(self):
+        """Test that batch-by-batch accumulation equals one large batch."""
+        values = papr_db(oversampled_symbols(random_freq_symbols(3000)))
+        streamed = CCDFAccumulator()
+        for batch in np.array_split(values, 7):
+            streamed.update(batch)
+        whole = CCDFAccumulator()
+        whole.update(values)
+
+        assert np.array_equal(streamed.counts, whole.counts)
+        thresholds, exceed = whole.ccdf()
+        assert exceed[0] == 1.0
+        assert np.all(np.diff(exceed) <= 0)
+        # Histogram CCDF agrees with the empirical CCDF to the bin width
+        assert abs(np.mean(values > whole.papr_at(0.1)) - 0.1) < 0.01
+
+    def test_merge(self):
+        """Test merging accumulators from separate workers."""
+        first = measure_papr_ccdf(OFDMSimulator(seed=1), 500)
+        second = measure_papr_ccdf(OFDMSimulator(seed=2), 500)
+        first.merge(second)
+
+        assert first.n_symbols == 1000
+        with pytest.raises(ValueError):
+            first.merge(CCDFAccumulator(resolution_db=0.1))
+
+    def test_ofdm_ccdf_range(self):
+        """Test that 64-subcarrier OFDM has the expected PAPR distribution."""
+        accumulator = measure_papr_ccdf(OFDMSimulator(), 20000, batch_symbols=3000)
+
+        assert accumulator.n_symbols == 20000
+        assert 7.5 < accumulator.papr_at(1e-1) < 9.5
+        assert accumulator.papr_at(1e-3) > accumulator.papr_at(1e-1)
+        assert accumulator.peak_db <= 10 * np.log10(64)
+
+
+class TestPAModels:
+    """Test memoryless PA models."""
+
+    def test_rapp_saturates(self):
+        """Test Rapp model gain is linear at low drive and saturates."""
+        amplitude = np.array([1e-3, 1.0, 1000.0])
+        output = np.abs(rapp(amplitude.astype(complex), smoothness=3))
+
+        assert np.isclose(output[0], 1e-3)
+        assert output[1] < 1.0 and np.isclose(output[-1], 1.0)
+
+    def test_soft_clip_preserves_phase(self):
+        """Test that clipping limits amplitude but keeps phase."""
+        signal = np.array([0.5j, 2 * np.exp(1j), 0.0])
+        clipped = soft_clip(signal, clip_level=1.0)
+
+        assert np.allclose(np.abs(clipped), [0.5, 1.0, 0.0])
+        assert np.isclose(np.angle(clipped[1]), 1.0)
+
+    def test_table_pa(self):
+        """Test AM/AM and AM/PM table interpolation."""
+        pa = TablePA([0, 1, 2], [0, 1, 1.5], phase_shift_deg=[0, 0, 90])
+        output = pa(np.array([0.5, 1.5 + 0j]))
+
+        assert np.allclose(np.abs(output), [0.5, 1.25])
+        assert np.isclose(np.angle(output[1], deg=True), 45)
+
+    def test_table_requires_increasing_input(self):
+        """Test that table inputs must be increasing."""
+        with pytest.raises(ValueError):
+            TablePA([0, 2, 1], [0, 1, 2])
+
+    def test_backoff_reduces_distortion(self):
+        """Test that larger backoff brings the PA closer to linear."""
+        signal = oversampled_symbols(random_freq_symbols(100), 1)
+
+        def distortion(backoff_db):
+            output = apply_backoff(signal, rapp, backoff_db)
+            return np.mean(np.abs(output - signal) ** 2)
+
+        assert distortion(0) > distortion(6) > distortion(15)
+
+    def test_ber_impact_of_backoff(self):
+        """Test that 16-QAM BER degrades when the PA is driven into compression."""
+        compressed, _ = OFDMSimulator(modulation="16QAM").simulate_pa_transmission(
+            50000, 30, soft_clip, input_backoff_db=0
+        )
+        backed_off, sim_data = OFDMSimulator(
+            modulation="16QAM"
+        ).simulate_pa_transmission(50000, 30, soft_clip, input_backoff_db=12)
+
+        assert compressed > 1e-3
+        assert backed_off < compressed / 10
+        assert len(sim_data["papr_db"]) == -(-50000 // 4 // 64)
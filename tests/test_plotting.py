@@ -0,0 +1,146 @@
+"""
+Tests for density plotting of long runs.
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from radio_sim.ofdm import OFDMSimulator, plot_constellation
+from radio_sim.plotting import (
+    ConstellationHistogram,
+    eye_traces,
+    measure_constellation,
+    minmax_decimate,
+    plot_eye_diagram,
+    plot_time_domain,
+)
+
+plt.switch_backend("Agg")
+
+
+class TestConstellationHistogram:
+    """Test streaming constellation histograms."""
+
+    def test_chunks_match_single_update(self):
+        """Test that accumulating chunks equals binning everything at once."""
+        rng = np.random.default_rng(0)
+        symbols = rng.normal(size=10000) + 1j * rng.normal(size=10000)
+
+        whole = ConstellationHistogram(extent=2.0, bins=64)
+        whole.update(symbols)
+        chunked = ConstellationHistogram(extent=2.0, bins=64)
+        for chunk in np.array_split(symbols, 7):
+            chunked.update(chunk)
+
+        assert np.array_equal(whole.counts, chunked.counts)
+        assert whole.outside == chunked.outside > 0
+        assert chunked.n_symbols == len(symbols)
+
+    def test_matches_histogram2d(self):
+        """Test binning against numpy.histogram2d (rows are Q)."""
+        rng = np.random.default_rng(1)
+        symbols = rng.uniform(-1, 1, 5000) + 1j * rng.uniform(-1, 1, 5000)
+        histogram = ConstellationHistogram(extent=1.0, bins=32)
+        histogram.update(symbols)
+
+        expected, _, _ = np.histogram2d(
+            symbols.imag, symbols.real, bins=32, range=[[-1, 1], [-1, 1]]
+        )
+        assert np.array_equal(histogram.counts, expected)
+        assert np.isclose(histogram.density().sum(), 1.0)
+
+    def test_merge(self):
+        """Test merging histograms and rejecting mismatched grids."""
+        a = ConstellationHistogram(bins=16)
+        b = ConstellationHistogram(bins=16)
+        a.update(np.array([0.1 + 0.1j]))
+        b.update(np.array([0.1 + 0.1j, 5.0]))
+        a.merge(b)
+
+        assert a.n_symbols == 3
+        assert a.outside == 1
+        with pytest.raises(ValueError):
+            a.merge(ConstellationHistogram(bins=8))
+
+    def test_measure_constellation(self):
+        """Test that received QPSK clusters around the ideal points."""
+        simulator = OFDMSimulator(modulation="QPSK", seed=3)
+        histogram = measure_constellation(simulator, 50, snr_db=20, batch_symbols=16)
+
+        assert histogram.n_symbols == 50 * simulator.n_subcarriers
+        assert histogram.outside == 0
+        # Peak bin lies next to an ideal constellation point
+        q, i = np.unravel_index(np.argmax(histogram.counts), histogram.counts.shape)
+        width = 2 * histogram.extent / histogram.bins
+        peak = (
+            (i + 0.5) * width
+            - histogram.extent
+            + 1j * ((q + 0.5) * width - histogram.extent)
+        )
+        assert np.min(np.abs(simulator.constellation - peak)) < 0.15
+
+
+class TestDecimation:
+    """Test decimated time-domain and eye-diagram views."""
+
+    def test_minmax_keeps_extremes(self):
+        """Test that the envelope keeps global peaks and respects the point budget."""
+        rng = np.random.default_rng(0)
+        signal = rng.normal(size=100003)
+        signal[54321] = 50.0
+        signal[777] = -50.0
+        indices, values = minmax_decimate(signal, max_points=500)
+
+        assert len(indices) <= 500
+        assert np.all(np.diff(indices) >= 0)
+        assert np.array_equal(values, signal[indices])
+        assert values.max() == 50.0 and values.min() == -50.0
+
+    def test_minmax_short_signal_unchanged(self):
+        """Test that short signals are returned whole."""
+        signal = np.arange(10.0)
+        indices, values = minmax_decimate(signal, max_points=100)
+        assert np.array_equal(values, signal)
+
+    def test_eye_traces(self):
+        """Test trace shape, bound and alignment to symbol boundaries."""
+        signal = np.arange(1000.0)
+        traces = eye_traces(signal, samples_per_symbol=8, span=2, max_traces=20)
+
+        assert traces.shape == (20, 17)
+        assert np.all(traces[:, 0] % 8 == 0)
+        assert np.all(np.diff(traces, axis=1) == 1)
+        with pytest.raises(ValueError):
+            eye_traces(np.zeros(10), samples_per_symbol=8)
+
+
+class TestPlots:
+    """Test that plots render without retaining every point."""
+
+    def teardown_method(self):
+        plt.close("all")
+
+    def test_density_and_decimated_plots(self):
+        """Test histogram, time-domain and eye-diagram plots on one figure."""
+        rng = np.random.default_rng(0)
+        signal = rng.normal(size=50000) + 1j * rng.normal(size=50000)
+        histogram = ConstellationHistogram()
+        histogram.update(signal)
+
+        _, axes = plt.subplots(1, 3)
+        histogram.plot(ax=axes[0], reference=np.array([1 + 1j]))
+        plot_time_domain(signal, ax=axes[1], max_points=400)
+        plot_eye_diagram(signal, samples_per_symbol=4, ax=axes[2], max_traces=50)
+
+        assert all(len(line.get_xdata()) <= 400 for line in axes[1].get_lines())
+        assert len(axes[2].get_lines()) == 50
+
+    def test_plot_constellation_uses_density_for_large_input(self, monkeypatch):
+        """Test that plot_constellation draws a heatmap above the scatter limit."""
+        monkeypatch.setattr(plt, "show", lambda: None)
+        rng = np.random.default_rng(0)
+        plot_constellation(rng.normal(size=20000) + 1j * rng.normal(size=20000))
+
+        ax = plt.gcf().axes[0]
+        assert len(ax.get_images()) == 1
+        assert len(ax.collections) == 0
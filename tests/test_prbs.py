@@ -0,0 +1,78 @@
+"""
+Tests for PRBS (PN) sequence generation.
+"""
+
+import pytest
+import numpy as np
+from radio_sim.prbs import PRBS_INVERTED, PRBS_POLYNOMIALS, PRBSGenerator, prbs_period
+
+
+def reference_lfsr(order, n_bits):
+    """Bit-serial Fibonacci LFSR used as a reference."""
+    a, b = PRBS_POLYNOMIALS[order]
+    bits = [1] * a
+    while len(bits) < n_bits:
+        bits.append(bits[-a] ^ bits[-b])
+    output = np.array(bits[:n_bits], dtype=np.uint8)
+    return output ^ 1 if order in PRBS_INVERTED else output
+
+
+def longest_run(bits, value):
+    """Length of the longest run of ``value`` in a cyclic bit sequence."""
+    padded = np.concatenate([[1 - value], np.tile(bits, 2), [1 - value]])
+    edges = np.flatnonzero(np.diff(padded == value))
+    return int(np.max(edges[1::2] - edges[::2]))
+
+
+class TestPRBS:
+    """Test vectorized PRBS generation."""
+
+    @pytest.mark.parametrize("order", [7, 9, 11, 15])
+    def test_matches_bit_serial_lfsr(self, order):
+        """Test that the vectorized period equals a bit-serial LFSR."""
+        period = prbs_period(order)
+        reference = reference_lfsr(order, len(period) + order)
+
+        length = len(period)
+        np.testing.assert_array_equal(period, reference[:length])
+        # Maximal length: the LFSR state repeats after exactly 2^order - 1 bits
+        np.testing.assert_array_equal(reference[length:], period[:order])
+
+    @pytest.mark.parametrize(
+        "order, zeros, inverted",
+        [
+            (9, 8, False),
+            (11, 10, False),
+            (15, 15, True),
+            (23, 23, True),
+        ],
+    )
+    def test_o150_longest_zero_run(self, order, zeros, inverted):
+        """Test each pattern's longest zero run and output polarity from O.150."""
+        period = prbs_period(order)
+
+        assert longest_run(period, 0) == zeros
+        assert longest_run(period, 1) == (order - 1 if inverted else order)
+
+    def test_pn23_balance(self):
+        """Test PN23 period length and ones/zeros balance of the inverted output."""
+        period = prbs_period(23)
+
+        assert len(period) == 2**23 - 1
+        assert np.sum(period) == 2**22 - 1
+
+    def test_generator_continues_across_calls(self):
+        """Test that chunked generation wraps around the period seamlessly."""
+        generator = PRBSGenerator(9)
+        chunks = np.concatenate([generator.next_bits(300) for _ in range(4)])
+
+        np.testing.assert_array_equal(chunks, np.resize(prbs_period(9), 1200))
+
+    def test_unsupported_order(self):
+        """Test that unknown orders are rejected."""
+        with pytest.raises(ValueError):
+            prbs_period(31)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,89 @@
+"""
+Tests for the Robot Framework keyword library.
+"""
+
+import numpy as np
+import pytest
+import radio_sim.robot_library as robot_library
+from radio_sim.robot_library import RadioSimLibrary
+
+
+class TestRadioSimLibrary:
+    """Test keywords by calling them directly."""
+
+    def test_run_ofdm_sweep(self):
+        """Test that a sweep returns the run_simulation results."""
+        library = RadioSimLibrary()
+        results = library.run_ofdm_sweep(
+            modulation="16QAM", bits=2000, snr_start=10, snr_stop=20, snr_step=5
+        )
+
+        assert results["modulation"] == "16QAM"
+        assert list(results["snr_values"]) == [10, 15, 20]
+        assert len(results["ber_values"]) == 3
+
+    def test_sweeps_are_cached(self, monkeypatch):
+        """Test that repeating a configuration does not re-simulate."""
+        calls = []
+        original = robot_library.run_simulation
+
+        def counting(**kwargs):
+            calls.append(kwargs)
+            return original(**kwargs)
+
+        monkeypatch.setattr(robot_library, "run_simulation", counting)
+        library = RadioSimLibrary()
+        first = library.run_ofdm_sweep(bits=1000, snr_start=0, snr_stop=4)
+        second = library.run_ofdm_sweep(bits=1000, snr_start=0, snr_stop=4)
+        library.run_ofdm_sweep(bits=2000, snr_start=0, snr_stop=4)
+
+        assert first is second
+        assert len(calls) == 2
+
+        library.clear_simulation_cache()
+        library.run_ofdm_sweep(bits=1000, snr_start=0, snr_stop=4)
+        assert len(calls) == 3
+
+    def test_ber_at_snr(self):
+        """Test BER lookup for the last sweep and for explicit results."""
+        library = RadioSimLibrary()
+        results = library.run_ofdm_sweep(
+            bits=2000, snr_start=0, snr_stop=10, snr_step=5
+        )
+
+        assert library.ber_at_snr(0) == results["ber_values"][0]
+        other = {"snr_values": np.array([3]), "ber_values": np.array([0.25])}
+        assert library.ber_at_snr(3, results=other) == 0.25
+        with pytest.raises(AssertionError, match="not in sweep"):
+            library.ber_at_snr(7)
+
+    def test_ber_threshold_keywords(self):
+        """Test pass and fail paths of the BER checks."""
+        library = RadioSimLibrary()
+        library.run_ofdm_sweep(bits=20000, snr_start=0, snr_stop=20, snr_step=5)
+
+        library.ber_at_snr_should_be_below(20, 1e-5)
+        library.ber_should_be_below_from_snr(15, 1e-5)
+        library.ber_should_decrease_with_snr()
+        with pytest.raises(AssertionError, match="at 0 dB"):
+            library.ber_at_snr_should_be_below(0, 1e-3)
+        with pytest.raises(AssertionError, match="BER not below"):
+            library.ber_should_be_below_from_snr(0, 1e-3)
+
+    def test_increasing_ber_detected(self):
+        """Test that a non-monotone BER curve fails."""
+        results = {
+            "snr_values": np.array([0, 5, 10]),
+            "ber_values": np.array([0.1, 0.2, 0.0]),
+        }
+        with pytest.raises(AssertionError, match="0 and 5 dB"):
+            RadioSimLibrary().ber_should_decrease_with_snr(results)
+
+    def test_checks_require_a_sweep(self):
+        """Test that checking before running a sweep fails clearly."""
+        with pytest.raises(AssertionError, match="Run OFDM Sweep"):
+            RadioSimLibrary().ber_at_snr(10)
+
+    def test_library_scope(self):
+        """Test that one library instance is shared across the suite."""
+        assert RadioSimLibrary.ROBOT_LIBRARY_SCOPE == "GLOBAL"
@@ -0,0 +1,164 @@
+"""
+Tests for the asyncio simulation service.
+"""
+
+import asyncio
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from radio_sim.main import run_simulation
+from radio_sim.service import SimulationService, SweepConfig, request_sweep
+
+
+class TestSweepConfig:
+    """Test request parsing and validation."""
+
+    def test_from_dict(self):
+        """Test building a configuration from a request body."""
+        config = SweepConfig.from_dict(
+            {"modulation": "16QAM", "n_bits": 2000, "snr_range": [10, 14, 2], "seed": 7}
+        )
+
+        assert config.modulation == "16QAM"
+        assert config.seed == 7
+        assert list(config.snr_values) == [10, 12, 14]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"modulation": "INVALID"},
+            {"n_bits": 0},
+            {"snr_range": [0, 10]},
+            {"snr_range": [0, 10, 0]},
+        ],
+    )
+    def test_invalid_requests(self, payload):
+        """Test that invalid requests are rejected."""
+        with pytest.raises(ValueError):
+            SweepConfig.from_dict(payload)
+
+
+class TestSimulationService:
+    """Test coalescing and the HTTP front end."""
+
+    def test_concurrent_identical_requests_are_coalesced(self):
+        """Test that identical concurrent sweeps share one computation."""
+        config = SweepConfig(n_bits=1000, snr_start=0, snr_stop=10, snr_step=5)
+        service = SimulationService(executor=ThreadPoolExecutor(max_workers=2))
+
+        async def collect():
+            return [point async for point in service.sweep(config)]
+
+        async def run_both():
+            return await asyncio.gather(collect(), collect())
+
+        try:
+            first, second = asyncio.run(run_both())
+        finally:
+            service.executor.shutdown()
+
+        assert service.points_computed == len(config.snr_values)
+        assert [p["snr_db"] for p in first] == [0.0, 5.0, 10.0]
+        assert first == second
+
+    def test_sweep_matches_run_simulation(self):
+        """Test that a sweep returns the same BERs as the CLI sweep."""
+        config = SweepConfig(
+            modulation="16QAM",
+            n_bits=2000,
+            snr_start=0,
+            snr_stop=12,
+            snr_step=4,
+            seed=3,
+        )
+        service = SimulationService(executor=ThreadPoolExecutor(max_workers=1))
+
+        async def collect():
+            return [point async for point in service.sweep(config)]
+
+        try:
+            points = asyncio.run(collect())
+        finally:
+            service.executor.shutdown()
+
+        expected = run_simulation("16QAM", 2000, (0, 12, 4), seed=3)
+        assert [p["ber"] for p in points] == list(expected["ber_values"])
+
+    def test_http_streaming_roundtrip(self):
+        """Test streaming a sweep over HTTP from a process-pool service."""
+        config = SweepConfig(n_bits=1000, snr_start=10, snr_stop=15, snr_step=5)
+
+        async def roundtrip():
+            service = SimulationService(max_workers=2)
+            server = await service.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    None, lambda: list(request_sweep(config, port=port))
+                )
+            finally:
+                server.close()
+                await server.wait_closed()
+                service.close()
+
+        messages = asyncio.run(roundtrip())
+
+        points, summary = messages[:-1], messages[-1]
+        assert len(points) == 2
+        assert summary["summary"] is True
+        assert summary["snr_values"] == [10.0, 15.0]
+        assert summary["modulation"] == "QPSK"
+
+    def test_http_rejects_invalid_request(self):
+        """Test that invalid sweeps produce an error instead of a stream."""
+        config = SweepConfig(modulation="INVALID")
+
+        async def roundtrip():
+            service = SimulationService(executor=ThreadPoolExecutor(max_workers=1))
+            server = await service.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    None, lambda: list(request_sweep(config, port=port))
+                )
+            finally:
+                server.close()
+                await server.wait_closed()
+                service.executor.shutdown()
+
+        with pytest.raises(RuntimeError, match="400"):
+            asyncio.run(roundtrip())
+
+    @pytest.mark.parametrize(
+        "request_bytes",
+        [
+            b"GARBAGE\r\n\r\n",
+            b'POST /simulate HTTP/1.1\r\nContent-Length: 100\r\n\r\n{"n_bits"',
+        ],
+    )
+    def test_http_closes_malformed_and_truncated_requests(self, request_bytes):
+        """Test that bad or truncated requests get a 400 and a closed connection."""
+
+        async def roundtrip():
+            service = SimulationService(executor=ThreadPoolExecutor(max_workers=1))
+            server = await service.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(request_bytes)
+                writer.write_eof()
+                # read() returns only once the server has closed the connection
+                response = await asyncio.wait_for(reader.read(), timeout=5)
+                writer.close()
+                return response
+            finally:
+                server.close()
+                await server.wait_closed()
+                service.executor.shutdown()
+
+        assert asyncio.run(roundtrip()).startswith(b"HTTP/1.1 400")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
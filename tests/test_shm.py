@@ -0,0 +1,113 @@
+"""
+Tests for the shared-memory worker transport.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+from radio_sim.shm import SharedArrayPool, attach_arrays, parallel_ber_sweep
+
+
+def _double_in_place(specs):
+    """Worker: write twice the input into the shared output."""
+    with attach_arrays(specs) as arrays:
+        arrays["output"][...] = 2 * arrays["input"]
+
+
+def _die_after_attach(specs):
+    """Worker: attach, write, then terminate without any cleanup."""
+    with attach_arrays(specs) as arrays:
+        arrays["input"][0] = 7
+        os._exit(1)
+
+
+class TestSharedArrayPool:
+    """Test shared array allocation and lifecycle."""
+
+    def test_share_copies_data(self):
+        """Test that shared arrays hold a copy of the source data."""
+        source = np.arange(12, dtype=np.complex128).reshape(3, 4)
+        with SharedArrayPool() as pool:
+            shared = pool.share("table", source)
+            spec = pool.specs["table"]
+
+            assert np.array_equal(shared, source)
+            assert spec.shape == (3, 4)
+            assert np.dtype(spec.dtype) == np.complex128
+
+    def test_close_unlinks_segments(self):
+        """Test that closing the pool removes every segment."""
+        pool = SharedArrayPool()
+        pool.create("a", (4,))
+        pool.create("b", 8, np.int64)
+        names = [spec.name for spec in pool.specs.values()]
+        pool.close()
+
+        for name in names:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_duplicate_key_rejected(self):
+        """Test that a key cannot be allocated twice."""
+        with SharedArrayPool() as pool:
+            pool.create("a", 4)
+            with pytest.raises(ValueError):
+                pool.create("a", 4)
+
+    def test_worker_writes_in_place(self):
+        """Test that workers read inputs and write outputs zero-copy."""
+        with SharedArrayPool() as pool:
+            pool.share("input", np.arange(1000, dtype=np.float64))
+            output = pool.create("output", 1000)
+
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                executor.submit(_double_in_place, pool.specs).result()
+
+            assert np.array_equal(output, 2 * np.arange(1000))
+
+    def test_worker_crash_does_not_leak(self):
+        """Test that a killed worker leaves segments intact for the parent to unlink."""
+        pool = SharedArrayPool()
+        pool.create("input", 16)
+        name = pool.specs["input"].name
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(BrokenProcessPool):
+                executor.submit(_die_after_attach, pool.specs).result()
+
+        # The worker's write is visible and the segment still exists by name
+        assert pool.arrays["input"][0] == 7
+        survivor = shared_memory.SharedMemory(name=name)
+        survivor.close()
+
+        pool.close()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+class TestParallelSweep:
+    """Test the shared-memory parallel BER sweep."""
+
+    def test_independent_of_worker_count(self):
+        """Test that results do not depend on the number of workers."""
+        single = parallel_ber_sweep(n_bits=4096, snr_values=(0, 5, 10), max_workers=1)
+        multi = parallel_ber_sweep(n_bits=4096, snr_values=(0, 5, 10), max_workers=3)
+
+        assert np.array_equal(single["ber_values"], multi["ber_values"])
+
+    def test_ber_decreases_with_snr(self):
+        """Test that the parallel sweep produces a sensible BER curve."""
+        results = parallel_ber_sweep(
+            n_bits=20000, snr_values=(0, 10, 20), max_workers=2
+        )
+
+        assert (
+            results["ber_values"][0]
+            > results["ber_values"][1]
+            >= results["ber_values"][2]
+        )
+        assert results["ber_values"][0] < 0.5
@@ -0,0 +1,92 @@
+"""
+Tests for the target-BER SNR search.
+"""
+
+import pytest
+import numpy as np
+from scipy.stats import norm
+from radio_sim.snr_search import find_snr_for_ber
+
+
+def analytic_ber(snr_db):
+    """Smooth, monotone BER curve with a known inverse."""
+    return float(norm.sf(np.sqrt(10 ** (snr_db / 10))))
+
+
+class TestSNRSearch:
+    """Test bracketing, curve fitting and stopping."""
+
+    def test_converges_on_analytic_curve(self):
+        """Test that the search finds the exact crossing with few points."""
+        result = find_snr_for_ber(1e-5, ber_function=analytic_ber, tolerance=0.05)
+        expected = 10 * np.log10(norm.isf(1e-5) ** 2)
+
+        assert abs(result["snr_db"] - expected) < 0.05
+        assert result["n_points"] <= 10
+        lo, hi = result["bracket"]
+        assert hi - lo <= 0.05
+
+    def test_reuses_points(self):
+        """Test that no SNR point is simulated twice."""
+        calls = []
+
+        def counting_ber(snr_db):
+            calls.append(snr_db)
+            return analytic_ber(snr_db)
+
+        result = find_snr_for_ber(1e-3, ber_function=counting_ber)
+
+        assert len(calls) == len(set(calls)) == result["n_points"]
+        np.testing.assert_array_equal(result["snr_values"], sorted(calls))
+
+    def test_widens_bracket(self):
+        """Test that a target outside the initial bounds is still found."""
+        result = find_snr_for_ber(1e-6, ber_function=analytic_ber, snr_bounds=(0, 5))
+
+        assert 5 < result["snr_db"] < 20
+
+    def test_fits_past_zero_ber_points(self):
+        """Test that zero-BER points at the top of the bracket keep the fit usable."""
+
+        def counted_ber(snr_db):
+            # Errors counted over 1e5 bits, so high SNR points measure BER 0
+            return np.floor(analytic_ber(snr_db) * 1e5) / 1e5
+
+        result = find_snr_for_ber(1e-3, ber_function=counted_ber, tolerance=0.1)
+        expected = 10 * np.log10(norm.isf(1e-3) ** 2)
+
+        assert result["ber_values"][-1] == 0
+        assert abs(result["snr_db"] - expected) < 0.1
+        # Plain bisection of (0, 20) dB to 0.1 dB needs 10 points
+        assert result["n_points"] <= 7
+
+    def test_invalid_bounds(self):
+        """Test that empty or reversed SNR bounds are rejected up front."""
+        for bounds in [(12, 12), (20, 0)]:
+            with pytest.raises(ValueError, match="low < high"):
+                find_snr_for_ber(1e-3, ber_function=analytic_ber, snr_bounds=bounds)
+
+    def test_widening_respects_point_budget(self):
+        """Test that a target that is never reached stops after max_points."""
+        with pytest.raises(ValueError, match="within 5 points"):
+            find_snr_for_ber(1e-3, ber_function=lambda snr_db: 0.1, max_points=5)
+
+    def test_simulated_search(self):
+        """Test a search driven by the OFDM simulator."""
+        result = find_snr_for_ber(
+            1e-2, {"modulation": "QPSK", "n_bits": 20000}, tolerance=0.25
+        )
+
+        assert 4 < result["snr_db"] < 12
+        assert result["n_points"] < 15
+
+    def test_unresolvable_target(self):
+        """Test that too few bits for the target BER are rejected."""
+        with pytest.raises(ValueError, match="cannot resolve"):
+            find_snr_for_ber(1e-6, {"n_bits": 1000})
+        with pytest.raises(ValueError):
+            find_snr_for_ber(0.7, ber_function=analytic_ber)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
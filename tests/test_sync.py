@@ -0,0 +1,134 @@
+"""
+Tests for time/frequency synchronization.
+"""
+
+import numpy as np
+import pytest
+from radio_sim.ofdm import OFDMSimulator
+from radio_sim.sync import (
+    add_cyclic_prefix,
+    apply_cfo,
+    apply_timing_offset,
+    correct_common_phase,
+    cp_sync,
+    preamble_sync,
+    remove_cyclic_prefix,
+    schmidl_cox_preamble,
+)
+
+N_FFT, CP = 64, 16
+
+
+def ofdm_stream(n_symbols, seed=0):
+    """Serialized random QPSK CP-OFDM symbols."""
+    simulator = OFDMSimulator(seed=seed)
+    symbols = simulator.modulate(simulator.generate_bits(n_symbols * 2 * N_FFT))
+    return add_cyclic_prefix(simulator.generate_ofdm_symbols(symbols), CP).ravel()
+
+
+def add_noise(signal, snr_db, seed=0):
+    """Add complex AWGN relative to unit signal power."""
+    rng = np.random.default_rng(seed)
+    std = np.sqrt(10 ** (-snr_db / 10) / 2)
+    return signal + std * (
+        rng.normal(size=len(signal)) + 1j * rng.normal(size=len(signal))
+    )
+
+
+class TestCyclicPrefix:
+    """Test cyclic prefix insertion and removal."""
+
+    def test_roundtrip(self):
+        """Test that removing the CP recovers the symbols."""
+        symbols = np.arange(3 * N_FFT, dtype=complex).reshape(3, N_FFT)
+        with_cp = add_cyclic_prefix(symbols, CP)
+
+        assert with_cp.shape == (3, N_FFT + CP)
+        assert np.array_equal(with_cp[:, :CP], symbols[:, -CP:])
+        assert np.array_equal(remove_cyclic_prefix(with_cp.ravel(), N_FFT, CP), symbols)
+
+    def test_too_few_symbols(self):
+        """Test that requesting more symbols than present fails."""
+        with pytest.raises(ValueError):
+            remove_cyclic_prefix(np.zeros(100, dtype=complex), N_FFT, CP, n_symbols=2)
+
+
+class TestEstimators:
+    """Test CP- and preamble-based timing/CFO estimation."""
+
+    @pytest.mark.parametrize("offset, cfo", [(0, 0.0), (23, 0.31), (71, -0.42)])
+    def test_cp_sync(self, offset, cfo):
+        """Test blind CP-based timing and CFO estimation."""
+        rx = apply_cfo(
+            add_noise(apply_timing_offset(ofdm_stream(40), offset), 15), cfo, N_FFT
+        )
+        result = cp_sync(rx, N_FFT, CP, snr_db=15)
+
+        assert result.timing == offset
+        assert abs(result.cfo - cfo) < 0.01
+        assert len(result.metric) == N_FFT + CP
+
+    @pytest.mark.parametrize("offset, cfo", [(5, 0.0), (250, 0.8), (1000, -0.65)])
+    def test_preamble_sync(self, offset, cfo):
+        """Test Schmidl-Cox timing and CFO estimation beyond +-0.5."""
+        preamble = schmidl_cox_preamble(N_FFT)
+        burst = np.concatenate([preamble, ofdm_stream(10)])
+        rx = apply_cfo(add_noise(apply_timing_offset(burst, offset), 10), cfo, N_FFT)
+        result = preamble_sync(rx, preamble)
+
+        assert result.timing == offset
+        assert abs(result.cfo - cfo) < 0.02
+        assert np.max(result.metric) <= 1 + 1e-9
+
+    def test_preamble_halves_repeat(self):
+        """Test that the preamble repeats after half a symbol at unit power."""
+        preamble = schmidl_cox_preamble(N_FFT)
+        half = N_FFT // 2
+        assert np.allclose(preamble[:half], preamble[half:])
+        assert np.isclose(np.mean(np.abs(preamble) ** 2), 1.0)
+
+    def test_common_phase_correction(self):
+        """Test that per-symbol rotations are removed and anchored to zero."""
+        simulator = OFDMSimulator()
+        grid = simulator.modulate(simulator.generate_bits(20 * 2 * N_FFT)).reshape(
+            20, N_FFT
+        )
+        rotation = 0.3 + np.cumsum(np.full(20, 0.2))
+        rotated = grid * np.exp(1j * rotation)[:, np.newaxis]
+
+        assert np.allclose(
+            correct_common_phase(rotated, simulator.constellation, reference=0.5), grid
+        )
+
+
+class TestSyncTransmission:
+    """Test the end-to-end synchronized receiver."""
+
+    @pytest.mark.parametrize("method", ["preamble", "cp"])
+    def test_impaired_link_matches_ideal(self, method):
+        """Test that sync recovers an impaired link at high SNR."""
+        simulator = OFDMSimulator(seed=3)
+        ber, sim_data = simulator.simulate_sync_transmission(
+            20000, 20, timing_offset=37, cfo=0.23, phase_noise_std=0.002, method=method
+        )
+
+        assert ber == 0.0
+        assert sim_data["timing_error"] == 0
+        assert abs(sim_data["cfo_error"]) < 0.01
+
+    def test_uncorrected_cfo_breaks_link(self):
+        """Test that the same CFO without correction would be destructive."""
+        simulator = OFDMSimulator(seed=3)
+        bits = simulator.generate_bits(4096)
+        symbols = simulator.modulate(bits)
+        rx = apply_cfo(simulator.generate_ofdm_symbols(symbols).ravel(), 0.23, N_FFT)
+        rx_bits = simulator.demodulate_symbols(
+            simulator.demodulate_ofdm(rx.reshape(-1, N_FFT))
+        )
+
+        assert simulator.calculate_ber(bits, rx_bits) > 0.1
+
+    def test_unknown_method(self):
+        """Test that unknown sync methods are rejected."""
+        with pytest.raises(ValueError):
+            OFDMSimulator().simulate_sync_transmission(1000, 10, method="pilot")
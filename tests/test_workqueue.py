@@ -0,0 +1,176 @@
+"""
+Tests for the file-based distributed sweep work queue.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+from radio_sim.ofdm import OFDMSimulator
+from radio_sim.prbs import PRBSGenerator
+from radio_sim.workqueue import (
+    claim_unit,
+    complete_unit,
+    load_sweep,
+    merge_results,
+    plan_sweep,
+    queue_status,
+    requeue_stale,
+    run_unit,
+    run_worker,
+)
+
+
+SWEEP = dict(
+    modulation="QPSK", n_bits=4096, snr_range=(0, 8, 4), seed=7, unit_bits=1024
+)
+
+
+def run_all(queue_dir, n_workers):
+    """Drain a queue with several concurrent worker processes."""
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return sum(executor.map(run_worker, [queue_dir] * n_workers))
+
+
+class TestWorkQueue:
+    """Test planning, claiming and merging work units."""
+
+    def test_plan_creates_units(self, tmp_path):
+        """Test that a sweep is split into one file per unit."""
+        n_units = plan_sweep(str(tmp_path), **SWEEP)
+
+        assert n_units == 12
+        assert queue_status(str(tmp_path)) == {"pending": 12, "claimed": 0, "done": 0}
+
+    def test_replan_is_idempotent(self, tmp_path):
+        """Test that planning the same sweep twice does not duplicate units."""
+        plan_sweep(str(tmp_path), **SWEEP)
+        claim_unit(str(tmp_path))
+        plan_sweep(str(tmp_path), **SWEEP)
+
+        assert queue_status(str(tmp_path)) == {"pending": 11, "claimed": 1, "done": 0}
+
+    def test_replan_different_sweep_rejected(self, tmp_path):
+        """Test that a queue directory cannot be reused for another sweep."""
+        plan_sweep(str(tmp_path), **SWEEP)
+        with pytest.raises(ValueError):
+            plan_sweep(str(tmp_path), **dict(SWEEP, seed=8))
+
+    @pytest.mark.parametrize(
+        "overrides", [{"n_bits": 0}, {"n_bits": -100}, {"unit_bits": 0}]
+    )
+    def test_invalid_bit_counts_rejected(self, tmp_path, overrides):
+        """Test that non-positive bit counts are rejected before planning."""
+        with pytest.raises(ValueError, match="must be positive"):
+            plan_sweep(str(tmp_path), **dict(SWEEP, **overrides))
+        assert not os.listdir(tmp_path)
+
+    def test_each_unit_claimed_once(self, tmp_path):
+        """Test that claiming hands out every unit exactly once."""
+        plan_sweep(str(tmp_path), **SWEEP)
+        claimed = []
+        while (unit := claim_unit(str(tmp_path))) is not None:
+            claimed.append(unit["unit_id"])
+
+        assert sorted(claimed) == list(range(12))
+
+    def test_merge_independent_of_worker_count(self, tmp_path):
+        """Test that merged results do not depend on how many workers ran."""
+        single, multi = str(tmp_path / "single"), str(tmp_path / "multi")
+        for queue_dir in (single, multi):
+            plan_sweep(queue_dir, **SWEEP)
+
+        assert run_worker(single) == 12
+        assert run_all(multi, 3) == 12
+
+        single_results = merge_results(single)
+        multi_results = merge_results(multi)
+        assert np.array_equal(single_results["ber_values"], multi_results["ber_values"])
+        assert np.array_equal(single_results["snr_values"], [0, 4, 8])
+        assert single_results["ber_values"][0] > single_results["ber_values"][2]
+
+    def test_merge_incomplete_rejected(self, tmp_path):
+        """Test that merging before all units finish fails."""
+        plan_sweep(str(tmp_path), **SWEEP)
+        run_worker(str(tmp_path), max_units=5)
+
+        with pytest.raises(ValueError, match="5 of 12"):
+            merge_results(str(tmp_path))
+
+    def test_stale_claim_requeued(self, tmp_path):
+        """Test that units abandoned by a dead worker are processed again."""
+        queue_dir = str(tmp_path)
+        plan_sweep(queue_dir, **SWEEP)
+        abandoned = claim_unit(queue_dir)
+        claimed_path = os.path.join(
+            queue_dir, "claimed", f"unit-{abandoned['unit_id']:06d}.json"
+        )
+        os.utime(claimed_path, (time.time() - 100, time.time() - 100))
+
+        assert requeue_stale(queue_dir, timeout=1000) == 0
+        run_worker(queue_dir, stale_timeout=10)
+
+        assert queue_status(queue_dir) == {"pending": 0, "claimed": 0, "done": 12}
+        merge_results(queue_dir)
+
+    def test_late_completion_after_requeue(self, tmp_path):
+        """Test that a slow worker finishing a requeued unit is harmless."""
+        queue_dir = str(tmp_path)
+        plan_sweep(queue_dir, **SWEEP)
+        unit = claim_unit(queue_dir)
+        requeue_stale(queue_dir, timeout=0)
+        run_worker(queue_dir)
+
+        complete_unit(queue_dir, unit, run_unit(load_sweep(queue_dir), unit))
+        assert queue_status(queue_dir) == {"pending": 0, "claimed": 0, "done": 12}
+
+    def test_pn_units_continue_sequence(self, tmp_path, monkeypatch):
+        """Test that PN-sourced units together transmit one continuous sequence."""
+        queue_dir = str(tmp_path)
+        plan_sweep(queue_dir, **dict(SWEEP, bit_source="pn9"))
+        config = load_sweep(queue_dir)
+        assert config["bit_source"] == "pn9"
+
+        sent = {}
+        generate_bits = OFDMSimulator.generate_bits
+
+        def recording(simulator, n_bits):
+            bits = generate_bits(simulator, n_bits)
+            sent[current["unit_id"]] = bits
+            return bits
+
+        monkeypatch.setattr(OFDMSimulator, "generate_bits", recording)
+        while (current := claim_unit(queue_dir)) is not None:
+            run_unit(config, current)
+
+        stream = np.concatenate([sent[unit_id] for unit_id in sorted(sent)])
+        assert np.array_equal(stream, PRBSGenerator(9).next_bits(len(stream)))
+
+    def test_cli_roles(self, tmp_path):
+        """Test coordinator, worker and merge roles through the CLI."""
+        base = [
+            sys.executable,
+            "-m",
+            "radio_sim.main",
+            "--queue-dir",
+            str(tmp_path),
+            "--bits",
+            "2048",
+            "--snr-start",
+            "0",
+            "--snr-stop",
+            "10",
+            "--snr-step",
+            "5",
+        ]
+        for role in ("coordinator", "worker", "merge"):
+            result = subprocess.run(
+                base + ["--role", role], capture_output=True, text=True
+            )
+            assert result.returncode == 0, f"{role} failed: {result.stderr}"
+
+        assert "Simulation completed successfully!" in result.stdout
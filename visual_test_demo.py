@@ -7,6 +7,7 @@ This script runs all tests and generates visualizations to demonstrate:
 2. BER vs SNR performance curves
 3. Effect of noise on constellation points
 4. OFDM signal processing visualization
+5. Density constellation and decimated time-domain views of a long run
 """
 
 import numpy as np
@@ -14,6 +15,7 @@ import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 from radio_sim.ofdm import OFDMSimulator, plot_constellation, plot_ber_curve
+from radio_sim.plotting import measure_constellation, plot_eye_diagram, plot_time_domain
 import sys
 
 def demo_constellations():
@@ -212,24 +214,12 @@ def demo_ofdm_processing():
     axes[0,1].grid(True, alpha=0.3)
     axes[0,1].axis('equal')
     
-    # 3. Time-domain OFDM signal (real part)
-    time_indices = range(len(sim_data['ofdm_symbol']))
-    axes[0,2].plot(time_indices, sim_data['ofdm_symbol'].real, 'b-', label='Real')
-    axes[0,2].plot(time_indices, sim_data['ofdm_symbol'].imag, 'r--', alpha=0.7, label='Imaginary')
-    axes[0,2].set_title('Time-Domain OFDM Signal')
-    axes[0,2].set_xlabel('Sample Index')
-    axes[0,2].set_ylabel('Amplitude')
-    axes[0,2].legend()
-    axes[0,2].grid(True, alpha=0.3)
+    # 3. Time-domain OFDM signal
+    plot_time_domain(sim_data['ofdm_symbol'], ax=axes[0,2], title='Time-Domain OFDM Signal')
     
     # 4. Received signal with noise
-    axes[1,0].plot(time_indices, sim_data['rx_signal'].real, 'b-', label='Real')
-    axes[1,0].plot(time_indices, sim_data['rx_signal'].imag, 'r--', alpha=0.7, label='Imaginary')
-    axes[1,0].set_title(f'Received Signal (SNR={sim_data["snr_db"]} dB)')
-    axes[1,0].set_xlabel('Sample Index')
-    axes[1,0].set_ylabel('Amplitude')
-    axes[1,0].legend()
-    axes[1,0].grid(True, alpha=0.3)
+    plot_time_domain(sim_data['rx_signal'], ax=axes[1,0],
+                     title=f'Received Signal (SNR={sim_data["snr_db"]} dB)')
     
     # 5. Received constellation
     rx_symbols_plot = sim_data['rx_symbols'][:len(sim_data['tx_symbols'])]
@@ -272,9 +262,36 @@ def demo_ofdm_processing():
     plt.show()
     print("✅ OFDM processing chain saved as 'ofdm_processing.png'\n")
 
+def demo_long_run():
+    """Demonstrate density plots of a long simulation run."""
+    print("🗺️  DEMO 5: Density Views of a Long Run")
+    print("=" * 50)
+    
+    sim = OFDMSimulator(modulation="16QAM", n_subcarriers=64, seed=42)
+    n_ofdm_symbols = 20000
+    
+    # Received symbols are binned batch by batch and never kept
+    histogram = measure_constellation(sim, n_ofdm_symbols, snr_db=18)
+    print(f"  Symbols accumulated: {histogram.n_symbols:,}")
+    print(f"  Histogram grid: {histogram.bins} x {histogram.bins}")
+    
+    # Time-domain views draw a decimated subset of a long stream
+    data = sim.modulate(sim.generate_bits(1000 * sim.n_subcarriers * sim.bits_per_symbol))
+    rx_signal = sim.add_awgn(sim.generate_ofdm_symbols(data).ravel(), 18)
+    
+    fig, axes = plt.subplots(1, 3, figsize=(20, 6))
+    histogram.plot(ax=axes[0], title='16-QAM at 18 dB', reference=sim.constellation)
+    plot_time_domain(rx_signal, ax=axes[1], title=f'Received Stream ({len(rx_signal):,} samples)')
+    plot_eye_diagram(rx_signal, samples_per_symbol=8, ax=axes[2])
+    
+    plt.tight_layout()
+    plt.savefig('long_run_density.png', dpi=150)
+    plt.close(fig)
+    print("✅ Long-run density views saved as 'long_run_density.png'\n")
+
 def run_unit_tests():
     """Run the unit test suite."""
-    print("🧪 DEMO 5: Running Unit Test Suite")
+    print("🧪 DEMO 6: Running Unit Test Suite")
     print("=" * 50)
     return True
 
@@ -287,7 +304,8 @@ def main():
     print("2. BER vs SNR performance curves")
     print("3. Effect of noise on signal quality")
     print("4. Complete OFDM signal processing chain")
-    print("5. Unit test results")
+    print("5. Density views of a long run")
+    print("6. Unit test results")
     print("=" * 60)
     print()
     
@@ -297,6 +315,7 @@ def main():
         demo_ber_curves()
         demo_noise_effects()
         demo_ofdm_processing()
+        demo_long_run()
         
         print("🎉 ALL VISUAL DEMONSTRATIONS COMPLETED SUCCESSFULLY!")
         print("📁 Generated visualization files:")
@@ -304,6 +323,7 @@ def main():
         print("   - ber_curves.png") 
         print("   - noise_effects.png")
         print("   - ofdm_processing.png")
+        print("   - long_run_density.png")
         print()
         print("🔬 Key Insights:")
         print("   • QPSK: More robust, needs ~10 dB SNR for BER < 1e-5")